@@ -16,9 +16,10 @@ except ImportError:
     from customtkinter import CTk, CTkFrame, CTkButton, CTkEntry, CTkLabel, CTkTextbox, CTkScrollableFrame
     from customtkinter import CTkTabview, CTkComboBox, CTkSwitch, CTkOptionMenu, set_appearance_mode, set_default_color_theme
 
+from file_output import SyncBatch, write_if_changed
 from md_generator import MarkdownGenerator
 from ui_components import ListManager, EnvVarsManager, ImageGallery, TechnologySelector
-from ui_components import TemplateSelector, FileStructureEditor, UsageCodeEditor
+from ui_components import TemplateSelector, FileStructureEditor, UsageCodeEditor, LibraryBrowser
 
 # Common license options
 LICENSE_OPTIONS = [
@@ -46,6 +47,10 @@ class MDCreatorApp(CTk):
         # Setup variables
         self.markdown_generator = MarkdownGenerator()
         
+        # Project library, opened on first use; library_name is the current project's entry
+        self.library = None
+        self.library_name = ""
+        
         # Create UI
         self.create_ui()
         
@@ -113,6 +118,15 @@ class MDCreatorApp(CTk):
         # Section title
         CTkLabel(content_frame, text="Project Information", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 15))
         
+        # Fill the name and username from a local checkout's git remote
+        CTkButton(
+            content_frame,
+            text="Fill from Repository...",
+            command=self.fill_from_repository,
+            width=180,
+            height=30
+        ).pack(anchor="w", pady=(0, 10))
+        
         # Project name
         CTkLabel(content_frame, text="Project Name:").pack(anchor="w", pady=(5, 0))
         self.project_name_var = tk.StringVar()
@@ -159,6 +173,40 @@ class MDCreatorApp(CTk):
         )
         update_btn.pack(anchor="e", pady=10)
         
+    def fill_from_repository(self):
+        """Set the project name and username from a checkout's .git directory, and its contributors and releases"""
+        import subprocess
+        from tkinter import filedialog
+        from git_history import read_history
+        from git_meta import prefill_generator, read_metadata
+        
+        directory = filedialog.askdirectory(title="Select Project Repository")
+        if not directory:
+            self.status_var.set("Fill cancelled")
+            return
+        
+        meta = read_metadata(directory)
+        if meta is None:
+            messagebox.showerror("Error", f"{directory} is not a git repository")
+            self.status_var.set("Not a git repository")
+            return
+        
+        prefill_generator(self.markdown_generator, meta, overwrite=True)
+        self.project_name_var.set(self.markdown_generator.get_field("project_name"))
+        self.username_var.set(self.markdown_generator.get_field("username"))
+        
+        # The history needs git itself; without it only the basic fields are filled
+        self.status_var.set("Reading history...")
+        self.update_idletasks()
+        try:
+            history = read_history(directory)
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.status_var.set(f"Filled from {meta.url or meta.project_name} (history not read: {str(e)})")
+            return
+        self.update_field("contributors", history.contributors)
+        self.update_field("releases", history.releases)
+        self.status_var.set(f"Filled from {meta.url or meta.project_name}: {history.commits} commits, {len(history.releases)} releases")
+        
     def setup_features_tab(self):
         tab = self.tabview.tab("Features")
         
@@ -341,6 +389,15 @@ class MDCreatorApp(CTk):
         # Instructions
         CTkLabel(content_frame, text="Click on technologies to add them to your project. Add custom ones below.").pack(anchor="w", pady=(0, 10))
         
+        # Detect from the manifest files of a local repository; also fills the languages section
+        CTkButton(
+            content_frame,
+            text="Detect from Repository...",
+            command=self.detect_technologies,
+            width=180,
+            height=30
+        ).pack(anchor="w", pady=(0, 10))
+        
         # Create the technology selector
         self.tech_selector = TechnologySelector(
             content_frame,
@@ -349,6 +406,37 @@ class MDCreatorApp(CTk):
         )
         self.tech_selector.pack(fill="both", expand=True)
     
+    def detect_technologies(self):
+        """Add the technologies and prerequisites found in a repository's manifest files and count its languages"""
+        from tkinter import filedialog
+        from lang_stats import field_value, language_stats
+        from tech_detect import detect, merge
+        
+        directory = filedialog.askdirectory(title="Select Project Repository")
+        if not directory:
+            self.status_var.set("Detection cancelled")
+            return
+        
+        self.status_var.set("Detecting technologies...")
+        self.update_idletasks()
+        try:
+            found = detect(directory)
+            stats = language_stats(directory)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to scan repository: {str(e)}")
+            self.status_var.set(f"Error detecting technologies: {str(e)}")
+            return
+        
+        tech = merge(self.markdown_generator.get_field("tech") or [], found.tech)
+        prerequisites = merge(self.markdown_generator.get_field("Prerequisites") or [], found.prerequisites)
+        self.update_field("tech", tech)
+        self.update_field("Prerequisites", prerequisites)
+        self.tech_selector.set_items(tech)
+        self.prerequisites_manager.set_items(prerequisites)
+        # The languages section is replaced, as it describes the repository as it is now
+        self.update_field("languages", field_value(stats.bytes))
+        self.status_var.set(f"Detected {len(found.tech)} technologies in {len(found.manifests)} manifest files and {len(stats.bytes)} languages")
+    
     def setup_template_tab(self):
         tab = self.tabview.tab("Template")
         
@@ -486,6 +574,26 @@ class MDCreatorApp(CTk):
             height=40
         ).pack(side="right", padx=5)
         
+        CTkButton(
+            right_frame, 
+            text="Open Library", 
+            command=self.open_library,
+            fg_color="#3498db",
+            hover_color="#2980b9",
+            width=120,
+            height=40
+        ).pack(side="right", padx=5)
+        
+        CTkButton(
+            right_frame, 
+            text="Save to Library", 
+            command=self.save_to_library,
+            fg_color="#2ecc71",
+            hover_color="#27ae60",
+            width=120,
+            height=40
+        ).pack(side="right", padx=5)
+        
         CTkButton(
             right_frame, 
             text="Copy to Clipboard", 
@@ -509,6 +617,7 @@ class MDCreatorApp(CTk):
         if messagebox.askyesno("New Project", "Are you sure you want to start a new project? All unsaved changes will be lost."):
             # Reset markdown generator
             self.markdown_generator.reset()
+            self.library_name = ""
             
             # Reset form fields
             self.reset_form()
@@ -562,16 +671,77 @@ class MDCreatorApp(CTk):
         
         if file_path:
             try:
+                data = self.markdown_generator.get_data()
                 with open(file_path, "w", encoding="utf-8") as file:
-                    json.dump(self.markdown_generator.get_data(), file, indent=2)
+                    json.dump(data, file, indent=2)
                 messagebox.showinfo("Success", f"Template saved to {file_path}")
                 self.status_var.set(f"Template saved to {os.path.basename(file_path)}")
+                self.index_saved_project(file_path, data)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save template: {str(e)}")
                 self.status_var.set(f"Error saving template: {str(e)}")
         else:
             self.status_var.set("Template save cancelled")
                 
+    def index_saved_project(self, file_path, data):
+        """Add a project saved to a file to the library, under the file's absolute path"""
+        # The path, unlike the file name, cannot clash with another project's entry
+        name = os.path.abspath(file_path)
+        try:
+            self.get_library().save(name, data)
+            self.status_var.set(f"Template saved and added to the library as {name}")
+        except Exception as e:
+            # The file is saved; only the library copy is missing
+            messagebox.showerror("Error", f"Template saved, but not added to the library: {str(e)}")
+            self.status_var.set(f"Error adding template to the library: {str(e)}")
+    
+    def get_library(self):
+        """The project library, opened on first use"""
+        if self.library is None:
+            from project_library import ProjectLibrary
+            self.library = ProjectLibrary()
+        return self.library
+    
+    def save_to_library(self):
+        """Save the current project to the project library under a name"""
+        from tkinter import simpledialog
+        
+        default_name = self.library_name or self.markdown_generator.get_field("project_name").strip()
+        name = simpledialog.askstring("Save to Library", "Library name:", initialvalue=default_name, parent=self)
+        if not name or not name.strip():
+            self.status_var.set("Library save cancelled")
+            return
+        
+        try:
+            self.get_library().save(name, self.markdown_generator.get_data())
+            self.library_name = name.strip()
+            self.status_var.set(f"Saved {self.library_name} to the library")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save to library: {str(e)}")
+            self.status_var.set(f"Error saving to library: {str(e)}")
+    
+    def open_library(self):
+        """Browse the project library and open a project from it"""
+        try:
+            library = self.get_library()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open library: {str(e)}")
+            return
+        LibraryBrowser(self, library, self.load_from_library, templates=MarkdownGenerator.TEMPLATES)
+    
+    def load_from_library(self, name):
+        """Load a project from the library into the form"""
+        try:
+            data = self.get_library().load(name)
+            self.markdown_generator.set_data(data)
+            self.reset_form()
+            self.populate_form()
+            self.library_name = name
+            self.status_var.set(f"Opened {name} from the library")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {name}: {str(e)}")
+            self.status_var.set(f"Error opening from library: {str(e)}")
+    
     def load_template(self):
         """Load a project from a template"""
         from tkinter import filedialog
@@ -591,6 +761,7 @@ class MDCreatorApp(CTk):
                 
                 # Update markdown generator
                 self.markdown_generator.set_data(data)
+                self.library_name = ""
                 
                 # Reset and populate form
                 self.reset_form()
@@ -653,9 +824,6 @@ class MDCreatorApp(CTk):
         self.update_idletasks()
         
         try:
-            # Generate markdown from current data
-            markdown_content = self.markdown_generator.generate_markdown()
-            
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".md",
                 filetypes=[("Markdown Files", "*.md"), ("All Files", "*.*")],
@@ -664,10 +832,16 @@ class MDCreatorApp(CTk):
             
             if file_path:
                 try:
-                    with open(file_path, "w", encoding="utf-8") as file:
-                        file.write(markdown_content)
-                    messagebox.showinfo("Success", f"Markdown saved to {file_path}")
-                    self.status_var.set(f"Markdown saved to {os.path.basename(file_path)}")
+                    # Stream sections into a temporary file that is fsynced and then replaces the
+                    # target atomically; an identical existing file is left untouched
+                    if write_if_changed(file_path, self.markdown_generator.generate_markdown_iter(), durable=True):
+                        sync = SyncBatch()
+                        sync.add(file_path)
+                        sync.flush()
+                        messagebox.showinfo("Success", f"Markdown saved to {file_path}")
+                        self.status_var.set(f"Markdown saved to {os.path.basename(file_path)}")
+                    else:
+                        self.status_var.set(f"{os.path.basename(file_path)} is already up to date")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to save file: {str(e)}")
                     self.status_var.set(f"Error saving markdown: {str(e)}")
@@ -680,11 +854,10 @@ class MDCreatorApp(CTk):
     def copy_to_clipboard(self):
         """Copy markdown content to clipboard"""
         try:
-            # Generate markdown from current data
-            markdown_content = self.markdown_generator.generate_markdown()
-            
+            # Append section by section so only the clipboard holds the full text
             self.clipboard_clear()
-            self.clipboard_append(markdown_content)
+            for chunk in self.markdown_generator.generate_markdown_iter():
+                self.clipboard_append(chunk)
             self.status_var.set("Markdown copied to clipboard")
             messagebox.showinfo("Success", "Markdown copied to clipboard")
         except Exception as e:
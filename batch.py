@@ -0,0 +1,276 @@
+"""
+Headless batch rendering of saved project templates into README files.
+"""
+
+import glob
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+from file_output import write_if_changed
+from md_generator import MarkdownGenerator
+
+# Outcome of rendering a single project file; sections holds SectionStats when profiling,
+# cached tells whether the render cache was hit (None when no cache is used) and
+# written is False when the output already had the same content
+RenderResult = namedtuple(
+    "RenderResult",
+    ["source", "output", "seconds", "size", "error", "sections", "cached", "written"],
+    defaults=[None, None, None]
+)
+
+# Glob wildcard characters
+_MAGIC = re.compile(r"[*?[]")
+
+# Render caches opened by this process, by (directory, max_bytes)
+_caches = {}
+
+
+def glob_root(pattern):
+    """The directory part of a glob pattern before its first wildcard"""
+    root = pattern
+    while _MAGIC.search(root):
+        root = os.path.dirname(root)
+    return root or "."
+
+
+def input_roots(sources, recursive=False):
+    """Expand files, directories and glob patterns into {JSON file: root it was found under}.
+
+    The root is the directory given, the part of a glob pattern before its
+    first wildcard, or the directory of a file given by name; a file found
+    through several sources keeps the first root.
+    """
+    found = {}
+    for source in sources:
+        if os.path.isdir(source):
+            pattern = os.path.join(source, "**", "*.json") if recursive else os.path.join(source, "*.json")
+            paths, root = glob.glob(pattern, recursive=recursive), source
+        elif os.path.isfile(source):
+            paths, root = [source], os.path.dirname(source) or "."
+        else:
+            paths = [path for path in glob.glob(source, recursive=True) if os.path.isfile(path)]
+            root = glob_root(source)
+        for path in paths:
+            found.setdefault(path, root)
+    return found
+
+
+def collect_inputs(sources, recursive=False):
+    """Expand files, directories and glob patterns into a sorted list of JSON files"""
+    return sorted(input_roots(sources, recursive))
+
+
+def output_path_for(source, output_dir=None, root=None):
+    """Return the README path for a project file (next to it unless output_dir is given).
+
+    With output_dir and the root the file was found under, its directory
+    relative to the root is kept, so a/project.json and b/project.json do
+    not both become output_dir/project.md.
+    """
+    stem = os.path.splitext(os.path.basename(source))[0]
+    if not output_dir:
+        return os.path.join(os.path.dirname(source), f"{stem}.md")
+    directory = output_dir
+    if root is not None:
+        try:
+            relative = os.path.relpath(os.path.dirname(source) or ".", root)
+        except ValueError:
+            # On another drive than the root
+            relative = os.curdir
+        if relative != os.curdir and relative.split(os.sep)[0] != os.pardir:
+            directory = os.path.join(output_dir, relative)
+    return os.path.join(directory, f"{stem}.md")
+
+
+def claim_outputs(sources, output_dir=None, roots=None):
+    """Return ({source: README path}, {source: error}); roots is {source: root} from input_roots().
+
+    A source whose README an earlier source already claimed gets an error.
+    """
+    outputs, conflicts = {}, {}
+    claimed = {}
+    for source in sources:
+        output = outputs[source] = output_path_for(source, output_dir, roots.get(source) if roots else None)
+        key = os.path.normcase(os.path.abspath(output))
+        if key in claimed:
+            conflicts[source] = f"{claimed[key]} and {source} would both be written to {output}"
+        else:
+            claimed[key] = source
+    return outputs, conflicts
+
+
+def output_paths(sources, output_dir=None, roots=None):
+    """Return the README path of every source, in order; roots is {source: root} from input_roots().
+
+    Raises ValueError when two sources would be written to the same README.
+    """
+    outputs, conflicts = claim_outputs(sources, output_dir, roots)
+    if conflicts:
+        raise ValueError(next(iter(conflicts.values())))
+    return [outputs[source] for source in sources]
+
+
+def load_project(data, template=None):
+    """Create a generator for a project dictionary, optionally forcing a template"""
+    generator = MarkdownGenerator()
+    generator.set_data(data)
+    if template:
+        generator.update_field("template", template)
+    return generator
+
+
+def render_project(data, template=None):
+    """Render a project dictionary to markdown, optionally forcing a template"""
+    return load_project(data, template).generate_markdown()
+
+
+def open_cache(directory, max_bytes):
+    """Return this process's RenderCache for a directory"""
+    cache = _caches.get((directory, max_bytes))
+    if cache is None:
+        from render_cache import RenderCache
+
+        cache = _caches[(directory, max_bytes)] = RenderCache(directory, max_bytes)
+    return cache
+
+
+def render_file(source, output, template=None, profile=False, cache=None, only_changed=False, durable=False):
+    """Render one project file; errors are reported in the result instead of raised.
+
+    cache is an optional (directory, max_bytes) pair naming a render cache;
+    with profile as well, the renders that miss the cache are profiled.
+    With only_changed, an output that already holds the same README is left untouched;
+    durable fsyncs a new README before it replaces the old one.
+    """
+    start = time.perf_counter()
+    try:
+        with open(source, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError("project file must contain a JSON object")
+
+        generator = load_project(data, template)
+
+        sections = None
+        cached = None
+        if profile:
+            with generator.instrument() as sections:
+                if cache:
+                    # Only a miss renders, so hits add nothing to the profile
+                    markdown_content, cached = open_cache(*cache).render(generator)
+                else:
+                    markdown_content = generator.generate_markdown()
+        elif cache:
+            markdown_content, cached = open_cache(*cache).render(generator)
+        else:
+            markdown_content = generator.generate_markdown()
+
+        written = write_if_changed(output, markdown_content, force=not only_changed, durable=durable)
+        return RenderResult(
+            source, output, time.perf_counter() - start, len(markdown_content), None, sections, cached, written
+        )
+    except Exception as e:
+        return RenderResult(source, output, time.perf_counter() - start, 0, f"{type(e).__name__}: {e}")
+
+
+def _render_job(job):
+    """Unpack a (source, output, template, profile, cache, only_changed, durable) job for the process pool"""
+    return render_file(*job)
+
+
+def map_jobs(function, jobs, workers=None, chunksize=16):
+    """Yield function(job) for every job, in order, on a pool of worker processes"""
+    # A single worker skips the pool entirely, which is faster for small batches
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield function(job)
+        return
+
+    # Imported lazily: the process pool machinery dominates start-up time
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(function, jobs, chunksize=chunksize)
+
+
+def run_batch(sources, output_dir=None, template=None, workers=None, chunksize=16, profile=False, cache=None,
+              only_changed=False, roots=None, durable=False):
+    """Render every source file; returns an iterator of RenderResult per file in input order.
+
+    roots ({source: root}, from input_roots()) keeps the inputs' directory
+    layout under output_dir. Raises ValueError, before anything is rendered,
+    when two sources would be written to the same README.
+    """
+    outputs = output_paths(sources, output_dir, roots)
+    if output_dir:
+        for directory in set(map(os.path.dirname, outputs)):
+            os.makedirs(directory, exist_ok=True)
+
+    jobs = [
+        (source, output, template, profile, cache, only_changed, durable)
+        for source, output in zip(sources, outputs)
+    ]
+    return map_jobs(_render_job, jobs, workers, chunksize)
+
+
+class BatchSummary:
+    """Accumulates timing and throughput figures for a batch run"""
+
+    def __init__(self):
+        self.ok = 0
+        self.failed = 0
+        self.bytes = 0
+        self.render_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.unchanged = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def add(self, result):
+        """Record a single result"""
+        self.render_seconds += result.seconds
+        if result.cached is not None:
+            if result.cached:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        if result.error:
+            self.failed += 1
+        else:
+            self.ok += 1
+            self.bytes += result.size
+            if result.written is False:
+                self.unchanged += 1
+
+    def finish(self):
+        """Stop the wall clock"""
+        self.finished = time.perf_counter()
+
+    @property
+    def total(self):
+        return self.ok + self.failed
+
+    @property
+    def wall_seconds(self):
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def format(self, unit="files"):
+        """Return a one-line human readable summary"""
+        wall = self.wall_seconds
+        rate = self.total / wall if wall > 0 else 0.0
+        mb_rate = self.bytes / wall / (1024 * 1024) if wall > 0 else 0.0
+        line = (
+            f"{self.total} {unit} ({self.ok} ok, {self.failed} failed) in {wall:.2f}s - "
+            f"{rate:.1f} {unit}/s, {mb_rate:.2f} MiB/s, "
+            f"{self.render_seconds * 1000:.1f} ms total render time"
+        )
+        if self.unchanged:
+            line += f", {self.unchanged} unchanged"
+        if self.cache_hits or self.cache_misses:
+            line += f", {self.cache_hits} cache hits, {self.cache_misses} misses"
+        return line
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+MD File Creator - benchmark suite
+Measures MarkdownGenerator.generate_markdown for every template over synthetic
+projects of increasing size and compares the results against a stored baseline.
+--check-search times full-text searches of a synthetic project library instead.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from md_generator import MarkdownGenerator
+from md_templates import get_plan
+from project_library import ProjectLibrary
+
+# Synthetic project sizes: list lengths and file_structure line counts
+SIZES = {
+    "tiny": {"features": 3, "envvars": 2, "tech": 3, "structure_lines": 10, "usage_lines": 10},
+    "small": {"features": 20, "envvars": 10, "tech": 10, "structure_lines": 100, "usage_lines": 50},
+    "medium": {"features": 500, "envvars": 250, "tech": 100, "structure_lines": 5000, "usage_lines": 500},
+    "large": {"features": 10000, "envvars": 5000, "tech": 1000, "structure_lines": 60000, "usage_lines": 5000},
+}
+
+# Words used to build synthetic text
+WORDS = (
+    "fast", "simple", "secure", "render", "markdown", "project", "config", "plugin", "cache",
+    "stream", "module", "server", "client", "docs", "build", "test", "deploy", "theme"
+)
+
+TECHNOLOGIES = ("Python", "JavaScript", "Docker", "React", "Go", "Rust", "Postgres", "Redis")
+
+# List fields exercised by the scaling check
+LIST_FIELDS = ("features", "Prerequisites", "envvars", "tech", "languages")
+
+# Languages under 0.1% of the total are folded into "Other", so the scaling check
+# never gives more than this many: past it, extra items would not be rendered
+MAX_ITEMS = {"languages": 800}
+
+# The search check's library size and the time every query must be answered in
+SEARCH_PROJECTS = 50000
+SEARCH_BUDGET_MS = 100.0
+
+# Queries of the search check, with their filters: words in a few projects, in shared usage
+# examples, in nearly every project, prefixes, and filters that leave few or many projects
+SEARCH_QUERIES = (
+    ("topic7", {}),
+    ("redis", {}),
+    ("redis worker", {}),
+    ("render", {}),
+    ("fast simple render", {}),
+    ("dep*", {}),
+    ("redis", {"fields": ["usage_code"]}),
+    ("cache", {"username": "user7"}),
+    ("deploy", {"tech": "Docker"}),
+)
+
+# glibc hands big strings to fresh mmap chunks and gives them back on free, so
+# every large render pays page faults that small renders never see. Pinning the
+# thresholds keeps that step out of the scaling check.
+SCALING_MALLOC_ENV = {"MALLOC_MMAP_THRESHOLD_": "1073741824", "MALLOC_TRIM_THRESHOLD_": "2147483647"}
+
+
+def make_project(size, seed=0):
+    """Build a deterministic synthetic project dictionary of the given size"""
+    spec = SIZES[size]
+    rng = random.Random(seed)
+
+    def phrase(count):
+        return " ".join(rng.choice(WORDS) for _ in range(count))
+
+    structure = ["project-name/"]
+    for i in range(spec["structure_lines"]):
+        depth = i % 4
+        structure.append(f"{'│   ' * depth}├── {phrase(2).replace(' ', '_')}_{i}.py    # {phrase(4)}")
+
+    return {
+        "project_name": f"bench-{size}",
+        "username": "benchmark",
+        "concisedesc": phrase(12),
+        "overview": phrase(120),
+        "features": [f"{phrase(3).title()} - {phrase(10)}" for _ in range(spec["features"])],
+        "logo": "images/logo.png",
+        "DemoGif": "images/demo.gif",
+        "screenshot1": "images/screenshot1.png",
+        "screenshot2": "images/screenshot2.png",
+        "Prerequisites": [phrase(2) for _ in range(max(1, spec["features"] // 10))],
+        "envvars": [
+            {"name": f"{rng.choice(WORDS).upper()}_{i}", "desc": phrase(6), "value": str(rng.randint(0, 9999))}
+            for i in range(spec["envvars"])
+        ],
+        "tech": [f"{rng.choice(TECHNOLOGIES)}{i}" for i in range(spec["tech"])],
+        "license": "MIT",
+        "contact": "bench@example.com",
+        "file_structure": "\n".join(structure),
+        "usage_code": "\n".join(f"run('{phrase(3)}', {i})" for i in range(spec["usage_lines"])),
+    }
+
+
+def library_project(index, rng, usages, structures):
+    """A small library project; usage examples and file structures are shared like in real libraries"""
+
+    def phrase(count):
+        return " ".join(rng.choice(WORDS) for _ in range(count))
+
+    return {
+        "project_name": f"project-{index}",
+        "username": f"user{index % 500}",
+        "overview": f"{phrase(40)} topic{index % 2000}" + (" worker" if index % 50 == 0 else ""),
+        "features": [phrase(6) for _ in range(5)],
+        "Prerequisites": [phrase(2) for _ in range(3)],
+        "tech": rng.sample(TECHNOLOGIES, 2),
+        "usage_code": usages[index % len(usages)],
+        "file_structure": structures[index % len(structures)],
+    }
+
+
+def fill_library(library, count, seed=0):
+    """Save count synthetic projects into a library, a thousand per transaction"""
+    rng = random.Random(seed)
+    usages = [
+        "\n".join(f"run('{' '.join(rng.choice(WORDS) for _ in range(3))}', {i})" for i in range(100)) +
+        ("\nclient = redis.Redis()" if k % 10 == 0 else "")
+        for k in range(500)
+    ]
+    structures = [
+        "\n".join(f"├── {rng.choice(WORDS)}/{rng.choice(WORDS)}_{i}.py" for i in range(60))
+        for _ in range(300)
+    ]
+    for start in range(0, count, 1000):
+        library.save_many(
+            (f"project-{index}", library_project(index, rng, usages, structures))
+            for index in range(start, min(count, start + 1000))
+        )
+
+
+def check_search(library, queries=SEARCH_QUERIES, repeat=5, budget_ms=SEARCH_BUDGET_MS):
+    """Time every query; returns (rows, failures) where failures lists those slower than budget_ms.
+
+    The median of several searches is compared, so a single hiccup does not
+    fail the check but a slow query always does.
+    """
+    rows, failures = [], []
+    for text, filters in queries:
+        hits = len(library.search(text, **filters))
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            library.search(text, **filters)
+            times.append((time.perf_counter() - start) * 1000)
+        case = text + "".join(f" {key}={value}" for key, value in filters.items())
+        median = statistics.median(times)
+        rows.append((case, hits, median))
+        if median > budget_ms:
+            failures.append(f"{case}: {median:.1f} ms")
+    return rows, failures
+
+
+def new_generator(data, template):
+    """A fresh generator, so every measured render starts without cached sections"""
+    generator = MarkdownGenerator()
+    generator.set_data(data)
+    generator.update_field("template", template)
+    return generator
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def measure(data, template, min_time=0.2, min_runs=5, max_runs=100000):
+    """Time generate_markdown repeatedly and measure the peak memory of one render"""
+    # Warm up once; this also gives the output size
+    output_size = len(new_generator(data, template).generate_markdown())
+
+    latencies = []
+    spent = 0.0
+    while (spent < min_time or len(latencies) < min_runs) and len(latencies) < max_runs:
+        generator = new_generator(data, template)
+        start = time.perf_counter()
+        generator.generate_markdown()
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        spent += elapsed
+
+    # Memory is traced separately: tracemalloc slows every allocation down
+    generator = new_generator(data, template)
+    tracemalloc.start()
+    try:
+        generator.generate_markdown()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "runs": len(latencies),
+        "ops_per_sec": len(latencies) / spent if spent > 0 else 0.0,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "peak_kib": peak / 1024,
+        "output_kib": output_size / 1024,
+    }
+
+
+def run_suite(sizes, templates, min_time):
+    """Benchmark every (size, template) pair; returns {"size/template": result}"""
+    results = {}
+    for size in sizes:
+        data = make_project(size)
+        for template in templates:
+            results[f"{size}/{template}"] = measure(data, template, min_time=min_time)
+    return results
+
+
+def list_items(field, count):
+    """Build count synthetic items for one list field"""
+    if field == "envvars":
+        return [{"name": f"VAR_{i}", "desc": f"Setting number {i}", "value": str(i)} for i in range(count)]
+    if field == "tech":
+        return [f"{TECHNOLOGIES[i % len(TECHNOLOGIES)]}{i}" for i in range(count)]
+    if field == "languages":
+        # Equal sizes, so every language gets its own row
+        return [{"name": f"Language {i}", "bytes": 1000} for i in range(count)]
+    return [f"{field} item {i} with a short description" for i in range(count)]
+
+
+def growth_exponent(sizes, values):
+    """Median growth exponent between consecutive sizes: 1.0 is linear, 2.0 quadratic.
+
+    The median ignores a single step in the curve, such as the allocator
+    switching to mmap once strings get big, which is not super-linear growth.
+    """
+    exponents = sorted(
+        math.log(max(after, 1e-12) / max(before, 1e-12)) / math.log(next_size / size)
+        for size, next_size, before, after in zip(sizes, sizes[1:], values, values[1:])
+    )
+    return statistics.median(exponents)
+
+
+def best_time(data, template, repeat):
+    """Fastest of several renders, which filters out scheduler noise"""
+    best = None
+    for _ in range(repeat):
+        generator = new_generator(data, template)
+        start = time.perf_counter()
+        generator.generate_markdown()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(data, template):
+    """Peak traced memory of a single render"""
+    generator = new_generator(data, template)
+    tracemalloc.start()
+    try:
+        generator.generate_markdown()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def rendered_fields(template):
+    """The scaling check's list fields that some section of the template reads"""
+    read = {field for section in get_plan(template).sections for field in section.fields}
+    return [field for field in LIST_FIELDS if field in read]
+
+
+def scaling_sizes(field, base_size):
+    """N, 2N, 4N and 8N items for a field, with N lowered so 8N stays within MAX_ITEMS"""
+    if field in MAX_ITEMS:
+        base_size = max(1, min(base_size, MAX_ITEMS[field] // 8))
+    return [base_size * factor for factor in (1, 2, 4, 8)]
+
+
+def check_scaling(templates, base_size=1000, repeat=7, max_exponent=1.6):
+    """Render every template with N, 2N, 4N and 8N items in each list field it renders.
+
+    Returns (rows, failures) where failures lists every case whose time or
+    memory grows faster than size ** max_exponent. Fields a template does not
+    render are left out, since their cost cannot grow with their size.
+    """
+    rows, failures = [], []
+    for template in templates:
+        for field in rendered_fields(template):
+            sizes = scaling_sizes(field, base_size)
+            times, peaks = [], []
+            for size in sizes:
+                data = make_project("tiny")
+                data[field] = list_items(field, size)
+                times.append(best_time(data, template, repeat))
+                peaks.append(peak_memory(data, template))
+
+            time_exponent = growth_exponent(sizes, times)
+            memory_exponent = growth_exponent(sizes, peaks)
+            case = f"{template}/{field}"
+            rows.append((case, times, time_exponent, memory_exponent))
+            if time_exponent > max_exponent:
+                failures.append(f"{case}: time grows as N^{time_exponent:.2f}")
+            if memory_exponent > max_exponent:
+                failures.append(f"{case}: memory grows as N^{memory_exponent:.2f}")
+    return rows, failures
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages for cases slower or bigger than the baseline allows"""
+    regressions = []
+    for case, result in results.items():
+        reference = baseline.get(case)
+        if not reference:
+            continue
+        for metric in ("p50_us", "peak_kib"):
+            limit = reference[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{case}: {metric} {result[metric]:.1f} > {reference[metric]:.1f} ({tolerance:.0%} allowed)"
+                )
+    return regressions
+
+
+def print_table(results, baseline=None):
+    """Print one line per benchmark case"""
+    print(f"{'case':<22} {'ops/s':>10} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10} {'out KiB':>10} {'vs base':>8}")
+    for case, result in results.items():
+        change = ""
+        if baseline and case in baseline:
+            change = f"{result['p50_us'] / baseline[case]['p50_us']:.2f}x"
+        print(
+            f"{case:<22} {result['ops_per_sec']:>10.1f} {result['p50_us']:>10.1f} {result['p99_us']:>10.1f} "
+            f"{result['peak_kib']:>10.1f} {result['output_kib']:>10.1f} {change:>8}"
+        )
+
+
+def build_parser():
+    """Create the argument parser"""
+    parser = argparse.ArgumentParser(
+        prog="bench.py",
+        description="Benchmark README generation for every template over synthetic projects."
+    )
+    parser.add_argument("-s", "--sizes", nargs="+", choices=list(SIZES), default=list(SIZES), help="project sizes to run (default: all)")
+    parser.add_argument("-t", "--templates", nargs="+", choices=MarkdownGenerator.TEMPLATES, default=MarkdownGenerator.TEMPLATES, help="templates to run (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum measured seconds per case (default: 0.2)")
+    parser.add_argument("--baseline", help="JSON file from --save-baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown or memory growth over the baseline (default: 0.25)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results to PATH as a new baseline")
+    parser.add_argument("--check-scaling", action="store_true", help="check that every list field renders in linear time and memory, then exit")
+    parser.add_argument("--scaling-size", type=int, default=1000, help="smallest list length N for --check-scaling (default: 1000)")
+    parser.add_argument("--max-exponent", type=float, default=1.6, help="largest allowed growth exponent for --check-scaling (default: 1.6)")
+    parser.add_argument("--check-search", action="store_true", help="check that library searches finish within the budget, then exit")
+    parser.add_argument("--search-projects", type=int, default=SEARCH_PROJECTS, help=f"projects in the library for --check-search (default: {SEARCH_PROJECTS})")
+    parser.add_argument("--search-library", metavar="PATH", help="library for --check-search, filled first if empty so later runs can reuse it (default: a temporary one)")
+    parser.add_argument("--search-budget", type=float, default=SEARCH_BUDGET_MS, help=f"milliseconds every search may take (default: {SEARCH_BUDGET_MS:g})")
+    return parser
+
+
+def run_scaling_check(args, argv):
+    """Print the growth exponents per template and list field; non-zero exit on super-linear growth"""
+    if sys.platform.startswith("linux") and not all(name in os.environ for name in SCALING_MALLOC_ENV):
+        # Re-run in a child with the allocator thresholds pinned
+        env = dict(os.environ, **SCALING_MALLOC_ENV)
+        return subprocess.run([sys.executable, os.path.abspath(__file__), *argv], env=env).returncode
+
+    rows, failures = check_scaling(args.templates, base_size=args.scaling_size, max_exponent=args.max_exponent)
+
+    factors = "  ".join(f"{f'{factor}N ms':>9}" for factor in (1, 2, 4, 8))
+    print(f"{'case':<26} {factors} {'time exp':>9} {'mem exp':>9}")
+    for case, times, time_exponent, memory_exponent in rows:
+        timings = "  ".join(f"{seconds * 1000:>9.3f}" for seconds in times)
+        print(f"{case:<26} {timings} {time_exponent:>9.2f} {memory_exponent:>9.2f}")
+
+    if failures:
+        for message in failures:
+            print(f"SUPER-LINEAR {message}", file=sys.stderr)
+        return 1
+    print(f"All list fields scale linearly (exponent <= {args.max_exponent})")
+    return 0
+
+
+def run_search_check(args):
+    """Print the median time of every search; non-zero exit if one is over budget"""
+    with tempfile.TemporaryDirectory() as directory:
+        library = ProjectLibrary(args.search_library or os.path.join(directory, "library.db"))
+        try:
+            if not library.count():
+                start = time.perf_counter()
+                fill_library(library, args.search_projects)
+                print(f"Built a library of {args.search_projects} projects in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+            projects = library.count()
+            rows, failures = check_search(library, budget_ms=args.search_budget)
+        finally:
+            library.close()
+
+    print(f"{'query':<34} {'hits':>6} {'median ms':>10}")
+    for case, hits, median in rows:
+        print(f"{case:<34} {hits:>6} {median:>10.1f}")
+
+    if failures:
+        for message in failures:
+            print(f"SLOW {message} > {args.search_budget:g} ms", file=sys.stderr)
+        return 1
+    print(f"All searches of {projects} projects took under {args.search_budget:g} ms")
+    return 0
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    args = build_parser().parse_args(argv)
+
+    if args.check_scaling:
+        return run_scaling_check(args, argv)
+    if args.check_search:
+        return run_search_check(args)
+
+    results = run_suite(args.sizes, args.templates, args.min_time)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, file, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            for message in regressions:
+                print(f"REGRESSION {message}", file=sys.stderr)
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Field edits applied to many saved projects at once.
+
+A Patch sets fields, replaces text and adds or removes list items, optionally
+only in projects whose current values match. Project files are patched in
+parallel worker processes and replaced atomically, and a file is only
+rewritten when a field actually changed; keys that were not edited are
+written back as they were. Library projects are patched in a single
+transaction, so either every matching project is changed or none is. A dry
+run computes the same edits, with a unified diff of every edited field,
+without writing anything, and the README of every changed project can be
+rendered in the same run.
+"""
+
+import difflib
+import json
+import os
+import re
+import time
+from collections import deque, namedtuple
+
+from batch import map_jobs, output_paths, render_project
+from file_output import write_if_changed
+from project_model import FIELDS, LIST_FIELDS, RECORDS, TEXT_FIELDS, ProjectData
+from stream import slugify
+
+# Outcome of patching one project file or library project: the fields edited, their diff
+# when asked for, and the README written, if any
+PatchResult = namedtuple("PatchResult", ["source", "changed", "diff", "output", "error", "seconds"])
+
+
+def parse_assignment(text):
+    """Split FIELD=VALUE into (field, value); raises ValueError for an unknown field"""
+    field, equals, value = text.partition("=")
+    field = field.strip()
+    if not equals:
+        raise ValueError(f"expected FIELD=VALUE, got {text!r}")
+    if field not in FIELDS:
+        raise ValueError(f"unknown field: {field}")
+    return field, value
+
+
+def _decode(field, value):
+    """A --set value in the saved template format: list fields take JSON"""
+    if field in LIST_FIELDS or field in RECORDS:
+        try:
+            return json.loads(value)
+        except ValueError:
+            raise ValueError(f"{field} takes a JSON list, got {value!r}") from None
+    return value
+
+
+def _replace_strings(value, replace):
+    """Apply replace to every string inside a field value, including list items and record values"""
+    if isinstance(value, str):
+        return replace(value)
+    if isinstance(value, list):
+        return [_replace_strings(item, replace) for item in value]
+    if isinstance(value, dict):
+        return {key: _replace_strings(item, replace) for key, item in value.items()}
+    return value
+
+
+class Patch:
+    """Edits of a project dictionary, applied in order: sets, replacements, additions, removals.
+
+    sets and where map fields to values; replacements are (old, new) pairs,
+    matched literally unless regex is True, in the fields given, which must
+    be named explicitly; additions and removals are (list field, item)
+    pairs. A project is only edited when every where condition holds: a text
+    field equals the value, a list field contains it.
+    """
+
+    def __init__(self, sets=None, replacements=(), fields=None, regex=False, additions=(), removals=(), where=None):
+        self.sets = {field: _decode(field, value) for field, value in (sets or {}).items()}
+        self.where = dict(where or {})
+        self.fields = tuple(fields or ())
+        self.additions = list(additions)
+        self.removals = list(removals)
+        try:
+            self.replacements = [
+                (re.compile(old if regex else re.escape(old)), new if regex else new.replace("\\", "\\\\"))
+                for old, new in replacements
+            ]
+        except re.error as e:
+            raise ValueError(f"invalid pattern: {e}") from None
+
+        for field in list(self.sets) + list(self.where) + list(self.fields):
+            if field not in FIELDS:
+                raise ValueError(f"unknown field: {field}")
+        if self.replacements and not self.fields:
+            raise ValueError("text replacements need the fields to apply to")
+        for field in self.where:
+            if field in RECORDS:
+                raise ValueError(f"{field} cannot be used in a condition")
+        for field, _ in self.additions + self.removals:
+            if field not in LIST_FIELDS:
+                raise ValueError(f"items can only be added to or removed from {', '.join(LIST_FIELDS)}, not {field}")
+        # Validate the new values once rather than once per project, keeping them in the saved format
+        values = ProjectData()
+        for field, value in self.sets.items():
+            try:
+                values.set(field, value)
+            except ValueError as e:
+                raise ValueError(e if field in TEXT_FIELDS else f"{field}: {e}") from None
+            self.sets[field] = values.get(field)
+
+    def __bool__(self):
+        return bool(self.sets or self.replacements or self.additions or self.removals)
+
+    def matches(self, project):
+        """True if a ProjectData meets every where condition"""
+        for field, value in self.where.items():
+            current = project.get(field)
+            if (value not in current) if field in LIST_FIELDS else (current != value):
+                return False
+        return True
+
+    def apply(self, data):
+        """Return (patched dictionary, fields changed); data itself is not modified.
+
+        Values are compared in their effective form, so a project without a
+        license counts as MIT. Keys that are not changed, unknown ones
+        included, are copied as they are. Raises ValueError if the result is
+        not a valid project.
+        """
+        project = ProjectData.from_dict(data)
+        if not self.matches(project):
+            return data, []
+
+        values = {}
+
+        def current(field):
+            return values[field] if field in values else project.get(field)
+
+        values.update(self.sets)
+        for pattern, new in self.replacements:
+            for field in self.fields:
+                values[field] = _replace_strings(current(field), lambda text: pattern.sub(new, text))
+        for field, item in self.additions:
+            items = current(field)
+            if item not in items:
+                values[field] = items + [item]
+        for field, item in self.removals:
+            values[field] = [existing for existing in current(field) if existing != item]
+
+        changed = [field for field in FIELDS if field in values and values[field] != project.get(field)]
+        if not changed:
+            return data, []
+        patched = dict(data)
+        for field in changed:
+            patched[field] = values[field]
+        ProjectData.from_dict(patched)
+        return patched, changed
+
+
+def _lines(value):
+    if isinstance(value, str):
+        return value.splitlines()
+    # One line per list item, records as compact JSON
+    return [item if isinstance(item, str) else json.dumps(item, ensure_ascii=False) for item in value]
+
+
+def field_diff(label, before, after, fields):
+    """A unified diff of the given fields between two project dictionaries"""
+    old, new = ProjectData.from_dict(before), ProjectData.from_dict(after)
+    lines = []
+    for field in fields:
+        lines.extend(difflib.unified_diff(
+            _lines(old.get(field)), _lines(new.get(field)), f"a/{label}:{field}", f"b/{label}:{field}", n=1, lineterm=""
+        ))
+    return "\n".join(lines)
+
+
+def patch_file(source, patch, dry_run=False, diff=False, output=None, template=None):
+    """Patch one project file; errors are reported in the result instead of raised.
+
+    output is the README to render when the project changed, or None. With
+    dry_run nothing is written.
+    """
+    start = time.perf_counter()
+    try:
+        with open(source, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError("project file must contain a JSON object")
+        patched, changed = patch.apply(data)
+        text = field_diff(source, data, patched, changed) if diff and changed else None
+        if not changed or dry_run:
+            output = None
+        else:
+            # Same format as the templates saved by the app
+            write_if_changed(source, json.dumps(patched, indent=2))
+            if output:
+                write_if_changed(output, render_project(patched, template))
+        return PatchResult(source, changed, text, output, None, time.perf_counter() - start)
+    except Exception as e:
+        return PatchResult(source, [], None, None, f"{type(e).__name__}: {e}", time.perf_counter() - start)
+
+
+def _patch_job(job):
+    """Unpack a (source, patch, dry_run, diff, output, template) job for the process pool"""
+    return patch_file(*job)
+
+
+def run_patch(sources, patch, dry_run=False, diff=False, render=False, output_dir=None, template=None,
+              workers=None, chunksize=16, roots=None):
+    """Patch every source file; returns an iterator of PatchResult per file in input order.
+
+    With render, the README of every changed project is written where the
+    render command puts it: next to the file, or into output_dir, keeping
+    the layout under roots. Raises ValueError, before any file is patched,
+    when two sources would be rendered to the same README.
+    """
+    outputs = output_paths(sources, output_dir, roots) if render else [None] * len(sources)
+    if render and output_dir and not dry_run:
+        for directory in set(map(os.path.dirname, outputs)):
+            os.makedirs(directory, exist_ok=True)
+
+    jobs = [
+        (source, patch, dry_run, diff, output, template)
+        for source, output in zip(sources, outputs)
+    ]
+    return map_jobs(_patch_job, jobs, workers, chunksize)
+
+
+def _render_job(job):
+    """Render a (data, output, template) job; returns an error message or None"""
+    data, output, template = job
+    try:
+        write_if_changed(output, render_project(data, template))
+        return None
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def readme_name(name, used):
+    """A file name for the README of a library project, made safe and unique among used.
+
+    Library names can hold any text, so separators and ".." never leave the
+    output directory; used is updated, case-insensitively.
+    """
+    stem = candidate = slugify(name) or "project"
+    count = 2
+    while candidate.lower() in used:
+        candidate = f"{stem}-{count}"
+        count += 1
+    used.add(candidate.lower())
+    return candidate + ".md"
+
+
+def patch_library(library, names, patch, dry_run=False, diff=False, output_dir=None, template=None, workers=None):
+    """Patch the named library projects in one transaction; returns a PatchResult per changed project.
+
+    If any project cannot be patched, ValueError is raised and no project is
+    changed. With output_dir, the README of every changed project is then
+    rendered there, named by readme_name(), on a process pool that is fed a
+    few projects at a time.
+    """
+    results = []
+    used = set()
+
+    def edit(name, data):
+        start = time.perf_counter()
+        try:
+            patched, changed = patch.apply(data)
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}") from None
+        if not changed:
+            return None
+        text = field_diff(name, data, patched, changed) if diff else None
+        output = os.path.join(output_dir, readme_name(name, used)) if output_dir and not dry_run else None
+        results.append(PatchResult(name, changed, text, output, None, time.perf_counter() - start))
+        return patched
+
+    if dry_run:
+        for name in names:
+            try:
+                edit(name, library.load(name))
+            except KeyError:
+                pass
+        return results
+
+    library.rewrite(names, edit)
+    if not output_dir or not results:
+        return results
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = ((library.load(result.source), result.output, template) for result in results)
+    if workers == 1 or len(results) <= 1:
+        errors = list(map(_render_job, jobs))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Submit a bounded window of jobs so only a few projects are held in memory at once
+        errors, pending = [], deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            window = 4 * (workers or os.cpu_count() or 1)
+            for job in jobs:
+                pending.append(executor.submit(_render_job, job))
+                if len(pending) >= window:
+                    errors.append(pending.popleft().result())
+            errors.extend(future.result() for future in pending)
+
+    return [
+        result._replace(output=None, error=f"README not written: {error}") if error else result
+        for result, error in zip(results, errors)
+    ]
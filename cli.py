@@ -0,0 +1,772 @@
+#!/usr/bin/env python3
+"""
+MD File Creator - command line interface
+Render README files from saved project templates without the desktop UI.
+"""
+
+import argparse
+import sys
+
+from md_generator import MarkdownGenerator
+
+# GUI modules that must never be loaded on the headless path
+GUI_MODULES = ("tkinter", "customtkinter", "PIL", "app", "ui_components")
+
+# Runs in a fresh interpreter: import the renderer, produce one README, report timings
+COLDSTART_PROBE = """
+import sys, time
+start = time.perf_counter()
+from md_generator import MarkdownGenerator
+imported = time.perf_counter()
+generator = MarkdownGenerator()
+generator.update_field("project_name", "coldstart")
+generator.generate_markdown()
+done = time.perf_counter()
+loaded = [name for name in sys.argv[1:] if name in sys.modules]
+print(imported - start, done - imported, ",".join(loaded))
+"""
+
+
+def cmd_render(args):
+    """Render many project JSON files in parallel"""
+    from batch import BatchSummary, input_roots, run_batch
+    from file_output import SyncBatch
+    from md_templates import SectionStats
+
+    roots = input_roots(args.inputs, recursive=args.recursive)
+    sources = sorted(roots)
+    if not sources:
+        print("No project files found", file=sys.stderr)
+        return 1
+
+    summary = BatchSummary()
+    sections = SectionStats()
+    cache = (args.cache_dir, int(args.cache_size * 1024 * 1024)) if args.cache_dir else None
+    try:
+        results = run_batch(
+            sources, args.output_dir, args.template, args.workers,
+            profile=args.profile, cache=cache, only_changed=args.only_changed, roots=roots, durable=args.fsync
+        )
+    except ValueError as e:
+        print(f"Nothing rendered: {e}", file=sys.stderr)
+        return 2
+    sync = SyncBatch() if args.fsync else None
+    for result in results:
+        summary.add(result)
+        if sync and result.written:
+            sync.add(result.output)
+        if result.sections:
+            sections.merge(result.sections)
+        if result.error:
+            print(f"FAIL {result.seconds * 1000:8.2f} ms  {result.source}: {result.error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"ok   {result.seconds * 1000:8.2f} ms  {result.source} -> {result.output}")
+    if sync:
+        sync.flush()
+    summary.finish()
+
+    print(summary.format(), file=sys.stderr)
+    if cache:
+        from render_cache import RenderCache
+
+        # Workers trim as they add entries but cannot see each other's; the bound is applied
+        # here against the whole directory, and the lookups are those the workers reported
+        render_cache = RenderCache(*cache)
+        render_cache.hits, render_cache.misses = summary.cache_hits, summary.cache_misses
+        render_cache.trim()
+        print(render_cache.format(), file=sys.stderr)
+    if args.profile:
+        if cache:
+            print(f"profile of the {summary.cache_misses} renders that missed the render cache:", file=sys.stderr)
+        print(sections.format(limit=args.profile), file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+def cmd_stream(args):
+    """Render JSONL project records from a file or stdin"""
+    from batch import BatchSummary
+    from stream import DirectorySink, JsonlSink, TarSink, run_stream
+
+    # Open the output sink
+    handle = None
+    if args.format == "dir":
+        if not args.output:
+            print("--output is required for --format dir", file=sys.stderr)
+            return 2
+        sink = DirectorySink(args.output)
+    elif args.output in (None, "-"):
+        sink = TarSink(sys.stdout.buffer) if args.format == "tar" else JsonlSink(sys.stdout)
+    elif args.format == "tar":
+        handle = open(args.output, "wb")
+        sink = TarSink(handle)
+    else:
+        handle = open(args.output, "w", encoding="utf-8")
+        sink = JsonlSink(handle)
+
+    summary = BatchSummary()
+
+    def report(result):
+        summary.add(result)
+        if result.error:
+            print(f"FAIL line {result.source}: {result.error}", file=sys.stderr)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    try:
+        run_stream(source, sink, args.template, args.workers, args.queue_size, on_result=report)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if handle:
+            handle.close()
+    summary.finish()
+
+    print(summary.format("records"), file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+def cmd_watch(args):
+    """Regenerate README files whenever project JSON files change"""
+    from watch import ProjectWatcher, create_backend
+
+    watcher = ProjectWatcher(args.inputs, args.output_dir, args.template, recursive=args.recursive)
+    backend = create_backend(args.backend, args.interval)
+
+    def report(result):
+        if result.error:
+            print(f"FAIL {result.seconds * 1000:8.2f} ms  {result.source}: {result.error}", file=sys.stderr)
+        elif result.written:
+            print(f"ok   {result.seconds * 1000:8.2f} ms  {result.source} -> {result.output}", flush=True)
+
+    print(f"Watching {', '.join(args.inputs)} ({backend.name}), press Ctrl+C to stop", file=sys.stderr)
+    try:
+        watcher.run(backend, on_result=report, initial=not args.no_initial)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.close()
+    return 0
+
+
+def read_project(path):
+    """The dictionary in a project file, or None after reporting why it cannot be read"""
+    import json
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError("project file must contain a JSON object")
+    except (OSError, ValueError) as e:
+        print(f"FAIL {path}: {type(e).__name__}: {e}", file=sys.stderr)
+        return None
+    return data
+
+
+def cmd_tree(args):
+    """Print a directory as a file_structure tree, or store it in a project file"""
+    import json
+    import os
+
+    from tree_scanner import scan_directory
+
+    if not os.path.isdir(args.directory):
+        print(f"Not a directory: {args.directory}", file=sys.stderr)
+        return 2
+    # Read before scanning, so a bad project file fails fast
+    data = read_project(args.project) if args.project else None
+    if args.project and data is None:
+        return 1
+    cache = None
+    if args.cache:
+        from tree_cache import TreeCache
+
+        cache = TreeCache(args.cache)
+    tree = scan_directory(args.directory, args.depth, args.max_entries, args.exclude, args.workers, cache=cache)
+    if cache:
+        cache.save()
+        print(cache.format(), file=sys.stderr)
+    if not args.project:
+        print(tree)
+        return 0
+
+    from file_output import write_if_changed
+
+    data["file_structure"] = tree
+    if write_if_changed(args.project, json.dumps(data, indent=2)):
+        print(f"Updated file_structure in {args.project}", file=sys.stderr)
+    else:
+        print(f"{args.project} is already up to date", file=sys.stderr)
+    return 0
+
+
+def cmd_detect(args):
+    """Detect technologies and prerequisites from repository manifest files"""
+    import json
+
+    from tech_detect import ManifestCache, detect, merge
+
+    if args.project and len(args.repos) > 1:
+        print("--project needs a single repository", file=sys.stderr)
+        return 2
+    data = read_project(args.project) if args.project else None
+    if args.project and data is None:
+        return 1
+
+    # One cache for all repositories, so shared manifests are parsed once
+    cache = ManifestCache(args.cache)
+    for repo in args.repos:
+        found = detect(repo, args.workers, cache)
+        print(f"{repo}: {len(found.manifests)} manifest files ({found.cached} cached)", file=sys.stderr)
+        if not args.project:
+            print(json.dumps({"repo": repo, "tech": found.tech, "Prerequisites": found.prerequisites}))
+            continue
+
+        from file_output import write_if_changed
+
+        for field, items in (("tech", found.tech), ("Prerequisites", found.prerequisites)):
+            existing = data.get(field) if isinstance(data.get(field), list) else []
+            data[field] = items if args.replace else merge(existing, items)
+        if write_if_changed(args.project, json.dumps(data, indent=2)):
+            print(f"Updated tech and Prerequisites in {args.project}", file=sys.stderr)
+        else:
+            print(f"{args.project} is already up to date", file=sys.stderr)
+    cache.save()
+    return 0
+
+
+def cmd_meta(args):
+    """Read project names and usernames from the .git directories of checkouts"""
+    import json
+
+    from git_meta import prefill, read_metadata
+
+    if args.project and len(args.repos) > 1:
+        print("--project needs a single repository", file=sys.stderr)
+        return 2
+    data = read_project(args.project) if args.project else None
+    if args.project and data is None:
+        return 1
+
+    status = 0
+    for repo in args.repos:
+        meta = read_metadata(repo)
+        if meta is None:
+            print(f"{repo}: not a git checkout", file=sys.stderr)
+            status = 1
+            continue
+        if not args.project:
+            print(json.dumps(dict(meta._asdict(), repo=repo)))
+            continue
+
+        from file_output import write_if_changed
+
+        changed = prefill(data, meta, args.replace)
+        if changed and write_if_changed(args.project, json.dumps(data, indent=2)):
+            print(f"Updated {' and '.join(changed)} in {args.project}", file=sys.stderr)
+        else:
+            print(f"{args.project} is already up to date", file=sys.stderr)
+    return status
+
+
+def cmd_history(args):
+    """Read the top contributors and latest releases of repositories from their git history"""
+    import json
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    from git_history import HistoryCache, read_history
+
+    if args.project and len(args.repos) > 1:
+        print("--project needs a single repository", file=sys.stderr)
+        return 2
+    data = read_project(args.project) if args.project else None
+    if args.project and data is None:
+        return 1
+
+    # One cache file for all repositories, keyed by their absolute path
+    cache = HistoryCache(args.cache)
+
+    def read(repo):
+        try:
+            return read_history(repo, cache, args.contributors, args.releases), None
+        except (ValueError, OSError, subprocess.CalledProcessError) as e:
+            return None, str(e)
+
+    status = 0
+    with ThreadPoolExecutor(args.workers) as pool:
+        for repo, (history, error) in zip(args.repos, pool.map(read, args.repos)):
+            if error:
+                print(f"{repo}: {error}", file=sys.stderr)
+                status = 1
+                continue
+            print(f"{repo}: {history.commits} commits ({history.walked} read)", file=sys.stderr)
+            if not args.project:
+                print(json.dumps({"repo": repo, "contributors": history.contributors, "releases": history.releases}))
+                continue
+
+            from file_output import write_if_changed
+
+            data["contributors"] = history.contributors
+            data["releases"] = history.releases
+            if write_if_changed(args.project, json.dumps(data, indent=2)):
+                print(f"Updated contributors and releases in {args.project}", file=sys.stderr)
+            else:
+                print(f"{args.project} is already up to date", file=sys.stderr)
+    cache.save()
+    return status
+
+
+def add_patch_options(parser):
+    """Edit options shared by 'patch' and 'library patch'"""
+    parser.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE", help="set a field; list fields take JSON (repeatable)")
+    parser.add_argument("--replace", action="append", nargs=2, default=[], metavar=("OLD", "NEW"), help="replace text in the fields given with -f (repeatable)")
+    parser.add_argument("--regex", action="store_true", help="treat --replace patterns as regular expressions (NEW may use \\1 groups)")
+    parser.add_argument("-f", "--field", action="append", help="field --replace applies to, required with it (repeatable)")
+    parser.add_argument("--add", action="append", default=[], metavar="FIELD=ITEM", help="add an item to features, Prerequisites or tech (repeatable)")
+    parser.add_argument("--remove", action="append", default=[], metavar="FIELD=ITEM", help="remove an item from features, Prerequisites or tech (repeatable)")
+    parser.add_argument("--where", action="append", default=[], metavar="FIELD=VALUE", help="only patch projects whose field equals, or whose list contains, VALUE (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing anything")
+    parser.add_argument("--diff", action="store_true", help="print a unified diff of every changed field")
+    parser.add_argument("--render", action="store_true", help="also write the README of every changed project")
+
+
+def build_patch(args):
+    """Create the Patch described by the options of add_patch_options; raises ValueError"""
+    from bulk_patch import Patch, parse_assignment
+
+    if args.replace and not args.field:
+        raise ValueError("--replace needs -f FIELD for every field it may change")
+    patch = Patch(
+        sets=dict(map(parse_assignment, args.set)),
+        replacements=args.replace,
+        fields=args.field,
+        regex=args.regex,
+        additions=[parse_assignment(item) for item in args.add],
+        removals=[parse_assignment(item) for item in args.remove],
+        where=dict(map(parse_assignment, args.where))
+    )
+    if not patch:
+        raise ValueError("nothing to change: give --set, --replace, --add or --remove")
+    return patch
+
+
+def report_patch(result, args):
+    """Print one PatchResult; returns False if it failed"""
+    import json
+
+    if result.error:
+        print(f"FAIL {result.source}: {result.error}", file=sys.stderr)
+        return False
+    if not result.changed:
+        return True
+    if args.json:
+        print(json.dumps(result._asdict()))
+        return True
+    verb = "would patch" if args.dry_run else "patched"
+    target = f" -> {result.output}" if result.output else ""
+    print(f"{verb} {result.source}: {', '.join(result.changed)}{target}")
+    if result.diff:
+        print(result.diff)
+    return True
+
+
+def cmd_patch(args):
+    """Edit fields of many project files in parallel, optionally rendering their README files"""
+    import time
+
+    from batch import input_roots
+    from bulk_patch import run_patch
+
+    try:
+        patch = build_patch(args)
+    except ValueError as e:
+        print(f"Cannot patch: {e}", file=sys.stderr)
+        return 2
+    roots = input_roots(args.inputs, recursive=args.recursive)
+    sources = sorted(roots)
+    if not sources:
+        print("No project files found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    changed = failed = 0
+    try:
+        results = run_patch(
+            sources, patch, args.dry_run, args.diff, args.render, args.output_dir, workers=args.workers, roots=roots
+        )
+    except ValueError as e:
+        print(f"Nothing patched: {e}", file=sys.stderr)
+        return 2
+    for result in results:
+        if not report_patch(result, args):
+            failed += 1
+        elif result.changed:
+            changed += 1
+    verb = "would change" if args.dry_run else "changed"
+    print(
+        f"{changed} of {len(sources)} projects {verb}, {failed} failed in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
+
+
+def add_library_filters(parser, limit=50):
+    """Filter options shared by 'library list', 'library search' and 'library patch'"""
+    parser.add_argument("--name", help="library name prefix")
+    parser.add_argument("--project-name", help="project name prefix")
+    parser.add_argument("-u", "--username", help="GitHub username")
+    parser.add_argument("-t", "--template", help="template name")
+    parser.add_argument("-l", "--license", help="license")
+    parser.add_argument("--tech", action="append", help="technology the project uses (repeat to require several)")
+    parser.add_argument("-n", "--limit", type=int, default=limit, help=f"maximum number of rows, 0 for all (default: {limit or 'all'})")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per project")
+
+
+def cmd_library(args):
+    """Add, list, search, show, patch and remove projects in the SQLite project library, and collect its garbage"""
+    import json
+    import os
+    import time
+
+    from project_library import ProjectLibrary
+
+    with ProjectLibrary(args.db) as library:
+        if args.action == "add":
+            from batch import collect_inputs
+
+            paths = collect_inputs(args.inputs, recursive=args.recursive)
+            if args.name and len(paths) != 1:
+                print("--name needs a single project file", file=sys.stderr)
+                return 2
+            items = []
+            for path in paths:
+                with open(path, "r", encoding="utf-8") as file:
+                    items.append((args.name or os.path.splitext(os.path.basename(path))[0], json.load(file)))
+            start = time.perf_counter()
+            try:
+                count = library.save_many(items)
+            except ValueError as e:
+                print(f"Not added: {e}", file=sys.stderr)
+                return 1
+            print(f"Added {count} projects to {library.path} in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+            return 0
+
+        if args.action in ("list", "search", "patch"):
+            filters = {
+                "name": args.name, "project_name": args.project_name, "username": args.username,
+                "template": args.template, "license": args.license, "tech": args.tech
+            }
+
+        if args.action == "search":
+            start = time.perf_counter()
+            try:
+                hits = library.search(" ".join(args.query), args.field, limit=args.limit, **filters)
+            except ValueError as e:
+                print(f"Cannot search: {e}", file=sys.stderr)
+                return 2
+            elapsed = time.perf_counter() - start
+            for hit in hits:
+                snippet = " ".join(hit.snippet.split())
+                if args.json:
+                    print(json.dumps(dict(hit._asdict(), snippet=snippet)))
+                else:
+                    print(f"{hit.name:<30} {hit.project_name:<30} {snippet}")
+            print(f"{len(hits)} projects found in {elapsed * 1000:.1f} ms", file=sys.stderr)
+            return 0
+
+        if args.action == "patch":
+            from bulk_patch import patch_library
+
+            try:
+                patch = build_patch(args)
+            except ValueError as e:
+                print(f"Cannot patch: {e}", file=sys.stderr)
+                return 2
+            names = [summary.name for summary in library.list(limit=args.limit, **filters)]
+            output_dir = (args.output_dir or ".") if args.render else None
+            start = time.perf_counter()
+            try:
+                results = patch_library(library, names, patch, args.dry_run, args.diff, output_dir, workers=args.workers)
+            except ValueError as e:
+                print(f"Not patched: {e}", file=sys.stderr)
+                return 1
+            failed = sum(not report_patch(result, args) for result in results)
+            verb = "would change" if args.dry_run else "changed"
+            print(f"{len(results)} of {len(names)} projects {verb} in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+            return 1 if failed else 0
+
+        if args.action == "list":
+            for summary in library.list(limit=args.limit, **filters):
+                if args.json:
+                    print(json.dumps(summary._asdict()))
+                else:
+                    saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(summary.updated))
+                    print(f"{summary.name:<30} {summary.project_name:<30} {summary.username:<20} {summary.template:<10} {saved}")
+            print(f"{library.count(**filters)} matching projects", file=sys.stderr)
+            return 0
+
+        if args.action == "show":
+            try:
+                if args.field:
+                    from project_model import FIELDS
+
+                    unknown = [field for field in args.field if field not in FIELDS]
+                    if unknown:
+                        print(f"Unknown field: {', '.join(unknown)}", file=sys.stderr)
+                        return 2
+                    data = library.load(args.name, args.field)
+                else:
+                    data = library.load(args.name)
+            except KeyError:
+                print(f"No project named {args.name}", file=sys.stderr)
+                return 1
+            text = json.dumps(data, indent=2)
+            if not args.output:
+                print(text)
+                return 0
+
+            from file_output import write_if_changed
+
+            write_if_changed(args.output, text)
+            return 0
+
+        if args.action == "gc":
+            deleted, size = library.collect_garbage()
+            if args.vacuum:
+                library.vacuum()
+            stats = library.storage()
+            print(f"Deleted {deleted} unused values ({size / 1024:.1f} KiB)", file=sys.stderr)
+            print(
+                f"{stats.projects} projects share {stats.values} stored values ({stats.stored_bytes / 1024:.1f} KiB);"
+                f" unshared they would take {stats.logical_bytes / 1024:.1f} KiB",
+                file=sys.stderr
+            )
+            return 0
+
+        # remove
+        status = 0
+        for name in args.names:
+            if not library.delete(name):
+                print(f"No project named {name}", file=sys.stderr)
+                status = 1
+        return status
+
+
+def cmd_languages(args):
+    """Count the bytes per language of a repository, or store them in a project file"""
+    import json
+    import os
+
+    from lang_stats import DEFAULT_EXCLUDE, StatsCache, field_value, language_stats
+
+    if not os.path.isdir(args.repo):
+        print(f"Not a directory: {args.repo}", file=sys.stderr)
+        return 2
+    data = read_project(args.project) if args.project else None
+    if args.project and data is None:
+        return 1
+    cache = StatsCache(args.cache) if args.cache else None
+    stats = language_stats(args.repo, args.workers, cache, DEFAULT_EXCLUDE + tuple(args.exclude))
+    if cache:
+        cache.save()
+    print(f"{args.repo}: {stats.files} files, {stats.opened} opened ({stats.cached} cached)", file=sys.stderr)
+    languages = field_value(stats.bytes)
+    if not args.project:
+        total = sum(stats.bytes.values())
+        for language in languages:
+            print(f"{language['name']:<24} {language['bytes']:>14,} {language['bytes'] / total:>7.1%}")
+        return 0
+
+    from file_output import write_if_changed
+
+    data["languages"] = languages
+    if write_if_changed(args.project, json.dumps(data, indent=2)):
+        print(f"Updated languages in {args.project}", file=sys.stderr)
+    else:
+        print(f"{args.project} is already up to date", file=sys.stderr)
+    return 0
+
+
+def cmd_coldstart(args):
+    """Measure importing the renderer and producing one README in a fresh interpreter"""
+    import os
+    import statistics
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    import_times, render_times = [], []
+    loaded = set()
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-c", COLDSTART_PROBE, *GUI_MODULES],
+            cwd=here, capture_output=True, text=True, check=True
+        ).stdout.split()
+        import_times.append(float(output[0]) * 1000)
+        render_times.append(float(output[1]) * 1000)
+        if len(output) > 2:
+            loaded.update(output[2].split(","))
+
+    import_ms = statistics.median(import_times)
+    render_ms = statistics.median(render_times)
+    print(f"import {import_ms:.2f} ms, first render {render_ms:.2f} ms, total {import_ms + render_ms:.2f} ms "
+          f"(median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+
+    status = 0
+    if loaded:
+        print(f"FAIL GUI modules loaded: {', '.join(sorted(loaded))}", file=sys.stderr)
+        status = 1
+    if import_ms + render_ms > args.budget_ms:
+        if args.report_only:
+            print("cold start is over budget", file=sys.stderr)
+        else:
+            print("FAIL cold start is over budget", file=sys.stderr)
+            status = 1
+    return status
+
+
+def build_parser():
+    """Create the argument parser with all subcommands"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Generate README.md files from MD File Creator project templates."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # render
+    render = subparsers.add_parser("render", help="render project JSON files to markdown")
+    render.add_argument("inputs", nargs="+", help="project files, directories or glob patterns")
+    render.add_argument("-o", "--output-dir", help="directory for README files (default: next to each input)")
+    render.add_argument("-t", "--template", choices=MarkdownGenerator.TEMPLATES, help="override the template stored in each project")
+    render.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    render.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    render.add_argument("-q", "--quiet", action="store_true", help="only report failures and the summary")
+    render.add_argument("--only-changed", action="store_true", help="leave README files that would not change untouched")
+    render.add_argument("--fsync", action="store_true", help="make written files durable: each is fsynced before it replaces the old file, then each directory once")
+    render.add_argument("--cache-dir", help="reuse README files rendered from identical project data (content-addressed)")
+    render.add_argument("--cache-size", type=float, default=256, metavar="MB", help="maximum render cache size in MiB (default: 256)")
+    render.add_argument("--profile", type=int, nargs="?", const=20, default=0, metavar="N", help="report the N slowest template sections (default: 20)")
+    render.set_defaults(func=cmd_render)
+
+    # patch
+    patch = subparsers.add_parser("patch", help="edit fields of many project files, e.g. rename a username everywhere")
+    patch.add_argument("inputs", nargs="+", help="project files, directories or glob patterns")
+    add_patch_options(patch)
+    patch.add_argument("-o", "--output-dir", help="directory for the README files written by --render (default: next to each input)")
+    patch.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    patch.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    patch.add_argument("--json", action="store_true", help="print one JSON object per changed project")
+    patch.set_defaults(func=cmd_patch)
+
+    # stream
+    stream = subparsers.add_parser("stream", help="render JSONL project records with bounded memory")
+    stream.add_argument("input", nargs="?", default="-", help="JSONL file, one project per line (default: stdin)")
+    stream.add_argument("-f", "--format", choices=["dir", "tar", "jsonl"], default="jsonl", help="output format (default: jsonl)")
+    stream.add_argument("-o", "--output", help="output directory, or file for tar/jsonl (default: stdout)")
+    stream.add_argument("-t", "--template", choices=MarkdownGenerator.TEMPLATES, help="override the template stored in each record")
+    stream.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    stream.add_argument("--queue-size", type=int, default=256, help="maximum records buffered between pipeline stages")
+    stream.set_defaults(func=cmd_stream)
+
+    # watch
+    watch = subparsers.add_parser("watch", help="regenerate README files when project JSON files change")
+    watch.add_argument("inputs", nargs="+", help="project files, directories or glob patterns")
+    watch.add_argument("-o", "--output-dir", help="directory for README files (default: next to each input)")
+    watch.add_argument("-t", "--template", choices=MarkdownGenerator.TEMPLATES, help="override the template stored in each project")
+    watch.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    watch.add_argument("--backend", choices=["auto", "inotify", "poll"], default="auto", help="change detection (default: inotify where available)")
+    watch.add_argument("--interval", type=float, default=0.5, help="polling interval in seconds (default: 0.5)")
+    watch.add_argument("--no-initial", action="store_true", help="do not render every project once at start-up")
+    watch.set_defaults(func=cmd_watch)
+
+    # tree
+    tree = subparsers.add_parser("tree", help="print a directory as a file_structure tree, honouring .gitignore")
+    tree.add_argument("directory", help="directory to scan")
+    tree.add_argument("-d", "--depth", type=int, default=4, help="maximum depth, 0 for no limit (default: 4)")
+    tree.add_argument("-n", "--max-entries", type=int, default=500, help="maximum number of entries, 0 for no limit (default: 500)")
+    tree.add_argument("-x", "--exclude", action="append", default=[], metavar="PATTERN", help="extra gitignore-style pattern to leave out (repeatable)")
+    tree.add_argument("-j", "--workers", type=int, default=None, help="number of scanning threads")
+    tree.add_argument("--cache", metavar="FILE", help="reuse listings of unchanged directories from this file (kept up to date)")
+    tree.add_argument("-p", "--project", help="store the tree in this project file's file_structure field instead of printing it")
+    tree.set_defaults(func=cmd_tree)
+
+    # detect
+    detect = subparsers.add_parser("detect", help="detect technologies and prerequisites from repository manifests")
+    detect.add_argument("repos", nargs="+", help="repository directories")
+    detect.add_argument("-p", "--project", help="add the results to this project file instead of printing JSON lines")
+    detect.add_argument("--replace", action="store_true", help="replace the project's tech and Prerequisites instead of adding to them")
+    detect.add_argument("--cache", metavar="FILE", help="reuse results for manifests with identical content from this file")
+    detect.add_argument("-j", "--workers", type=int, default=None, help="number of threads for scanning and parsing")
+    detect.set_defaults(func=cmd_detect)
+
+    # meta
+    meta = subparsers.add_parser("meta", help="read project names and usernames from .git without running git")
+    meta.add_argument("repos", nargs="+", help="checkout directories")
+    meta.add_argument("-p", "--project", help="fill this project file's project_name and username instead of printing JSON lines")
+    meta.add_argument("--replace", action="store_true", help="replace fields that already have a value")
+    meta.set_defaults(func=cmd_meta)
+
+    # history
+    history = subparsers.add_parser("history", help="read top contributors and latest releases from git history")
+    history.add_argument("repos", nargs="+", help="checkout directories")
+    history.add_argument("-p", "--project", help="store the results in this project file instead of printing JSON lines")
+    history.add_argument("-n", "--contributors", type=int, default=10, help="number of contributors to keep (default: 10)")
+    history.add_argument("--releases", type=int, default=10, help="number of most recent tags to keep (default: 10)")
+    history.add_argument("--cache", metavar="FILE", help="keep commit counts by HEAD here, so only new commits are read next time")
+    history.add_argument("-j", "--workers", type=int, default=None, help="number of repositories read at once")
+    history.set_defaults(func=cmd_history)
+
+    # languages
+    languages = subparsers.add_parser("languages", help="count the bytes per language of a repository for the languages section")
+    languages.add_argument("repo", help="repository directory")
+    languages.add_argument("-x", "--exclude", action="append", default=[], metavar="PATTERN", help="extra gitignore-style pattern to leave out (repeatable)")
+    languages.add_argument("-j", "--workers", type=int, default=None, help="number of scanning threads")
+    languages.add_argument("--cache", metavar="FILE", help="reuse what was found in unchanged files from this file (kept up to date)")
+    languages.add_argument("-p", "--project", help="store the results in this project file's languages field instead of printing them")
+    languages.set_defaults(func=cmd_languages)
+
+    # library
+    library = subparsers.add_parser("library", help="manage the SQLite project library shared with the app")
+    library.add_argument("--db", help="library database (default: $MDCREATOR_LIBRARY or ~/.mdcreator/library.db)")
+    actions = library.add_subparsers(dest="action", required=True)
+    add = actions.add_parser("add", help="add or replace projects from JSON files, named after each file")
+    add.add_argument("inputs", nargs="+", help="project files, directories or glob patterns")
+    add.add_argument("-r", "--recursive", action="store_true", help="search directories recursively")
+    add.add_argument("--name", help="library name for a single project file")
+    listing = actions.add_parser("list", help="list projects, most recently saved first")
+    add_library_filters(listing)
+    search = actions.add_parser("search", help="full-text search of overview, features, prerequisites, usage code and file structure")
+    search.add_argument("query", nargs="+", help="words that must all appear; end a word with * to match it as a prefix")
+    search.add_argument("-f", "--field", action="append", help="only search this field: overview, features, Prerequisites, usage_code or file_structure (repeatable)")
+    add_library_filters(search)
+    show = actions.add_parser("show", help="print a project as JSON")
+    show.add_argument("name", help="library name")
+    show.add_argument("-f", "--field", action="append", help="only this field (repeatable); long text fields that are not asked for are not read")
+    show.add_argument("-o", "--output", help="write the project file here instead of printing it")
+    remove = actions.add_parser("remove", help="remove projects")
+    remove.add_argument("names", nargs="+", help="library names")
+    patching = actions.add_parser("patch", help="edit fields of the matching projects in one transaction")
+    add_library_filters(patching, limit=0)
+    add_patch_options(patching)
+    patching.add_argument("-o", "--output-dir", help="directory for the README files written by --render (default: current directory)")
+    patching.add_argument("-j", "--workers", type=int, default=None, help="number of rendering processes (default: CPU count)")
+    gc = actions.add_parser("gc", help="delete stored values no project uses any more and report storage")
+    gc.add_argument("--vacuum", action="store_true", help="also shrink the database file")
+    library.set_defaults(func=cmd_library)
+
+    # coldstart
+    coldstart = subparsers.add_parser("coldstart", help="check the renderer starts quickly without loading the GUI")
+    coldstart.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to measure (default: 5)")
+    coldstart.add_argument("--budget-ms", type=float, default=50.0, help="maximum import + first render time (default: 50)")
+    coldstart.add_argument("--report-only", action="store_true", help="report the timing without failing when it is over budget (GUI imports still fail)")
+    coldstart.set_defaults(func=cmd_coldstart)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Atomic, write-if-changed output files.
+
+write_if_changed() streams new content into a temporary file next to the
+target and renames it into place, so readers never see a half-written README.
+When the existing file already holds exactly the same bytes nothing is
+written at all and the file keeps its mtime. The rename only protects
+readers: unless durable is set, nothing is flushed to disk and a crash can
+still leave an empty or truncated file. With durable, the temporary file is
+fsynced before it replaces the target, and SyncBatch then fsyncs each
+directory that received files once, which persists the renames.
+"""
+
+import os
+
+_LINESEP = os.linesep
+_counter = 0
+
+
+def _encode(text):
+    # Match text-mode writes, which translate newlines on Windows
+    if _LINESEP != "\n":
+        text = text.replace("\n", _LINESEP)
+    return text.encode("utf-8")
+
+
+def _open_temp(path):
+    """Create a temporary file beside path; permissions follow the umask like a normal open"""
+    global _counter
+    directory, name = os.path.split(path)
+    while True:
+        _counter += 1
+        temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{_counter}.tmp")
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        except FileExistsError:
+            continue
+        return temp_path, os.fdopen(fd, "wb")
+
+
+def _finish(temp_path, temp, path, durable=False):
+    """Close the temporary file and move it over path, keeping the old file's permissions.
+
+    With durable, the content is on disk before the rename makes it visible.
+    """
+    if durable:
+        temp.flush()
+        os.fsync(temp.fileno())
+    temp.close()
+    try:
+        os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+    except FileNotFoundError:
+        pass
+    os.replace(temp_path, path)
+
+
+def write_if_changed(path, content, force=False, durable=False):
+    """Atomically write content (a string or an iterable of strings) to path.
+
+    Returns False without touching the file when it already holds the same
+    content, True when it was (re)written. force skips the comparison;
+    durable fsyncs the new content before it replaces the old file (the
+    directory is left to SyncBatch).
+    """
+    if isinstance(content, str):
+        payload = _encode(content)
+        if not force:
+            # Cheap check first: a different size means the content changed
+            try:
+                if os.stat(path).st_size == len(payload):
+                    with open(path, "rb") as existing:
+                        if existing.read() == payload:
+                            return False
+            except FileNotFoundError:
+                pass
+        temp_path, temp = _open_temp(path)
+        try:
+            temp.write(payload)
+            _finish(temp_path, temp, path, durable)
+        except BaseException:
+            temp.close()
+            os.unlink(temp_path)
+            raise
+        return True
+
+    # Streamed content: compare chunk by chunk and only start the temporary file
+    # at the first difference, copying the matching prefix from the old file
+    existing = None
+    if not force:
+        try:
+            existing = open(path, "rb")
+        except FileNotFoundError:
+            pass
+
+    temp_path = temp = None
+    matched = 0
+    try:
+        for chunk in content:
+            data = _encode(chunk)
+            if temp is None and existing is not None:
+                if existing.read(len(data)) == data:
+                    matched += len(data)
+                    continue
+            if temp is None:
+                temp_path, temp = _open_temp(path)
+                _copy_prefix(existing, temp, matched)
+            temp.write(data)
+
+        if temp is None:
+            if existing is not None and not existing.read(1):
+                return False
+            # The new content is a strict prefix of the old file (or there is no old file)
+            temp_path, temp = _open_temp(path)
+            _copy_prefix(existing, temp, matched)
+        _finish(temp_path, temp, path, durable)
+        return True
+    except BaseException:
+        if temp is not None:
+            temp.close()
+            os.unlink(temp_path)
+        raise
+    finally:
+        if existing is not None:
+            existing.close()
+
+
+def _copy_prefix(source, target, size):
+    if not size:
+        return
+    source.seek(0)
+    while size:
+        block = source.read(min(size, 1024 * 1024))
+        target.write(block)
+        size -= len(block)
+
+
+class SyncBatch:
+    """Collects paths written with durable=True and persists their renames with one fsync per directory"""
+
+    def __init__(self):
+        self.directories = set()
+
+    def add(self, path):
+        self.directories.add(os.path.dirname(os.path.abspath(path)))
+
+    def flush(self):
+        """fsync each directory that received a file once; returns the number of directories"""
+        count = len(self.directories)
+        # Directory fsync persists the renames; it is not supported on Windows
+        if os.name == "posix":
+            for directory in self.directories:
+                fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        self.directories.clear()
+        return count
@@ -0,0 +1,165 @@
+"""
+Contributors and releases read from a local repository's history.
+
+Commits are counted per author by streaming `git log` line by line, so memory
+grows with the number of authors, not the number of commits. The counts are
+cached by HEAD commit: when HEAD has moved forward, only the new commits
+(old HEAD..HEAD) are read and added to the stored counts, and history is only
+walked in full again after a rebase or reset. Releases are the most recent
+tags, cached by the set of tags; HEAD and the tags are read from .git
+directly, so an unchanged repository starts no git process at all.
+"""
+
+import hashlib
+import io
+import json
+import os
+import subprocess
+from collections import namedtuple
+
+from file_output import write_if_changed
+from git_meta import common_dir, find_git_dir, list_refs, read_metadata
+
+# Bump to invalidate existing cache files
+HISTORY_VERSION = 1
+
+DEFAULT_CONTRIBUTORS = 10
+DEFAULT_RELEASES = 10
+
+History = namedtuple("History", ["contributors", "releases", "commits", "walked"])
+
+
+def count_authors(repo, revisions, authors):
+    """Add the non-merge commits of `git log revisions` to authors ({key: [name, commits]}).
+
+    Authors are keyed by their lower-cased email (after .mailmap) and keep the
+    first name seen, which is the most recent one. Returns the number of
+    commits read.
+    """
+    process = subprocess.Popen(
+        ["git", "-C", repo, "log", "--no-merges", "--format=%aN%x00%aE", *revisions, "--"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    read = 0
+    with process.stdout:
+        for line in io.TextIOWrapper(process.stdout, encoding="utf-8", errors="replace"):
+            name, _, email = line.rstrip("\n").partition("\0")
+            key = email.lower() or name
+            entry = authors.get(key)
+            if entry is None:
+                authors[key] = [name, 1]
+            else:
+                entry[1] += 1
+            read += 1
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, "git log")
+    return read
+
+
+def is_ancestor(repo, commit, head):
+    """True if commit is an ancestor of head; False as well when commit no longer exists"""
+    result = subprocess.run(
+        ["git", "-C", repo, "merge-base", "--is-ancestor", commit, head],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def read_releases(repo, limit=DEFAULT_RELEASES):
+    """Return the most recent tags as [tag, date] pairs, newest first"""
+    output = subprocess.run(
+        ["git", "-C", repo, "for-each-ref", "--sort=-creatordate", f"--count={limit}",
+         "--format=%(refname:lstrip=2)%09%(creatordate:short)", "refs/tags"],
+        capture_output=True, text=True, encoding="utf-8", errors="replace", check=True
+    ).stdout
+    return [line.split("\t", 1) for line in output.splitlines() if "\t" in line]
+
+
+class HistoryCache:
+    """Author counts by HEAD commit and releases by tag set for any number of repositories, optionally persisted as JSON"""
+
+    def __init__(self, path=None):
+        self.path = path
+        # absolute repository path -> {"head", "authors", "commits", "tags", "releases"}
+        self.repos = {}
+        self.changed = False
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict) and data.get("version") == HISTORY_VERSION:
+                    self.repos = data.get("repos", {})
+            except (FileNotFoundError, ValueError):
+                pass
+
+    def get(self, repo):
+        return self.repos.get(repo)
+
+    def put(self, repo, entry):
+        self.repos[repo] = entry
+        self.changed = True
+
+    def save(self):
+        """Write the cache file; returns False when nothing changed"""
+        if not self.path or not self.changed:
+            return False
+        data = {"version": HISTORY_VERSION, "repos": self.repos}
+        self.changed = False
+        return write_if_changed(self.path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def _tags_key(tags, limit):
+    text = "\n".join(f"{ref} {object_id}" for ref, object_id in sorted(tags.items()))
+    return hashlib.blake2b(f"{limit}\n{text}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def read_history(repo, cache=None, contributors=DEFAULT_CONTRIBUTORS, releases=DEFAULT_RELEASES):
+    """Return the History of the checkout at repo: its top contributors and latest releases.
+
+    cache is an optional HistoryCache. Raises ValueError if repo is not a git
+    checkout, and OSError or CalledProcessError if git cannot be run.
+    """
+    repo = os.path.abspath(repo)
+    git_dir = find_git_dir(repo)
+    if git_dir is None:
+        raise ValueError(f"{repo} is not a git checkout")
+    head = read_metadata(repo).commit
+    entry = (cache.get(repo) if cache is not None else None) or {}
+
+    walked = 0
+    authors, commits = entry.get("authors", {}), entry.get("commits", 0)
+    if head is None:
+        # No commits yet
+        authors, commits = {}, 0
+    elif entry.get("head") != head:
+        previous = entry.get("head")
+        if previous and is_ancestor(repo, previous, head):
+            new = {}
+            walked = count_authors(repo, [f"{previous}..{head}"], new)
+            for key, (name, count) in new.items():
+                if key in authors:
+                    # The new commits carry the most recent name
+                    authors[key] = [name, authors[key][1] + count]
+                else:
+                    authors[key] = [name, count]
+            commits += walked
+        else:
+            authors = {}
+            walked = commits = count_authors(repo, [head], authors)
+
+    tags = list_refs(common_dir(git_dir))
+    tags_key = _tags_key(tags, releases)
+    if entry.get("tags") == tags_key:
+        tag_list = entry.get("releases", [])
+    else:
+        tag_list = read_releases(repo, releases) if tags else []
+
+    if cache is not None and (entry.get("head") != head or entry.get("tags") != tags_key):
+        cache.put(repo, {"head": head, "authors": authors, "commits": commits, "tags": tags_key, "releases": tag_list})
+
+    top = sorted(authors.values(), key=lambda author: (-author[1], author[0].lower()))[:contributors]
+    return History(
+        [{"name": name, "commits": count} for name, count in top],
+        [{"tag": tag, "date": date} for tag, date in tag_list],
+        commits, walked
+    )
@@ -0,0 +1,253 @@
+"""
+Repository metadata read straight from a checkout's .git directory.
+
+The remote URL comes from .git/config and the branch and commit from HEAD,
+refs/ and packed-refs, so no git process is started: reading a checkout
+takes a few small file reads, which matters when thousands of checkouts are
+read in one run. Worktrees and submodules, whose .git is a file pointing to
+the real git directory, are followed.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+RepoMeta = namedtuple("RepoMeta", ["project_name", "username", "host", "remote", "url", "branch", "commit"])
+
+_SECTION = re.compile(r'\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_SCP_URL = re.compile(r"^(?:[^@/]+@)?([^:/]+):(?!//)(.+)$")
+_URL = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/]*@)?([^/:]*)(?::\d*)?(/.*)?$")
+# A Windows path such as C:\repos\x, which would otherwise read as host "C"
+_DRIVE = re.compile(r"^[A-Za-z]:(?:[\\/]|$)")
+
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def find_git_dir(repo):
+    """Return the git directory of a checkout, following a "gitdir:" file; None if there is none"""
+    dot_git = os.path.join(repo, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    text = _read(dot_git)
+    if text and text.startswith("gitdir:"):
+        git_dir = os.path.join(repo, text[len("gitdir:"):].strip())
+        if os.path.isdir(git_dir):
+            return os.path.normpath(git_dir)
+    return None
+
+
+def common_dir(git_dir):
+    """The directory holding config and shared refs; differs from git_dir in linked worktrees"""
+    text = _read(os.path.join(git_dir, "commondir"))
+    if text and text.strip():
+        return os.path.normpath(os.path.join(git_dir, text.strip()))
+    return git_dir
+
+
+def _unquote(value):
+    """Strip comments and quotes from a config value"""
+    out = []
+    quoted = False
+    i, n = 0, len(value)
+    while i < n:
+        c = value[i]
+        if c == "\\" and i + 1 < n:
+            i += 1
+            out.append({"n": "\n", "t": "\t"}.get(value[i], value[i]))
+        elif c == '"':
+            quoted = not quoted
+        elif c in "#;" and not quoted:
+            break
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out).strip()
+
+
+def parse_config(text):
+    """Parse git config text into {(section, subsection): {key: value}}.
+
+    Section and key names are lower-cased; subsections keep their case. A key
+    given twice keeps its last value.
+    """
+    sections = {}
+    current = sections.setdefault(("", None), {})
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            match = _SECTION.match(line)
+            if match is None:
+                current = {}
+                continue
+            name, subsection = match.group(1).lower(), match.group(2)
+            if subsection is None and "." in name:
+                # Old-style [section.subsection]
+                name, subsection = name.split(".", 1)
+            elif subsection is not None:
+                subsection = re.sub(r"\\(.)", r"\1", subsection)
+            current = sections.setdefault((name, subsection), {})
+            line = line[match.end():].strip()
+            if not line:
+                continue
+        key, equals, value = line.partition("=")
+        # A key without a value is a boolean true
+        current[key.strip().lower()] = _unquote(value) if equals else "true"
+    return sections
+
+
+def parse_remote_url(url):
+    """Split a remote URL into (host, owner, repository name); parts that are not known are empty.
+
+    Credentials in the URL are dropped. The owner is everything before the
+    repository name, so GitLab subgroups come back as "group/subgroup".
+    Local remotes (paths, Windows drive paths and file:// URLs) have no host
+    or owner.
+    """
+    url = url.strip()
+    local = _DRIVE.match(url) or url[:5].lower() == "file:"
+    match = None if local else _URL.match(url)
+    if match:
+        host, path = match.group(1), match.group(2) or ""
+    elif local:
+        host, path = "", url
+    else:
+        match = _SCP_URL.match(url)
+        if match and not os.path.isabs(url):
+            host, path = match.group(1), match.group(2)
+        else:
+            # A local path
+            host, path = "", url
+    path = path.replace("\\", "/").strip("/")
+    if path.endswith(".git"):
+        path = path[:-len(".git")]
+    owner, _, name = path.rstrip("/").rpartition("/")
+    if not host:
+        owner = ""
+    return host, owner, name
+
+
+def clean_url(url):
+    """The remote URL without the user and token of an HTTP(S) URL"""
+    return re.sub(r"^(https?://)[^@/]*@", r"\1", url.strip(), flags=re.I)
+
+
+def _packed_ref(git_dir, ref):
+    text = _read(os.path.join(git_dir, "packed-refs")) or ""
+    for line in text.splitlines():
+        if line.endswith(" " + ref) and not line.startswith(("#", "^")):
+            return line.split(" ", 1)[0]
+    return None
+
+
+def list_refs(git_dir, prefix="refs/tags/"):
+    """Return {ref name: object id} for the refs under prefix, loose refs overriding packed ones"""
+    refs = {}
+    text = _read(os.path.join(git_dir, "packed-refs")) or ""
+    for line in text.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        object_id, _, ref = line.partition(" ")
+        if ref.startswith(prefix):
+            refs[ref] = object_id
+    top = os.path.join(git_dir, *prefix.rstrip("/").split("/"))
+    for directory, _, names in os.walk(top):
+        for name in names:
+            path = os.path.join(directory, name)
+            object_id = (_read(path) or "").strip()
+            if object_id:
+                refs[prefix + os.path.relpath(path, top).replace(os.sep, "/")] = object_id
+    return refs
+
+
+def resolve_ref(git_dir, ref, common=None):
+    """Return the commit a ref points to, following symbolic refs; None if it does not exist yet"""
+    common = common or git_dir
+    for _ in range(5):
+        text = None
+        for directory in (git_dir, common):
+            text = _read(os.path.join(directory, ref))
+            if text is not None:
+                break
+        if text is None:
+            return _packed_ref(common, ref)
+        text = text.strip()
+        if not text.startswith("ref:"):
+            return text or None
+        ref = text[len("ref:"):].strip()
+    return None
+
+
+def _remote_name(config, branch):
+    """The branch's upstream remote, else origin, else the first remote configured"""
+    remotes = [subsection for (section, subsection), values in config.items() if section == "remote" and values.get("url")]
+    upstream = config.get(("branch", branch), {}).get("remote") if branch else None
+    for name in (upstream, "origin"):
+        if name in remotes:
+            return name
+    return remotes[0] if remotes else None
+
+
+def read_metadata(repo):
+    """Return the RepoMeta of the checkout at repo, or None if it is not a git checkout.
+
+    Without a remote, the project name is the checkout's directory name and
+    the username is empty.
+    """
+    git_dir = find_git_dir(repo)
+    if git_dir is None:
+        return None
+    common = common_dir(git_dir)
+    config = parse_config(_read(os.path.join(common, "config")) or "")
+
+    head = (_read(os.path.join(git_dir, "HEAD")) or "").strip()
+    if head.startswith("ref:"):
+        ref = head[len("ref:"):].strip()
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ""
+        commit = resolve_ref(git_dir, ref, common)
+    else:
+        # Detached HEAD
+        branch, commit = "", head or None
+
+    remote = _remote_name(config, branch)
+    url = config[("remote", remote)]["url"] if remote else ""
+    host, owner, name = parse_remote_url(url) if url else ("", "", "")
+    if not name:
+        name = os.path.basename(os.path.abspath(repo).rstrip(os.sep))
+    return RepoMeta(name, owner, host, remote or "", clean_url(url), branch, commit)
+
+
+def basic_fields(meta):
+    """The project fields a RepoMeta provides, leaving out those it does not know"""
+    fields = {"project_name": meta.project_name, "username": meta.username}
+    return {field: value for field, value in fields.items() if value}
+
+
+def prefill(data, meta, overwrite=False):
+    """Fill the basic fields of a project dictionary from meta; returns the fields set.
+
+    Fields that already have a value are kept unless overwrite is True.
+    """
+    changed = []
+    for field, value in basic_fields(meta).items():
+        current = data.get(field)
+        if overwrite or not (isinstance(current, str) and current.strip()):
+            if current != value:
+                data[field] = value
+                changed.append(field)
+    return changed
+
+
+def prefill_generator(generator, meta, overwrite=False):
+    """Like prefill, for the fields of a MarkdownGenerator"""
+    data = {field: generator.get_field(field) for field in basic_fields(meta)}
+    changed = prefill(data, meta, overwrite)
+    generator.set_data({field: data[field] for field in changed})
+    return changed
@@ -0,0 +1,274 @@
+"""
+Language statistics for the languages section, in the style of GitHub's linguist.
+
+Every file is attributed to a language by its name or extension and counted
+by its size in bytes; data and prose formats (JSON, YAML, Markdown, ...) are
+not counted. Directories are listed one level at a time on a thread pool with
+the .gitignore handling of tree_scanner, and vendored and minified files are
+left out. Sizes come from the directory listing, so a file is only opened when
+its name does not decide its language: scripts without an extension, C
+headers and JavaScript or CSS that may be minified. What was found in those
+files is cached by path, size and mtime, so a rerun only opens files that
+changed.
+"""
+
+import json
+import os
+import re
+import stat
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from file_output import write_if_changed
+from tree_cache import RACY_NS
+from tree_scanner import IgnoreRules, is_ignored, root_levels
+
+# Bump to invalidate existing cache files
+STATS_VERSION = 1
+
+# Vendored dependencies and build output, as gitignore patterns
+DEFAULT_EXCLUDE = (
+    "node_modules/", "bower_components/", "vendor/", "third_party/", ".venv/", "venv/", ".tox/",
+    "site-packages/", "dist/", "*.min.js", "*.min.css", "*.bundle.js"
+)
+
+EXTENSIONS = {
+    ".py": "Python", ".pyw": "Python", ".pyx": "Cython", ".ipynb": "Jupyter Notebook",
+    ".js": "JavaScript", ".mjs": "JavaScript", ".cjs": "JavaScript", ".jsx": "JavaScript",
+    ".ts": "TypeScript", ".tsx": "TypeScript", ".mts": "TypeScript", ".cts": "TypeScript",
+    ".vue": "Vue", ".svelte": "Svelte",
+    ".html": "HTML", ".htm": "HTML", ".css": "CSS", ".scss": "SCSS", ".sass": "Sass", ".less": "Less",
+    ".c": "C", ".h": "C", ".cc": "C++", ".cpp": "C++", ".cxx": "C++", ".hh": "C++", ".hpp": "C++", ".hxx": "C++",
+    ".m": "Objective-C", ".mm": "Objective-C++", ".cs": "C#", ".fs": "F#", ".vb": "Visual Basic .NET",
+    ".java": "Java", ".kt": "Kotlin", ".kts": "Kotlin", ".scala": "Scala", ".groovy": "Groovy", ".gradle": "Groovy",
+    ".clj": "Clojure", ".cljs": "Clojure",
+    ".go": "Go", ".rs": "Rust", ".swift": "Swift", ".dart": "Dart", ".zig": "Zig", ".nim": "Nim",
+    ".rb": "Ruby", ".erb": "HTML+ERB", ".php": "PHP", ".pl": "Perl", ".pm": "Perl", ".lua": "Lua", ".r": "R",
+    ".jl": "Julia", ".ex": "Elixir", ".exs": "Elixir", ".erl": "Erlang", ".hs": "Haskell", ".ml": "OCaml",
+    ".elm": "Elm", ".sh": "Shell", ".bash": "Shell", ".zsh": "Shell", ".fish": "Shell", ".ps1": "PowerShell",
+    ".bat": "Batchfile", ".cmd": "Batchfile", ".sql": "SQL", ".proto": "Protocol Buffer",
+    ".tf": "HCL", ".hcl": "HCL", ".nix": "Nix", ".cmake": "CMake", ".mk": "Makefile",
+    ".sol": "Solidity", ".asm": "Assembly", ".s": "Assembly", ".f90": "Fortran", ".pas": "Pascal",
+    ".tex": "TeX", ".glsl": "GLSL", ".hlsl": "HLSL", ".cu": "Cuda",
+}
+
+FILENAMES = {
+    "Dockerfile": "Dockerfile", "Containerfile": "Dockerfile", "Makefile": "Makefile", "GNUmakefile": "Makefile",
+    "CMakeLists.txt": "CMake", "Rakefile": "Ruby", "Gemfile": "Ruby", "Jenkinsfile": "Groovy",
+    "Vagrantfile": "Ruby", "Justfile": "Just", "BUILD": "Starlark", "BUILD.bazel": "Starlark",
+}
+
+# Interpreters named on a #! line, without their version suffix
+INTERPRETERS = {
+    "python": "Python", "node": "JavaScript", "nodejs": "JavaScript", "deno": "TypeScript", "bun": "TypeScript",
+    "sh": "Shell", "bash": "Shell", "zsh": "Shell", "dash": "Shell", "ksh": "Shell", "fish": "Shell",
+    "ruby": "Ruby", "perl": "Perl", "php": "PHP", "lua": "Lua", "Rscript": "R", "pwsh": "PowerShell",
+    "tclsh": "Tcl", "awk": "Awk", "gawk": "Awk", "julia": "Julia", "elixir": "Elixir", "escript": "Erlang",
+}
+
+# Bytes read from a file whose language depends on its content
+SNIFF_BYTES = 8192
+SHEBANG_BYTES = 256
+
+# JavaScript and CSS with longer lines on average are taken to be minified
+MINIFIED_LINE_LENGTH = 110
+
+_CPP_HEADER = re.compile(rb"^\s*(?:class\s+\w+\s*[:{]|namespace\b|template\s*<|#include\s*<(?:iostream|string|vector|map|memory)>)|std::", re.M)
+_OBJC_HEADER = re.compile(rb"^\s*(?:@interface|@protocol|@end|#import)\b", re.M)
+_VERSION_SUFFIX = re.compile(r"[0-9.]+$")
+
+LanguageStats = namedtuple("LanguageStats", ["bytes", "files", "opened", "cached"])
+
+
+def interpreter_language(line):
+    """Return the language of the interpreter on a #! line (without the #!), or None"""
+    words = line.decode("utf-8", errors="replace").split()
+    if words and os.path.basename(words[0]) == "env":
+        # Skip env's own options, as in "#!/usr/bin/env -S python3 -u"
+        words = [word for word in words[1:] if not word.startswith("-")]
+    if not words:
+        return None
+    return INTERPRETERS.get(_VERSION_SUFFIX.sub("", os.path.basename(words[0])))
+
+
+def sniff(head, extension):
+    """Decide the language of a file from its first bytes; None leaves it uncounted"""
+    if extension == ".h":
+        if _OBJC_HEADER.search(head):
+            return "Objective-C"
+        return "C++" if _CPP_HEADER.search(head) else "C"
+    if extension in (".js", ".css"):
+        if len(head) / (head.count(b"\n") + 1) > MINIFIED_LINE_LENGTH:
+            return None
+        return EXTENSIONS[extension]
+    if head.startswith(b"#!"):
+        end = head.find(b"\n")
+        return interpreter_language(head[2:end if end >= 0 else len(head)])
+    return None
+
+
+def _needs_sniffing(extension):
+    return not extension or extension in (".h", ".js", ".css")
+
+
+class StatsCache:
+    """Languages of opened files keyed by relative path, size and mtime, optionally persisted as JSON"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.root = None
+        # relative path -> [size, mtime_ns, language or None]
+        self.files = {}
+        self.seen = {}
+        self.started = 0
+        self.changed = False
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict) and data.get("version") == STATS_VERSION:
+                    self.root = data.get("root")
+                    self.files = data.get("files", {})
+            except (FileNotFoundError, ValueError):
+                pass
+
+    def start(self, root):
+        """Begin a scan of root; entries of another root are dropped"""
+        if root != self.root:
+            self.root = root
+            self.files = {}
+        self.seen = {}
+        self.started = time.time_ns()
+
+    def get(self, rel, size, mtime):
+        """Return the stored entry while the file is unchanged, otherwise None"""
+        entry = self.files.get(rel)
+        if entry is not None and entry[0] == size and entry[1] == mtime:
+            self.seen[rel] = entry
+            return entry
+        return None
+
+    def put(self, rel, size, mtime, language):
+        # Files modified this recently are not stored: a change within the same mtime tick would go unnoticed
+        if self.started - mtime > RACY_NS:
+            self.seen[rel] = [size, mtime, language]
+            self.changed = True
+
+    def finish(self):
+        """End a scan; files that were not seen are dropped"""
+        if self.seen.keys() != self.files.keys():
+            self.changed = True
+        self.files = self.seen
+        self.seen = {}
+
+    def save(self):
+        """Write the cache file; returns False when it did not change"""
+        if not self.path or not self.changed:
+            return False
+        data = {"version": STATS_VERSION, "root": self.root, "files": self.files}
+        self.changed = False
+        return write_if_changed(self.path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def count_directory(path, rel, levels, cache=None):
+    """Count the bytes per language of the files in one directory.
+
+    Returns ({language: bytes}, directories, ignore levels for its children,
+    (files counted, files opened, cache hits)). Symbolic links are skipped.
+    """
+    try:
+        with os.scandir(path) as iterator:
+            entries = []
+            for entry in iterator:
+                try:
+                    entries.append((entry.name, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    pass
+    except OSError:
+        return {}, [], levels, (0, 0, 0)
+
+    for name, info in entries:
+        if name == ".gitignore" and stat.S_ISREG(info.st_mode):
+            levels = levels + (IgnoreRules.from_file(os.path.join(path, name), rel),)
+            break
+
+    totals = {}
+    directories = []
+    counted = opened = cached = 0
+    for name, info in entries:
+        mode = info.st_mode
+        if stat.S_ISDIR(mode):
+            if not is_ignored(levels, name, rel + name, True):
+                directories.append(name)
+            continue
+        if not stat.S_ISREG(mode):
+            continue
+
+        language = FILENAMES.get(name)
+        if language is None:
+            extension = os.path.splitext(name)[1].lower()
+            language = EXTENSIONS.get(extension)
+            if language is None and extension:
+                continue
+            if _needs_sniffing(extension):
+                if is_ignored(levels, name, rel + name, False):
+                    continue
+                entry = cache.get(rel + name, info.st_size, info.st_mtime_ns) if cache is not None else None
+                if entry is not None:
+                    cached += 1
+                    language = entry[2]
+                else:
+                    try:
+                        with open(os.path.join(path, name), "rb") as file:
+                            head = file.read(SNIFF_BYTES if extension else SHEBANG_BYTES)
+                    except OSError:
+                        continue
+                    opened += 1
+                    language = sniff(head, extension)
+                    if cache is not None:
+                        cache.put(rel + name, info.st_size, info.st_mtime_ns, language)
+                if language is None:
+                    continue
+                totals[language] = totals.get(language, 0) + info.st_size
+                counted += 1
+                continue
+        # Checked last: most files are ruled out by their extension more cheaply
+        if is_ignored(levels, name, rel + name, False):
+            continue
+        totals[language] = totals.get(language, 0) + info.st_size
+        counted += 1
+    return totals, directories, levels, (counted, opened, cached)
+
+
+def language_stats(root, workers=None, cache=None, exclude=DEFAULT_EXCLUDE):
+    """Count the bytes per language of the repository at root; cache is an optional StatsCache"""
+    root = os.path.abspath(root)
+    if cache is not None:
+        cache.start(root)
+    totals = {}
+    counted = opened = cached = 0
+    pending = [(root, "", root_levels(root, exclude))]
+
+    with ThreadPoolExecutor(workers) as pool:
+        while pending:
+            results = pool.map(lambda job: count_directory(*job, cache), pending)
+            next_pending = []
+            for (path, rel, _), (found, directories, levels, numbers) in zip(pending, results):
+                for language, size in found.items():
+                    totals[language] = totals.get(language, 0) + size
+                counted += numbers[0]
+                opened += numbers[1]
+                cached += numbers[2]
+                next_pending.extend((os.path.join(path, name), rel + name + "/", levels) for name in directories)
+            pending = next_pending
+
+    if cache is not None:
+        cache.finish()
+    return LanguageStats(totals, counted, opened, cached)
+
+
+def field_value(totals):
+    """Return {language: bytes} in the project's languages format, largest first"""
+    ordered = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    return [{"name": name, "bytes": size} for name, size in ordered]
@@ -0,0 +1,1257 @@
+"""
+Compiled section plans for the README templates.
+
+Every template is compiled once, at import time, into a tuple of sections.
+Static sections carry their precomputed text; dynamic sections carry a small
+renderer that receives a normalized ProjectView and returns the section text,
+or None when the section is omitted. Rendering a template is then a single
+pass over its plan followed by one join.
+"""
+
+import time
+from operator import attrgetter, itemgetter
+
+from project_model import TEXT_FIELDS
+
+
+# Text fields are stripped once when the view is built; list fields are already tuples
+_get_text_fields = attrgetter(*TEXT_FIELDS)
+_get_list_fields = attrgetter("features", "Prerequisites", "envvars", "tech", "languages", "contributors", "releases")
+
+
+class ProjectView:
+    """Normalized, read-only view of a ProjectData used by section renderers"""
+
+    __slots__ = (
+        "project_name", "username", "concisedesc", "overview", "logo", "demo_gif",
+        "screenshot1", "screenshot2", "license", "contact", "file_structure", "usage_code",
+        "features", "prerequisites", "envvars", "tech", "languages", "contributors", "releases"
+    )
+
+    def __init__(self, project):
+        (self.project_name, self.username, self.concisedesc, self.overview, self.logo, self.demo_gif,
+         self.screenshot1, self.screenshot2, self.license, self.contact, self.file_structure,
+         self.usage_code) = map(str.strip, _get_text_fields(project))
+        (self.features, self.prerequisites, self.envvars, self.tech, self.languages, self.contributors,
+         self.releases) = _get_list_fields(project)
+
+
+class Section:
+    """One step of a compiled template plan"""
+
+    __slots__ = ("name", "text", "render", "fields", "stamp")
+
+    def __init__(self, name, text=None, render=None, fields=()):
+        self.name = name
+        self.text = text
+        self.render = render
+        self.fields = fields
+        # Reads the versions of the input fields, used to validate cached output
+        self.stamp = itemgetter(*fields) if fields else None
+
+    @property
+    def is_static(self):
+        return self.render is None
+
+
+def static(name, *lines):
+    """A section whose text never changes"""
+    return Section(name, text="\n".join(lines))
+
+
+def dynamic(name, fields, render):
+    """A section rendered from the given project fields"""
+    return Section(name, render=render, fields=tuple(fields))
+
+
+def _join(*lines):
+    return "\n".join(lines)
+
+
+def _items(prefix, items, suffix=""):
+    """Render one line per item as prefix + item + suffix with a single join"""
+    separator = suffix + "\n" + prefix
+    try:
+        return prefix + separator.join(items) + suffix
+    except TypeError:
+        # Non-string items (numbers from hand-written JSON) are formatted like f-strings would
+        return prefix + separator.join(map(str, items)) + suffix
+
+
+# Languages below this share of the total are folded into "Other"
+_LANGUAGE_MIN_SHARE = 0.001
+_LANGUAGE_BAR_WIDTH = 20
+
+
+def _language_shares(languages):
+    """Return (name, bytes, share) rows, largest first, or None when nothing was counted"""
+    total = sum(language.bytes for language in languages)
+    if not total:
+        return None
+    rows = []
+    other = 0
+    for language in sorted(languages, key=attrgetter("bytes"), reverse=True):
+        if language.bytes / total < _LANGUAGE_MIN_SHARE:
+            other += language.bytes
+        else:
+            rows.append((language.name, language.bytes, language.bytes / total))
+    if other:
+        rows.append(("Other", other, other / total))
+    return rows
+
+
+def _language_bar(share):
+    filled = round(share * _LANGUAGE_BAR_WIDTH)
+    return "█" * filled + "░" * (_LANGUAGE_BAR_WIDTH - filled)
+
+
+def _language_table(heading, languages):
+    """A language / share table with a text bar per language, or None when empty"""
+    rows = _language_shares(languages)
+    if not rows:
+        return None
+    lines = [f"| {name} | `{_language_bar(share)}` {share:.1%} |" for name, _, share in rows]
+    return heading + "\n\n| Language | Share |\n|----------|-------|\n" + "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Standard template
+# ---------------------------------------------------------------------------
+
+_STANDARD_USAGE_EXAMPLE = _join(
+    "\n## Usage\n",
+    "```javascript",
+    "// Import the module",
+    "import { MyComponent } from 'my-library';",
+    "",
+    "// Initialize",
+    "const instance = new MyComponent({",
+    "  name: 'Example',",
+    "  options: {",
+    "    debug: true,",
+    "    timeout: 1000",
+    "  }",
+    "});",
+    "",
+    "// Use the functionality",
+    "instance.doSomething();",
+    "const result = instance.processData([1, 2, 3]);",
+    "console.log(result);",
+    "```"
+)
+
+_STANDARD_STRUCTURE_EXAMPLE = _join(
+    "\n## Directory Structure\n",
+    "```",
+    "project-name/",
+    "├── .github/           # GitHub specific files (workflows, templates)",
+    "├── docs/              # Documentation files",
+    "├── src/               # Source code",
+    "│   ├── components/    # UI components (for frontend projects)",
+    "│   ├── utils/         # Utility functions",
+    "│   └── index.js       # Entry point",
+    "├── tests/             # Test files",
+    "├── .gitignore         # Git ignore file",
+    "├── LICENSE            # License file",
+    "├── package.json       # Project dependencies and scripts",
+    "└── README.md          # Project documentation (this file)",
+    "```"
+)
+
+_STANDARD_INSTALL_TAIL = _join(
+    "",
+    "# Install dependencies",
+    "npm install",
+    "# or",
+    "yarn install",
+    "# or",
+    "pip install -r requirements.txt",
+    "```"
+)
+
+_STANDARD_INSTALL_EXAMPLE = _join(
+    "\n## Installation",
+    "```bash",
+    "# Clone the repository",
+    "git clone https://github.com/username/project-name.git",
+    "",
+    "# Navigate to the project directory",
+    "cd project-name",
+    _STANDARD_INSTALL_TAIL
+)
+
+_STANDARD_FEATURES_EXAMPLE = _join(
+    "\n## Features\n",
+    "- **Feature 1**: Description",
+    "- **Feature 2**: Description",
+    "- **Feature 3**: Description"
+)
+
+_STANDARD_PREREQUISITES_EXAMPLE = _join(
+    "\n### Prerequisites",
+    "- **Node.js**: v14.0 or higher",
+    "- **npm/yarn**: Latest version recommended"
+)
+
+_STANDARD_ENVVARS_HEADER = _join(
+    "\n### Environment Variables\n",
+    "| Variable | Description | Default |",
+    "|----------|-------------|---------|"
+)
+
+_STANDARD_ENVVARS_EXAMPLE = _join(
+    _STANDARD_ENVVARS_HEADER,
+    "| `API_KEY` | Your API key | `null` |",
+    "| `DEBUG` | Enable debug mode | `false` |"
+)
+
+_STANDARD_TECHNOLOGIES_EXAMPLE = _join(
+    "\n## Technologies Used\n",
+    "<p align=\"center\">",
+    "<img src=\"https://img.shields.io/badge/JavaScript-%23F7DF1E.svg?style=for-the-badge&logo=javascript&logoColor=black\" alt=\"JavaScript\">",
+    "<img src=\"https://img.shields.io/badge/TypeScript-%23007ACC.svg?style=for-the-badge&logo=typescript&logoColor=white\" alt=\"TypeScript\">",
+    "<img src=\"https://img.shields.io/badge/React-%2361DAFB.svg?style=for-the-badge&logo=react&logoColor=black\" alt=\"React\">",
+    "</p>"
+)
+
+
+def _standard_title(view):
+    return f"# {view.project_name}" if view.project_name else "# Project Title"
+
+
+def _standard_logo(view):
+    logo = view.logo or "path/to/logo.png"
+    return f"\n<p align=\"center\">\n  <img src=\"{logo}\" alt=\"Project Logo\" width=\"200\" height=\"200\">\n</p>"
+
+
+def _standard_badges(view):
+    project_name = view.project_name
+    if not project_name:
+        return None
+    repo = f"{view.username or 'username'}/{project_name}"
+    return (
+        "\n<p align=\"center\">\n"
+        f"  <a href=\"https://github.com/{repo}/stargazers\"><img src=\"https://img.shields.io/github/stars/{repo}\" alt=\"Stars Badge\"/></a>\n"
+        f"  <a href=\"https://github.com/{repo}/network/members\"><img src=\"https://img.shields.io/github/forks/{repo}\" alt=\"Forks Badge\"/></a>\n"
+        f"  <a href=\"https://github.com/{repo}/pulls\"><img src=\"https://img.shields.io/github/issues-pr/{repo}\" alt=\"Pull Requests Badge\"/></a>\n"
+        f"  <a href=\"https://github.com/{repo}/issues\"><img src=\"https://img.shields.io/github/issues/{repo}\" alt=\"Issues Badge\"/></a>\n"
+        f"  <a href=\"https://github.com/{repo}/graphs/contributors\"><img alt=\"GitHub contributors\" src=\"https://img.shields.io/github/contributors/{repo}?color=2b9348\"></a>\n"
+        "</p>"
+    )
+
+
+def _standard_description(view):
+    if not view.concisedesc:
+        return None
+    return f"\n<p align=\"center\">\n  <b>{view.concisedesc}</b>\n</p>"
+
+
+def _standard_overview(view):
+    return "\n\n## Overview\n\n" + (view.overview or "Add your project overview here...")
+
+
+def _standard_features(view):
+    if view.features:
+        return "\n## Features\n\n" + _items("- **", view.features, "**")
+    return _STANDARD_FEATURES_EXAMPLE
+
+
+def _standard_demo(view):
+    demo_gif = view.demo_gif or "path/to/demo.gif"
+    return f"\n\n## Demo\n\n<p align=\"center\">\n  <img src=\"{demo_gif}\" alt=\"Demo\" width=\"600\">\n</p>"
+
+
+def _standard_screenshots(view):
+    screenshot1 = view.screenshot1 or "path/to/screenshot1.png"
+    screenshot2 = view.screenshot2 or "path/to/screenshot2.png"
+    return f"\n## Screenshot\n![Screenshot 1]({screenshot1})\n![Screenshot 2]({screenshot2})"
+
+
+def _standard_installation(view):
+    project_name = view.project_name
+    if not project_name:
+        return _STANDARD_INSTALL_EXAMPLE
+    return (
+        "\n## Installation\n"
+        "```bash\n"
+        "# Clone the repository\n"
+        f"git clone https://github.com/{view.username or 'username'}/{project_name}.git\n"
+        "\n"
+        "# Navigate to the project directory\n"
+        f"cd {project_name}\n" + _STANDARD_INSTALL_TAIL
+    )
+
+
+def _standard_prerequisites(view):
+    if view.prerequisites:
+        return "\n### Prerequisites\n" + _items("- **", view.prerequisites, "**")
+    return _STANDARD_PREREQUISITES_EXAMPLE
+
+
+def _standard_usage(view):
+    if view.usage_code:
+        return f"\n## Usage\n\n```javascript\n{view.usage_code}\n```"
+    return _STANDARD_USAGE_EXAMPLE
+
+
+def _standard_envvars(view):
+    if view.envvars:
+        rows = [f"| `{envvar.name}` | {envvar.desc} | `{envvar.value}` |" for envvar in view.envvars]
+        return _STANDARD_ENVVARS_HEADER + "\n" + "\n".join(rows)
+    return _STANDARD_ENVVARS_EXAMPLE
+
+
+def _standard_structure(view):
+    if view.file_structure:
+        return f"\n## Directory Structure\n\n```\n{view.file_structure}\n```"
+    return _STANDARD_STRUCTURE_EXAMPLE
+
+
+def _standard_technologies(view):
+    if not view.tech:
+        return _STANDARD_TECHNOLOGIES_EXAMPLE
+    icons = _items("<img src=\"https://skillicons.dev/icons?i=", [technology.lower() for technology in view.tech], "\">")
+    return "\n## Technologies Used\n\n<p align=\"center\">\n" + icons + "\n</p>"
+
+
+def _standard_languages(view):
+    return _language_table("\n## Languages", view.languages)
+
+
+def _release_link(view, tag):
+    """A tag linked to its GitHub release page when the repository is known"""
+    if not view.project_name:
+        return tag
+    return f"[{tag}](https://github.com/{view.username or 'username'}/{view.project_name}/releases/tag/{tag})"
+
+
+def _standard_releases(view):
+    if not view.releases:
+        return None
+    rows = [f"| {_release_link(view, release.tag)} | {release.date} |" for release in view.releases]
+    return "\n## Releases\n\n| Version | Date |\n|---------|------|\n" + "\n".join(rows)
+
+
+def _standard_contributors(view):
+    if not view.contributors:
+        return None
+    rows = [f"| {contributor.name} | {contributor.commits:,} |" for contributor in view.contributors]
+    return "\n## Contributors\n\n| Contributor | Commits |\n|-------------|---------|\n" + "\n".join(rows)
+
+
+def _standard_license(view):
+    return f"\n## License\n\nThis project is licensed under the {view.license} License."
+
+
+def _standard_contact(view):
+    contact = view.contact or "Your Name - [@your_twitter](https://twitter.com/your_twitter) - your_email@example.com"
+    return f"\n## Contact\n\n{contact}"
+
+
+STANDARD_PLAN = (
+    dynamic("title", ["project_name"], _standard_title),
+    dynamic("logo", ["logo"], _standard_logo),
+    dynamic("badges", ["project_name", "username"], _standard_badges),
+    dynamic("description", ["concisedesc"], _standard_description),
+    static(
+        "navigation",
+        "\n<p align=\"center\">",
+        "  <a href=\"#features\">Features</a> •",
+        "  <a href=\"#demo\">Demo</a> •",
+        "  <a href=\"#installation\">Installation</a> •",
+        "  <a href=\"#usage\">Usage</a> •",
+        "  <a href=\"#configuration\">Configuration</a> •",
+        "  <a href=\"#api-reference\">API Reference</a> •",
+        "  <a href=\"#documentation\">Documentation</a> •",
+        "  <a href=\"#roadmap\">Roadmap</a> •",
+        "  <a href=\"#contributing\">Contributing</a> •",
+        "  <a href=\"#license\">License</a> •",
+        "  <a href=\"#contact\">Contact</a> •",
+        "  <a href=\"#acknowledgments\">Acknowledgments</a>",
+        "</p>"
+    ),
+    dynamic("overview", ["overview"], _standard_overview),
+    dynamic("features", ["features"], _standard_features),
+    dynamic("demo", ["DemoGif"], _standard_demo),
+    dynamic("screenshots", ["screenshot1", "screenshot2"], _standard_screenshots),
+    dynamic("installation", ["project_name", "username"], _standard_installation),
+    dynamic("prerequisites", ["Prerequisites"], _standard_prerequisites),
+    dynamic("usage", ["usage_code"], _standard_usage),
+    static(
+        "configuration",
+        "\n## Configuration\n",
+        "### Configuration File\n",
+        "Create a `config.json` file in the root directory with the following structure:\n",
+        "```json",
+        "nth",
+        "```"
+    ),
+    dynamic("envvars", ["envvars"], _standard_envvars),
+    dynamic("structure", ["file_structure"], _standard_structure),
+    dynamic("technologies", ["tech"], _standard_technologies),
+    dynamic("languages", ["languages"], _standard_languages),
+    dynamic("releases", ["releases", "project_name", "username"], _standard_releases),
+    static(
+        "contributing",
+        "\n## Contributing\n",
+        "Contributions are what make the open source community such an amazing place to learn, inspire, and create. Any contributions you make are **greatly appreciated**.\n",
+        "1. Fork the Project",
+        "2. Create your Feature Branch (`git checkout -b feature/AmazingFeature`)",
+        "3. Commit your Changes (`git commit -m 'Add some AmazingFeature'`)",
+        "4. Push to the Branch (`git push origin feature/AmazingFeature`)",
+        "5. Open a Pull Request\n",
+        "Please make sure to update tests as appropriate and adhere to the [code of conduct](CODE_OF_CONDUCT.md)."
+    ),
+    dynamic("contributors", ["contributors"], _standard_contributors),
+    dynamic("license", ["license"], _standard_license),
+    dynamic("contact", ["contact"], _standard_contact),
+    static(
+        "footer",
+        "\n---\n",
+        "<p align=\"center\">",
+        "  Made with ❤️ by <a href=\"https://github.com/kushal1o1/MDFileCreator\">MdCreator</a>",
+        "</p>"
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Minimalist template
+# ---------------------------------------------------------------------------
+
+_MINIMALIST_USAGE_EXAMPLE = _join(
+    "\n## Usage",
+    "\n```javascript",
+    "// Simple usage example",
+    "import { project } from 'project-name';",
+    "",
+    "project.init();",
+    "project.run();",
+    "```"
+)
+
+_MINIMALIST_STRUCTURE_EXAMPLE = _join(
+    "\n## Structure",
+    "\n```",
+    "project-name/",
+    "├── src/           # Source code",
+    "├── test/          # Tests",
+    "├── LICENSE        # License",
+    "├── package.json   # Dependencies",
+    "└── README.md      # This file",
+    "```"
+)
+
+
+def _minimalist_description(view):
+    return f"\n> {view.concisedesc}" if view.concisedesc else None
+
+
+def _minimalist_overview(view):
+    return f"\n{view.overview}" if view.overview else None
+
+
+def _minimalist_demo(view):
+    return f"\n![Demo]({view.demo_gif})" if view.demo_gif else None
+
+
+def _minimalist_features(view):
+    if not view.features:
+        return None
+    return "\n## Features\n" + _items("- ", view.features)
+
+
+def _minimalist_installation(view):
+    project_name = view.project_name
+    if not project_name:
+        return "\n## Installation\n```bash\ngit clone https://github.com/username/project.git\ncd project\n```"
+    return f"\n## Installation\n```bash\ngit clone https://github.com/{view.username or 'username'}/{project_name}.git\ncd {project_name}\n```"
+
+
+def _minimalist_usage(view):
+    if view.usage_code:
+        return f"\n## Usage\n\n```\n{view.usage_code}\n```"
+    return _MINIMALIST_USAGE_EXAMPLE
+
+
+def _minimalist_structure(view):
+    if view.file_structure:
+        return f"\n## Structure\n\n```\n{view.file_structure}\n```"
+    return _MINIMALIST_STRUCTURE_EXAMPLE
+
+
+def _minimalist_license(view):
+    return f"\n## License\n{view.license}"
+
+
+MINIMALIST_PLAN = (
+    dynamic("title", ["project_name"], _standard_title),
+    dynamic("description", ["concisedesc"], _minimalist_description),
+    dynamic("overview", ["overview"], _minimalist_overview),
+    dynamic("demo", ["DemoGif"], _minimalist_demo),
+    dynamic("features", ["features"], _minimalist_features),
+    dynamic("installation", ["project_name", "username"], _minimalist_installation),
+    dynamic("usage", ["usage_code"], _minimalist_usage),
+    dynamic("structure", ["file_structure"], _minimalist_structure),
+    dynamic("license", ["license"], _minimalist_license),
+    static(
+        "footer",
+        "\n---\n",
+        "Made with ❤️ by [MdCreator](https://github.com/kushal1o1/MDFileCreator)"
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Modern template
+# ---------------------------------------------------------------------------
+
+_MODERN_USAGE_EXAMPLE = _join(
+    "\n## 📖 Usage",
+    "\n```javascript",
+    "// Modern usage example with async/await",
+    "import { createApp } from 'project-name';",
+    "",
+    "const app = createApp({",
+    "  theme: 'dark',",
+    "  plugins: ['auth', 'router']",
+    "});",
+    "",
+    "async function start() {",
+    "  await app.initialize();",
+    "  app.render('#app');",
+    "}",
+    "",
+    "start().catch(console.error);",
+    "```"
+)
+
+_MODERN_STRUCTURE_EXAMPLE = _join(
+    "\n## 📁 Project Structure",
+    "\n```",
+    "project-name/",
+    "├── public/          # Static assets",
+    "├── src/             # Source code",
+    "│   ├── components/  # UI components",
+    "│   ├── hooks/       # Custom hooks",
+    "│   ├── pages/       # Page components",
+    "│   ├── utils/       # Utility functions",
+    "│   └── main.js      # Entry point",
+    "├── tests/           # Test suite",
+    "└── package.json     # Dependencies",
+    "```"
+)
+
+_MODERN_ENVVARS_HEADER = _join(
+    "\n## ⚙️ Configuration",
+    "\n### Environment Variables",
+    "\n| Variable | Description | Default |",
+    "|----------|-------------|---------|"
+)
+
+
+def _modern_header(view):
+    project_name = view.project_name or "Project Title"
+    if view.logo:
+        return f"<div align=\"center\">\n\n  <img src=\"{view.logo}\" alt=\"logo\" width=\"200\" height=\"auto\" />\n  <h1>{project_name}</h1>"
+    return f"<div align=\"center\">\n  <h1>{project_name}</h1>"
+
+
+def _modern_badges(view):
+    return (
+        "  <p>\n"
+        "    <img src=\"https://img.shields.io/badge/version-1.0.0-blue?style=for-the-badge\" alt=\"version\" />\n"
+        f"    <img src=\"https://img.shields.io/github/license/{view.username or 'username'}/{view.project_name or 'Project Title'}?style=for-the-badge\" alt=\"license\" />\n"
+        "  </p>"
+    )
+
+
+def _modern_description(view):
+    if view.concisedesc:
+        return f"\n  <p><em>{view.concisedesc}</em></p>\n\n</div>"
+    return "\n</div>"
+
+
+def _modern_demo(view):
+    if not view.demo_gif:
+        return None
+    return f"\n<div align=\"center\">\n  <img src=\"{view.demo_gif}\" alt=\"demo\" />\n</div>"
+
+
+def _modern_overview(view):
+    if view.overview:
+        return f"\n## 📋 Overview\n\n{view.overview}"
+    return "\n## 📋 Overview"
+
+
+def _modern_features(view):
+    if not view.features:
+        return "\n## ✨ Features"
+    return "\n## ✨ Features\n" + _items("\n- 🔸 **", view.features, "**")
+
+
+def _modern_screenshots(view):
+    screenshot1, screenshot2 = view.screenshot1, view.screenshot2
+    if not (screenshot1 or screenshot2):
+        return None
+    md = "\n## 📸 Screenshots"
+    if screenshot1:
+        md += f"\n\n<img src=\"{screenshot1}\" alt=\"Screenshot 1\" width=\"400\" />"
+    if screenshot2:
+        md += f"\n\n<img src=\"{screenshot2}\" alt=\"Screenshot 2\" width=\"400\" />"
+    return md
+
+
+def _modern_prerequisites(view):
+    if not view.prerequisites:
+        return "\n## 🚀 Getting Started\n\n### Prerequisites"
+    return "\n## 🚀 Getting Started\n\n### Prerequisites\n" + _items("- ", view.prerequisites)
+
+
+def _modern_installation(view):
+    repo_name = view.project_name or "Project Title"
+    return (
+        "\n### Installation\n"
+        "\n```bash\n"
+        f"git clone https://github.com/{view.username or 'username'}/{repo_name}.git\n"
+        f"cd {repo_name}\n"
+        "# Install dependencies\n"
+        "npm install  # or yarn install\n"
+        "```"
+    )
+
+
+def _modern_usage(view):
+    if view.usage_code:
+        return f"\n## 📖 Usage\n\n```\n{view.usage_code}\n```"
+    return _MODERN_USAGE_EXAMPLE
+
+
+def _modern_structure(view):
+    if view.file_structure:
+        return f"\n## 📁 Project Structure\n\n```\n{view.file_structure}\n```"
+    return _MODERN_STRUCTURE_EXAMPLE
+
+
+def _modern_envvars(view):
+    if not view.envvars:
+        return None
+    rows = [f"| `{envvar.name}` | {envvar.desc} | `{envvar.value}` |" for envvar in view.envvars]
+    return _MODERN_ENVVARS_HEADER + "\n" + "\n".join(rows)
+
+
+def _modern_technologies(view):
+    if not view.tech:
+        return None
+    badges = [
+        f"\n<img src=\"https://img.shields.io/badge/{technology}-%23007ACC.svg?style=for-the-badge&logo={technology}&logoColor=white\" alt=\"{technology}\" />"
+        for technology in view.tech
+    ]
+    return "\n## 🛠️ Technologies\n\n<div align=\"center\">\n" + "\n".join(badges) + "\n\n</div>"
+
+
+def _modern_languages(view):
+    return _language_table("\n## 📊 Languages", view.languages)
+
+
+def _modern_license(view):
+    return f"\n## 📝 License\n\nThis project is licensed under the {view.license} License."
+
+
+def _modern_contact(view):
+    return f"\n## 📬 Contact\n\n{view.contact}" if view.contact else None
+
+
+MODERN_PLAN = (
+    dynamic("header", ["project_name", "logo"], _modern_header),
+    dynamic("badges", ["project_name", "username"], _modern_badges),
+    dynamic("description", ["concisedesc"], _modern_description),
+    dynamic("demo", ["DemoGif"], _modern_demo),
+    dynamic("overview", ["overview"], _modern_overview),
+    dynamic("features", ["features"], _modern_features),
+    dynamic("screenshots", ["screenshot1", "screenshot2"], _modern_screenshots),
+    dynamic("prerequisites", ["Prerequisites"], _modern_prerequisites),
+    dynamic("installation", ["project_name", "username"], _modern_installation),
+    dynamic("usage", ["usage_code"], _modern_usage),
+    dynamic("structure", ["file_structure"], _modern_structure),
+    dynamic("envvars", ["envvars"], _modern_envvars),
+    dynamic("technologies", ["tech"], _modern_technologies),
+    dynamic("languages", ["languages"], _modern_languages),
+    dynamic("license", ["license"], _modern_license),
+    dynamic("contact", ["contact"], _modern_contact),
+    static(
+        "footer",
+        "\n---\n",
+        "<div align=\"center\">",
+        "  <p>Made with ❤️ by <a href=\"https://github.com/kushal1o1/MDFileCreator\">MdCreator</a></p>",
+        "</div>"
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Detailed template
+# ---------------------------------------------------------------------------
+
+_DETAILED_USAGE_EXAMPLE = _join(
+    "\n## Usage",
+    "\n```javascript",
+    "// Step 1: Import the library",
+    "const { Client } = require('project-name');",
+    "",
+    "// Step 2: Configure the client",
+    "const client = new Client({",
+    "  apiKey: process.env.API_KEY,",
+    "  timeout: 5000,",
+    "  debug: process.env.NODE_ENV === 'development'",
+    "});",
+    "",
+    "// Step 3: Use the client",
+    "async function main() {",
+    "  try {",
+    "    const result = await client.getData();",
+    "    console.log('Success:', result);",
+    "  } catch (error) {",
+    "    console.error('Error:', error.message);",
+    "  }",
+    "}",
+    "",
+    "main();",
+    "```",
+    "\nFor more advanced usage, refer to the [documentation](#documentation)."
+)
+
+_DETAILED_STRUCTURE_EXAMPLE = _join(
+    "\n## Project Structure",
+    "\n```",
+    "project-name/",
+    "├── bin/                       # Executable scripts",
+    "├── config/                    # Configuration files",
+    "│   ├── default.js             # Default configuration",
+    "│   └── production.js          # Production overrides",
+    "├── src/                       # Source code",
+    "│   ├── api/                   # API endpoints",
+    "│   ├── models/                # Data models",
+    "│   ├── services/              # Business logic",
+    "│   ├── utils/                 # Utility functions",
+    "│   └── index.js               # Entry point",
+    "├── tests/                     # Test files",
+    "│   ├── unit/                  # Unit tests",
+    "│   ├── integration/           # Integration tests",
+    "│   └── fixtures/              # Test fixtures",
+    "├── .dockerignore              # Docker ignore file",
+    "├── .env.example               # Example environment variables",
+    "├── .eslintrc.js               # ESLint configuration",
+    "├── .gitignore                 # Git ignore file",
+    "├── Dockerfile                 # Docker configuration",
+    "├── docker-compose.yml         # Docker Compose configuration",
+    "├── LICENSE                    # License file",
+    "├── package.json               # Dependencies and scripts",
+    "└── README.md                  # This documentation",
+    "```",
+    "\nThis structure follows industry best practices and supports scalability, maintainability, and testing."
+)
+
+_DETAILED_ENVVARS_HEADER = _join(
+    "\n## Configuration",
+    "\n### Environment Variables",
+    "\n| Variable | Description | Default | Required |",
+    "|----------|-------------|---------|----------|"
+)
+
+
+def _detailed_title(view):
+    return f"# {view.project_name or 'Project Title'}"
+
+
+def _detailed_badges(view):
+    repo = f"{view.username or 'username'}/{view.project_name or 'Project Title'}"
+    return (
+        f"\n[![License](https://img.shields.io/github/license/{repo})](https://github.com/{repo}/blob/main/LICENSE)\n"
+        f"[![Issues](https://img.shields.io/github/issues/{repo})](https://github.com/{repo}/issues)\n"
+        f"[![Pull Requests](https://img.shields.io/github/issues-pr/{repo})](https://github.com/{repo}/pulls)"
+    )
+
+
+def _detailed_about(view):
+    md = "\n## About"
+    if view.concisedesc:
+        md += f"\n\n**{view.concisedesc}**"
+    if view.overview:
+        md += f"\n\n{view.overview}"
+    return md
+
+
+def _detailed_demo(view):
+    return f"\n### Demo\n\n![Demo]({view.demo_gif})" if view.demo_gif else None
+
+
+def _detailed_features(view):
+    if not view.features:
+        return "\n## Features"
+    return "\n## Features\n" + _items("\n### ", view.features, "\n\nDetailed description of this feature would go here.")
+
+
+def _detailed_screenshots(view):
+    screenshot1, screenshot2 = view.screenshot1, view.screenshot2
+    if not (screenshot1 or screenshot2):
+        return None
+    md = "\n## Screenshots"
+    if screenshot1:
+        md += f"\n\n### Screenshot 1\n\n![Screenshot 1]({screenshot1})\n\nDescription of what the screenshot shows."
+    if screenshot2:
+        md += f"\n\n### Screenshot 2\n\n![Screenshot 2]({screenshot2})\n\nDescription of what the screenshot shows."
+    return md
+
+
+def _detailed_prerequisites(view):
+    if view.prerequisites:
+        return "\n## Installation\n\n### Prerequisites\n" + _items("- ", view.prerequisites)
+    return "\n## Installation\n\n### Prerequisites\n- List prerequisite 1\n- List prerequisite 2"
+
+
+def _detailed_installation(view):
+    repo_name = view.project_name or "Project Title"
+    return (
+        "\n### Step-by-step installation\n"
+        "\n```bash\n"
+        "# Clone the repository\n"
+        f"git clone https://github.com/{view.username or 'username'}/{repo_name}.git\n"
+        "\n"
+        "# Navigate to the project directory\n"
+        f"cd {repo_name}\n"
+        "\n"
+        "# Install dependencies\n"
+        "npm install\n"
+        "# or\n"
+        "yarn install\n"
+        "```"
+    )
+
+
+def _detailed_usage(view):
+    if view.usage_code:
+        return f"\n## Usage\n\n```\n{view.usage_code}\n```"
+    return _DETAILED_USAGE_EXAMPLE
+
+
+def _detailed_structure(view):
+    if view.file_structure:
+        return f"\n## Project Structure\n\n```\n{view.file_structure}\n```"
+    return _DETAILED_STRUCTURE_EXAMPLE
+
+
+def _detailed_envvars(view):
+    if not view.envvars:
+        return "\n## Configuration\n\n### Environment Variables\n\nList of environment variables would go here."
+    rows = [f"| `{envvar.name}` | {envvar.desc} | `{envvar.value}` | Yes/No |" for envvar in view.envvars]
+    return _DETAILED_ENVVARS_HEADER + "\n" + "\n".join(rows)
+
+
+def _detailed_technologies(view):
+    if not view.tech:
+        return "\n## Technologies"
+    items = [f"\n- **{technology}**: Description of how {technology} is used in the project." for technology in view.tech]
+    return "\n## Technologies\n" + "\n".join(items)
+
+
+def _detailed_languages(view):
+    rows = _language_shares(view.languages)
+    if not rows:
+        return None
+    items = [f"\n- **{name}**: {share:.1%} of the code ({size:,} bytes)" for name, size, share in rows]
+    return "\n## Languages\n" + "\n".join(items)
+
+
+def _detailed_releases(view):
+    if not view.releases:
+        return None
+    items = [f"\n- **{_release_link(view, release.tag)}** ({release.date})" for release in view.releases]
+    return "\n## Release History\n" + "\n".join(items)
+
+
+def _detailed_contributors(view):
+    if not view.contributors:
+        return None
+    items = [f"\n- **{contributor.name}**: {contributor.commits:,} commits" for contributor in view.contributors]
+    return "\n## Contributors\n" + "\n".join(items)
+
+
+def _detailed_license(view):
+    return f"\n## License\n\nThis project is licensed under the {view.license} License - see the [LICENSE](LICENSE) file for details."
+
+
+def _detailed_contact(view):
+    return "\n## Contact\n\n" + (view.contact or "Provide your contact information here.")
+
+
+DETAILED_PLAN = (
+    dynamic("title", ["project_name"], _detailed_title),
+    dynamic("badges", ["project_name", "username"], _detailed_badges),
+    static(
+        "toc",
+        "\n## Table of Contents",
+        "\n- [About](#about)",
+        "- [Features](#features)",
+        "- [Screenshots](#screenshots)",
+        "- [Installation](#installation)",
+        "- [Usage](#usage)",
+        "- [Project Structure](#project-structure)",
+        "- [Configuration](#configuration)",
+        "- [Technologies](#technologies)",
+        "- [License](#license)",
+        "- [Contact](#contact)"
+    ),
+    dynamic("about", ["concisedesc", "overview"], _detailed_about),
+    dynamic("demo", ["DemoGif"], _detailed_demo),
+    dynamic("features", ["features"], _detailed_features),
+    dynamic("screenshots", ["screenshot1", "screenshot2"], _detailed_screenshots),
+    dynamic("prerequisites", ["Prerequisites"], _detailed_prerequisites),
+    dynamic("installation", ["project_name", "username"], _detailed_installation),
+    dynamic("usage", ["usage_code"], _detailed_usage),
+    dynamic("structure", ["file_structure"], _detailed_structure),
+    dynamic("envvars", ["envvars"], _detailed_envvars),
+    dynamic("technologies", ["tech"], _detailed_technologies),
+    dynamic("languages", ["languages"], _detailed_languages),
+    dynamic("releases", ["releases", "project_name", "username"], _detailed_releases),
+    dynamic("license", ["license"], _detailed_license),
+    dynamic("contributors", ["contributors"], _detailed_contributors),
+    dynamic("contact", ["contact"], _detailed_contact),
+    static(
+        "footer",
+        "\n---\n",
+        "Made with ❤️ by [MdCreator](https://github.com/kushal1o1/MDFileCreator)"
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# Corporate template
+# ---------------------------------------------------------------------------
+
+_CORPORATE_STRUCTURE_EXAMPLE = _join(
+    "\n### Solution Architecture",
+    "\n```",
+    "enterprise-solution/",
+    "├── client/                    # Client-side implementation",
+    "│   ├── public/                # Static assets",
+    "│   └── src/                   # Client source code",
+    "├── server/                    # Server-side implementation",
+    "│   ├── api/                   # RESTful API endpoints",
+    "│   ├── auth/                  # Authentication services",
+    "│   ├── config/                # Configuration management",
+    "│   ├── database/              # Database integration",
+    "│   ├── middleware/            # Custom middleware",
+    "│   └── services/              # Business logic services",
+    "├── infrastructure/            # Infrastructure as code",
+    "│   ├── terraform/             # Terraform configurations",
+    "│   └── kubernetes/            # Kubernetes manifests",
+    "├── documentation/             # Comprehensive documentation",
+    "│   ├── admin/                 # Administrator guides",
+    "│   ├── api/                   # API documentation",
+    "│   └── user/                  # End-user documentation",
+    "├── scripts/                   # Utility scripts",
+    "│   ├── backup/                # Backup procedures",
+    "│   ├── migration/             # Data migration",
+    "│   └── monitoring/            # System monitoring",
+    "└── tests/                     # Automated test suite",
+    "    ├── integration/           # Integration tests",
+    "    ├── performance/           # Performance tests",
+    "    ├── security/              # Security tests",
+    "    └── unit/                  # Unit tests",
+    "```",
+    "\nThis enterprise-grade architecture ensures scalability, security, and maintainability while adhering to industry best practices."
+)
+
+_CORPORATE_USAGE_EXAMPLE = _join(
+    "\n### Operation Instructions",
+    "\n```javascript",
+    "// Enterprise Usage Example",
+    "const { EnterpriseSolution } = require('project-name');",
+    "",
+    "// Initialize with enterprise configuration",
+    "const solution = new EnterpriseSolution({",
+    "  licenseKey: process.env.ENTERPRISE_LICENSE_KEY,",
+    "  region: 'us-east-1',",
+    "  loggingLevel: 'INFO',",
+    "  securityProfile: 'high',",
+    "  redundancy: true",
+    "});",
+    "",
+    "// Connect to enterprise systems",
+    "solution.connect()",
+    "  .then(() => solution.provision({resources: ['database', 'storage', 'compute']})",
+    "  .then(() => console.log('Solution provisioned successfully'))",
+    "  .catch(error => console.error('Provisioning failed:', error.code));",
+    "```",
+    "\nRefer to the full documentation for additional operation procedures and advanced configuration options."
+)
+
+_CORPORATE_TECHNOLOGIES_HEADER = _join(
+    "\n## Technical Implementation",
+    "\n### Technologies Utilized",
+    "\n| Technology | Purpose |",
+    "|------------|---------|"
+)
+
+_CORPORATE_ENVVARS_HEADER = _join(
+    "\n### Configuration Parameters",
+    "\n| Parameter | Description | Default Value |",
+    "|-----------|-------------|---------------|"
+)
+
+
+def _corporate_title(view):
+    return f"# {view.project_name or 'Project Title'}\n\n---"
+
+
+def _corporate_summary(view):
+    return f"\n## Executive Summary\n\n{view.concisedesc}" if view.concisedesc else None
+
+
+def _corporate_overview(view):
+    return f"\n## Business Overview\n\n{view.overview}" if view.overview else None
+
+
+def _corporate_features(view):
+    if not view.features:
+        return "\n## Product Capabilities"
+    capabilities = [f"\n### {i}. {feature}" for i, feature in enumerate(view.features, 1)]
+    return "\n## Product Capabilities\n" + "\n".join(capabilities)
+
+
+def _corporate_screenshots(view):
+    screenshot1, screenshot2 = view.screenshot1, view.screenshot2
+    if not (screenshot1 or screenshot2):
+        return None
+    project_name = view.project_name or "Project Title"
+    md = "\n## Product Screenshots"
+    if screenshot1:
+        md += f"\n\n![{project_name} Interface]({screenshot1})"
+    if screenshot2:
+        md += f"\n\n![{project_name} Dashboard]({screenshot2})"
+    return md
+
+
+def _corporate_technologies(view):
+    if not view.tech:
+        return "\n## Technical Implementation"
+    rows = [f"| {technology} | Primary functionality for {technology} |" for technology in view.tech]
+    return _CORPORATE_TECHNOLOGIES_HEADER + "\n" + "\n".join(rows)
+
+
+def _corporate_languages(view):
+    rows = _language_shares(view.languages)
+    if not rows:
+        return None
+    lines = [f"| {name} | {size:,} | {share:.1%} |" for name, size, share in rows]
+    return "\n### Language Composition\n\n| Language | Bytes | Share |\n|----------|-------|-------|\n" + "\n".join(lines)
+
+
+def _corporate_structure(view):
+    if view.file_structure:
+        return f"\n### Solution Architecture\n\n```\n{view.file_structure}\n```"
+    return _CORPORATE_STRUCTURE_EXAMPLE
+
+
+def _corporate_installation(view):
+    repo_name = view.project_name or "Project Title"
+    return (
+        "\n## Implementation Guide\n"
+        "\n### Deployment Procedure\n"
+        "\n```bash\n"
+        f"git clone https://github.com/{view.username or 'organization'}/{repo_name}.git\n"
+        f"cd {repo_name}\n"
+        "# Installation steps\n"
+        "```"
+    )
+
+
+def _corporate_usage(view):
+    if view.usage_code:
+        return f"\n### Operation Instructions\n\n```\n{view.usage_code}\n```"
+    return _CORPORATE_USAGE_EXAMPLE
+
+
+def _corporate_envvars(view):
+    if not view.envvars:
+        return None
+    rows = [f"| {envvar.name} | {envvar.desc} | {envvar.value} |" for envvar in view.envvars]
+    return _CORPORATE_ENVVARS_HEADER + "\n" + "\n".join(rows)
+
+
+def _corporate_license(view):
+    return f"\n## Licensing Information\n\nThis software is provided under {view.license} license agreement."
+
+
+def _corporate_contact(view):
+    return "\n## Support Contact\n\n" + (view.contact or "For technical support, please contact our support team.")
+
+
+CORPORATE_PLAN = (
+    dynamic("title", ["project_name"], _corporate_title),
+    dynamic("summary", ["concisedesc"], _corporate_summary),
+    dynamic("overview", ["overview"], _corporate_overview),
+    dynamic("features", ["features"], _corporate_features),
+    dynamic("screenshots", ["project_name", "screenshot1", "screenshot2"], _corporate_screenshots),
+    dynamic("technologies", ["tech"], _corporate_technologies),
+    dynamic("languages", ["languages"], _corporate_languages),
+    dynamic("structure", ["file_structure"], _corporate_structure),
+    dynamic("installation", ["project_name", "username"], _corporate_installation),
+    dynamic("usage", ["usage_code"], _corporate_usage),
+    dynamic("envvars", ["envvars"], _corporate_envvars),
+    dynamic("license", ["license"], _corporate_license),
+    dynamic("contact", ["contact"], _corporate_contact),
+    static(
+        "footer",
+        "\n---",
+        "\n*This document is confidential and proprietary.*",
+        "\nGenerated with [MdCreator](https://github.com/kushal1o1/MDFileCreator)"
+    ),
+)
+
+
+class TemplatePlan:
+    """A template compiled into an ordered tuple of sections"""
+
+    def __init__(self, name, sections):
+        self.name = name
+        self.sections = tuple(sections)
+        # One callable per section; static text is returned as-is without re-rendering
+        self.renderers = tuple(
+            _constant(section.text) if section.is_static else section.render
+            for section in self.sections
+        )
+
+    def render(self, view):
+        """Run every section against a project view and join the output"""
+        return "\n".join(filter(None, [render(view) for render in self.renderers]))
+
+    def iter_render(self, view):
+        """Yield the output section by section; the chunks concatenate to render(view)"""
+        first = True
+        for render in self.renderers:
+            text = render(view)
+            if not text:
+                continue
+            if first:
+                first = False
+            else:
+                yield "\n"
+            yield text
+
+    def render_profiled(self, project, stats):
+        """Render without the section cache, recording every step into a SectionStats"""
+        clock = time.perf_counter
+        name = self.name
+
+        start = clock()
+        view = ProjectView(project)
+        stats.record(name, "view", clock() - start, 0)
+
+        parts = []
+        for section in self.sections:
+            start = clock()
+            text = section.text if section.render is None else section.render(view)
+            elapsed = clock() - start
+            stats.record(name, section.name, elapsed, len(text) if text else 0)
+            if text:
+                parts.append(text)
+
+        start = clock()
+        markdown_content = "\n".join(parts)
+        stats.record(name, "join", clock() - start, len(markdown_content))
+        return markdown_content
+
+    def render_cached(self, project, versions, cache):
+        """Render reusing cached sections whose input field versions are unchanged"""
+        view = None
+        parts = []
+        append = parts.append
+        for section in self.sections:
+            stamp = section.stamp
+            if stamp is None:
+                append(section.text)
+                continue
+
+            stamp = stamp(versions)
+            cached = cache.get(section)
+            if cached is None or cached[0] != stamp:
+                # The view is only built once something actually has to be rendered
+                if view is None:
+                    view = ProjectView(project)
+                cached = cache[section] = (stamp, section.render(view))
+
+            if cached[1]:
+                append(cached[1])
+        return "\n".join(parts)
+
+
+class SectionStats:
+    """Call counts, wall time and output size per (template, section)"""
+
+    def __init__(self):
+        self.sections = {}
+
+    def record(self, template, section, seconds, size):
+        """Add one measurement"""
+        entry = self.sections.get((template, section))
+        if entry is None:
+            self.sections[(template, section)] = [1, seconds, size]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += size
+
+    def merge(self, other):
+        """Fold in the measurements of another SectionStats, e.g. from a worker process"""
+        for (template, section), (calls, seconds, size) in other.sections.items():
+            entry = self.sections.setdefault((template, section), [0, 0.0, 0])
+            entry[0] += calls
+            entry[1] += seconds
+            entry[2] += size
+
+    def rows(self):
+        """Return (template, section, calls, seconds, size) tuples, slowest first"""
+        rows = [(template, section, *entry) for (template, section), entry in self.sections.items()]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def format(self, limit=None):
+        """Return a human readable table"""
+        lines = [f"{'template':<12} {'section':<16} {'calls':>8} {'total ms':>10} {'avg us':>10} {'avg size':>10}"]
+        for template, section, calls, seconds, size in self.rows()[:limit]:
+            lines.append(
+                f"{template:<12} {section:<16} {calls:>8} {seconds * 1000:>10.2f} "
+                f"{seconds / calls * 1e6:>10.2f} {size / calls:>10.0f}"
+            )
+        return "\n".join(lines)
+
+
+def _constant(text):
+    return lambda view: text
+
+
+# Compiled plans by template name
+PLANS = {
+    "Standard": TemplatePlan("Standard", STANDARD_PLAN),
+    "Minimalist": TemplatePlan("Minimalist", MINIMALIST_PLAN),
+    "Detailed": TemplatePlan("Detailed", DETAILED_PLAN),
+    "Modern": TemplatePlan("Modern", MODERN_PLAN),
+    "Corporate": TemplatePlan("Corporate", CORPORATE_PLAN),
+}
+
+
+def get_plan(template):
+    """Return the compiled plan for a template, defaulting to Standard"""
+    return PLANS.get(template) or PLANS["Standard"]
+
+
+def render_plan(plan, view):
+    """Run a compiled plan against a project view and return the markdown"""
+    return plan.render(view)
+
+
+def render_templates(view, templates):
+    """Render several templates from one shared project view, keyed by template name"""
+    return {template: get_plan(template).render(view) for template in templates}
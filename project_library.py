@@ -0,0 +1,729 @@
+"""
+Local project library stored in SQLite.
+
+Every saved project is one row holding its JSON data, with the fields used
+for filtering (project name, username, template, license) copied into
+indexed columns and each technology in an indexed side table. Listing and
+filtering tens of thousands of projects is then an index lookup instead of
+opening every JSON file.
+
+Usage code, file structures, environment variable tables and contact blocks
+are often identical across projects, and the first two are often hundreds
+of KB where every other field is a few bytes. They are stored apart from the
+project rows, once per distinct value, addressed by the SHA-256 of their
+content and reference counted; collect_garbage() removes the values no
+project refers to any more. The library then grows with the amount of unique
+content rather than the number of projects, project rows stay small, and
+load() can return a few fields without reading the values of the others.
+The long text fields are also kept in an FTS5 full-text index that reads its
+text from the same shared values, updated in the same transaction as the
+project. The database runs in WAL mode, so the app and the command line can
+read it while the other writes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+from project_model import FIELDS, TEXT_FIELDS, ProjectData
+
+# Used when neither a path nor MDCREATOR_LIBRARY is given
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".mdcreator", "library.db")
+
+SCHEMA_VERSION = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    project_name TEXT NOT NULL COLLATE NOCASE,
+    username TEXT NOT NULL COLLATE NOCASE,
+    template TEXT NOT NULL COLLATE NOCASE,
+    license TEXT NOT NULL COLLATE NOCASE,
+    data TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_project_name ON projects (project_name);
+CREATE INDEX IF NOT EXISTS projects_username ON projects (username);
+CREATE INDEX IF NOT EXISTS projects_template ON projects (template);
+CREATE INDEX IF NOT EXISTS projects_license ON projects (license);
+CREATE INDEX IF NOT EXISTS projects_updated ON projects (updated);
+CREATE TABLE IF NOT EXISTS project_tech (
+    tech TEXT NOT NULL COLLATE NOCASE,
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    PRIMARY KEY (tech, project_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS project_tech_project ON project_tech (project_id);
+"""
+
+# Version 2: full-text index, one row per project with rowid = projects.id
+TEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS project_text USING fts5 (
+    overview, features, prerequisites, usage_code, file_structure,
+    tokenize = 'unicode61 remove_diacritics 1', prefix = '2 3'
+);
+"""
+
+# Version 3: long text fields stored outside the project's data (one copy per project until version 4)
+BLOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project_blobs (
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    field TEXT NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (project_id, field)
+);
+"""
+
+# Version 4: shared values, stored once per content hash and counted by the triggers
+SHARED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    refs INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_unused ON blobs (hash) WHERE refs = 0;
+CREATE TABLE IF NOT EXISTS project_values (
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    field TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES blobs (hash),
+    PRIMARY KEY (project_id, field)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS project_values_hash ON project_values (hash);
+CREATE TRIGGER IF NOT EXISTS project_values_ref AFTER INSERT ON project_values BEGIN
+    UPDATE blobs SET refs = refs + 1 WHERE hash = NEW.hash;
+END;
+CREATE TRIGGER IF NOT EXISTS project_values_unref AFTER DELETE ON project_values BEGIN
+    UPDATE blobs SET refs = refs - 1 WHERE hash = OLD.hash;
+END;
+"""
+
+# Version 5: full-text indexes that read their text from the library instead of keeping a copy of it.
+# project_text holds each project's own text and value_text each shared value, once however many
+# projects use it. List items are one per line, from the JSON array text: FTS5 cannot read views
+# using json_each().
+TEXT_SOURCE_SCHEMA = """
+DROP TABLE IF EXISTS project_text;
+CREATE VIEW IF NOT EXISTS project_text_source AS SELECT
+    id,
+    COALESCE(json_extract(data, '$.overview'), '') AS overview,
+    replace(replace(replace(COALESCE(json_extract(data, '$.features'), ''), '","', char(10)), '["', ''), '"]', '') AS features,
+    replace(replace(replace(COALESCE(json_extract(data, '$.Prerequisites'), ''), '","', char(10)), '["', ''), '"]', '') AS prerequisites,
+    COALESCE(json_extract(data, '$.usage_code'), '') AS usage_code,
+    COALESCE(json_extract(data, '$.file_structure'), '') AS file_structure
+FROM projects;
+CREATE VIRTUAL TABLE IF NOT EXISTS project_text USING fts5 (
+    overview, features, prerequisites, usage_code, file_structure,
+    content = 'project_text_source', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 1', prefix = '2 3'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS value_text USING fts5 (
+    text, content = 'blobs', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 1', prefix = '2 3'
+);
+INSERT INTO project_text (project_text) VALUES ('rebuild');
+INSERT INTO value_text (value_text) VALUES ('rebuild');
+"""
+
+MIGRATIONS = {1: SCHEMA, 2: TEXT_SCHEMA, 3: BLOB_SCHEMA, 4: SHARED_SCHEMA, 5: TEXT_SOURCE_SCHEMA}
+
+# Steps that need FTS5, which some SQLite builds lack
+FULL_TEXT_STEPS = (2, 5)
+
+# Fields whose values are shared between projects once their stored text is at least SHARE_MIN
+# characters long; shorter values cost less inline than a reference to them
+SHARED_FIELDS = ("contact", "envvars", "file_structure", "usage_code")
+SHARE_MIN = 64
+
+TEXT_COLUMNS = "overview, features, prerequisites, usage_code, file_structure"
+
+# Project fields in the full-text index, in column order
+SEARCH_FIELDS = ("overview", "features", "Prerequisites", "usage_code", "file_structure")
+
+# Searchable fields whose long values are shared and indexed in value_text
+SHARED_SEARCH_FIELDS = ("usage_code", "file_structure")
+
+ProjectSummary = namedtuple("ProjectSummary", ["id", "name", "project_name", "username", "template", "license", "updated"])
+SearchHit = namedtuple("SearchHit", ProjectSummary._fields + ("snippet",))
+# A search word: its FTS5 query in project_text, whether it is scored there, the ranks of the shared
+# values containing it by hash (0 where it carries no weight), roughly how many projects contain it,
+# and whether it carries weight anywhere
+SearchWord = namedtuple("SearchWord", ["query", "scored", "values", "found", "weighted"])
+StorageStats = namedtuple("StorageStats", ["projects", "values", "references", "stored_bytes", "logical_bytes", "unused"])
+
+
+def default_path():
+    """The library used when none is given: $MDCREATOR_LIBRARY or ~/.mdcreator/library.db"""
+    return os.environ.get("MDCREATOR_LIBRARY") or DEFAULT_PATH
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _statements(script):
+    """Split a schema script into statements; trigger bodies contain semicolons of their own"""
+    statement = ""
+    for line in script.splitlines(True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+
+
+def split_shared(data):
+    """Remove the values worth sharing from a project dictionary; returns them as {field: stored text}.
+
+    Text fields are stored as they are, other fields as compact JSON.
+    """
+    shared = {}
+    for field in SHARED_FIELDS:
+        value = data.get(field)
+        if not value:
+            continue
+        text = value if isinstance(value, str) else _dumps(value)
+        if len(text) >= SHARE_MIN:
+            shared[field] = text
+            del data[field]
+    return shared
+
+
+def _value(field, text):
+    """A shared value back in the saved template format"""
+    return text if field in TEXT_FIELDS else json.loads(text)
+
+
+def match_terms(text):
+    """Turn plain search words into FTS5 terms; a word ending in * matches as a prefix"""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return terms
+
+
+def column_filter(fields):
+    """The FTS5 column filter of project_text for some of SEARCH_FIELDS; empty for all of them"""
+    if not fields:
+        return ""
+    unknown = set(fields) - set(SEARCH_FIELDS)
+    if unknown:
+        raise ValueError(f"not a searchable field: {', '.join(sorted(unknown))}")
+    return "{" + " ".join(field.lower() for field in fields) + "} : "
+
+
+class ProjectLibrary:
+    """A SQLite database of saved projects, addressed by a unique, case-insensitive name"""
+
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Transactions are managed explicitly, see transaction()
+        self.connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.execute("PRAGMA busy_timeout=5000")
+        self.full_text = False
+        self._migrate()
+        # SQLite builds without FTS5 still work; text searches then scan the stored data
+        self.full_text = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'project_text'"
+        ).fetchone() is not None
+
+    def _migrate(self):
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"{self.path} was written by a newer version (schema {version})")
+        if version == SCHEMA_VERSION:
+            return
+        with self.transaction():
+            for step in range(version + 1, SCHEMA_VERSION + 1):
+                try:
+                    for statement in _statements(MIGRATIONS[step]):
+                        self.connection.execute(statement)
+                except sqlite3.OperationalError as e:
+                    if step not in FULL_TEXT_STEPS or "fts5" not in str(e):
+                        raise
+                    # No FTS5 in this SQLite build
+                    continue
+                if step == 4:
+                    self._share_values()
+            self.connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _share_values(self):
+        """Move the values of projects saved by earlier versions, inline or in project_blobs, into shared values"""
+        ids = [row[0] for row in self.connection.execute("SELECT id FROM projects")]
+        for project_id in ids:
+            text = self.connection.execute("SELECT data FROM projects WHERE id = ?", (project_id,)).fetchone()[0]
+            data = json.loads(text)
+            data.update(self.connection.execute("SELECT field, text FROM project_blobs WHERE project_id = ?", (project_id,)))
+            shared = split_shared(data)
+            if shared:
+                self.connection.execute("UPDATE projects SET data = ? WHERE id = ?", (_dumps(data), project_id))
+                self._put_values(project_id, shared)
+        self.connection.execute("DROP TABLE project_blobs")
+
+    def _put_values(self, project_id, shared):
+        """Store the shared values of a project, writing only those not stored yet"""
+        rows = []
+        for field, text in shared.items():
+            encoded = text.encode("utf-8")
+            digest = hashlib.sha256(encoded).hexdigest()
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO blobs (hash, size, text) VALUES (?, ?, ?)", (digest, len(encoded), text)
+            )
+            if cursor.rowcount and self.full_text:
+                self.connection.execute("INSERT INTO value_text (rowid, text) VALUES (?, ?)", (cursor.lastrowid, text))
+            rows.append((project_id, field, digest))
+        self.connection.executemany("INSERT INTO project_values (project_id, field, hash) VALUES (?, ?, ?)", rows)
+
+    def _value_hashes(self, project_id):
+        # Answered from the primary key index; the values are not read
+        return dict(self.connection.execute("SELECT field, hash FROM project_values WHERE project_id = ?", (project_id,)))
+
+    def _blob(self, digest):
+        row = self.connection.execute("SELECT text FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        return row[0] if row is not None else ""
+
+    def _full_data(self, project_id, text):
+        """A stored data column with its shared values put back, in the saved template field order"""
+        data = json.loads(text)
+        shared = self.connection.execute(
+            "SELECT field, text FROM project_values JOIN blobs USING (hash) WHERE project_id = ?", (project_id,)
+        ).fetchall()
+        if not shared:
+            return data
+        data.update((field, _value(field, text)) for field, text in shared)
+        return {field: data[field] for field in FIELDS if field in data}
+
+    def _unindex(self, condition, *params):
+        """Remove projects from the full-text index; must run before their stored text changes"""
+        self.connection.execute(
+            f"INSERT INTO project_text (project_text, rowid, {TEXT_COLUMNS})"
+            f" SELECT 'delete', id, {TEXT_COLUMNS} FROM project_text_source WHERE {condition}",
+            params
+        )
+
+    def close(self):
+        # Lets SQLite refresh its statistics for the query planner when they are stale
+        self.connection.execute("PRAGMA optimize")
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def transaction(self):
+        """A with block run as one write transaction; rolled back if it raises"""
+        return _Transaction(self.connection)
+
+    def save(self, name, data):
+        """Store a project under name, replacing any project of that name; returns its id.
+
+        The data is validated like a loaded template and stored with every field.
+        """
+        project = ProjectData.from_dict(data)
+        with self.transaction():
+            return self._save(name, project)
+
+    def _save(self, name, project):
+        name = name.strip()
+        if not name:
+            raise ValueError("a library name is required")
+        data = project.to_dict()
+        shared = split_shared(data)
+        values = (
+            project.project_name.strip(), project.username.strip(), project.template, project.license.strip(),
+            _dumps(data), time.time()
+        )
+        row = self.connection.execute("SELECT id FROM projects WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            project_id = self.connection.execute(
+                "INSERT INTO projects (name, project_name, username, template, license, data, updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name,) + values
+            ).lastrowid
+        else:
+            project_id = row[0]
+            if self.full_text:
+                self._unindex("id = ?", project_id)
+            self.connection.execute(
+                "UPDATE projects SET project_name = ?, username = ?, template = ?, license = ?, data = ?, updated = ? WHERE id = ?",
+                values + (project_id,)
+            )
+            self.connection.execute("DELETE FROM project_tech WHERE project_id = ?", (project_id,))
+            # Values no other project uses are left for collect_garbage(), so saving them again rewrites nothing
+            self.connection.execute("DELETE FROM project_values WHERE project_id = ?", (project_id,))
+        self._put_values(project_id, shared)
+        tech = {technology.strip().lower(): technology.strip() for technology in project.tech if technology.strip()}
+        self.connection.executemany(
+            "INSERT INTO project_tech (tech, project_id) VALUES (?, ?)",
+            [(technology, project_id) for technology in tech.values()]
+        )
+        if self.full_text:
+            self.connection.execute(
+                f"INSERT INTO project_text (rowid, {TEXT_COLUMNS}) SELECT id, {TEXT_COLUMNS} FROM project_text_source WHERE id = ?",
+                (project_id,)
+            )
+        return project_id
+
+    def save_many(self, items):
+        """Store (name, data) pairs in a single transaction; returns the number stored"""
+        # Validate everything first so a bad project leaves the library untouched
+        projects = [(name, ProjectData.from_dict(data)) for name, data in items]
+        with self.transaction():
+            for name, project in projects:
+                self._save(name, project)
+        return len(projects)
+
+    def rewrite(self, names, function):
+        """Replace projects by function(name, data) in a single transaction; returns the number replaced.
+
+        function returns the new data, or None to keep the project as it is.
+        Projects are read and written one at a time, so memory does not grow
+        with their number; if function or a save raises, no project is changed.
+        Names that do not exist are skipped.
+        """
+        replaced = 0
+        with self.transaction():
+            for name in names:
+                row = self.connection.execute("SELECT id, data FROM projects WHERE name = ?", (name.strip(),)).fetchone()
+                if row is None:
+                    continue
+                data = function(name, self._full_data(*row))
+                if data is not None:
+                    self._save(name, ProjectData.from_dict(data))
+                    replaced += 1
+        return replaced
+
+    def load(self, name, fields=None):
+        """Return the saved project data of name; raises KeyError if there is none.
+
+        With fields, only the effective values of those fields are returned,
+        and only their shared values are read.
+        """
+        row = self.connection.execute("SELECT id, data FROM projects WHERE name = ?", (name.strip(),)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        if fields is None:
+            return self._full_data(*row)
+        project_id, text = row
+        data = json.loads(text)
+        hashes = self._value_hashes(project_id)
+        data.update((field, _value(field, self._blob(hashes[field]))) for field in fields if field in hashes)
+        project = ProjectData.from_dict({field: data[field] for field in fields if field in data})
+        return {field: project.get(field) for field in fields}
+
+    def delete(self, name):
+        """Remove a project; returns False if there was none.
+
+        Values only it used stay stored until collect_garbage().
+        """
+        with self.transaction():
+            if self.full_text:
+                # Virtual tables take no part in foreign keys
+                self._unindex("id IN (SELECT id FROM projects WHERE name = ?)", name.strip())
+            cursor = self.connection.execute("DELETE FROM projects WHERE name = ?", (name.strip(),))
+        return cursor.rowcount > 0
+
+    def _filters(self, name=None, project_name=None, username=None, template=None, license=None, tech=None):
+        """Build the conditions of a filtered query; names match as prefixes, the rest exactly"""
+        clauses, params = [], []
+        for column, prefix in (("name", name), ("project_name", project_name)):
+            if prefix:
+                clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                params.append(_escape_like(prefix) + "%")
+        for column, value in (("username", username), ("template", template), ("license", license)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for technology in ([tech] if isinstance(tech, str) else tech or ()):
+            clauses.append("id IN (SELECT project_id FROM project_tech WHERE tech = ?)")
+            params.append(technology)
+        return clauses, params
+
+    def _where(self, **filters):
+        clauses, params = self._filters(**filters)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def list(self, limit=None, offset=0, **filters):
+        """Return ProjectSummary rows, most recently saved first.
+
+        filters: name and project_name (prefixes), username, template, license
+        and tech (one technology or a list, all required), all case-insensitive.
+        """
+        where, params = self._where(**filters)
+        query = f"SELECT id, name, project_name, username, template, license, updated FROM projects{where} ORDER BY updated DESC"
+        if limit:
+            query += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return [ProjectSummary(*row) for row in self.connection.execute(query, params)]
+
+    def count(self, **filters):
+        """Number of projects matching the filters of list()"""
+        where, params = self._where(**filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM projects{where}", params).fetchone()[0]
+
+    def search(self, text, fields=None, limit=50, **filters):
+        """Return SearchHit rows for the projects whose text contains every word of text, best first.
+
+        A word may be found in the project's own text or in a shared value it
+        uses and scores its bm25 rank there, the better of the two; projects
+        are ordered by the sum over all words, then newest first. As in bm25,
+        a word found in at least half of the projects (or of the shared values)
+        carries no weight. fields limits the search to some of SEARCH_FIELDS;
+        filters are those of list(). The snippet shows the best matching
+        passage with the words in [brackets].
+        """
+        columns = column_filter(fields)
+        terms = match_terms(text)
+        if not terms:
+            return []
+        clauses, params = self._filters(**filters)
+        if not self.full_text:
+            return self._scan(text, clauses, params, limit)
+        shared = [field for field in SHARED_SEARCH_FIELDS if not fields or field in fields]
+        totals = self.connection.execute("SELECT (SELECT COUNT(*) FROM projects), (SELECT COUNT(*) FROM blobs)").fetchone()
+        words = [self._word(columns + term, term, shared, *totals) for term in terms]
+        if not all(word.found for word in words):
+            return []
+        if any(word.weighted for word in words):
+            ids = self._best(words, shared, clauses, params, limit)
+        else:
+            # Every project scores the same, so the newest are found without looking at the others
+            ids = self._newest(words, shared, clauses, params, limit)
+
+        # Only the rows returned are read from the projects table
+        rows = {row[0]: row for row in self.connection.execute(
+            "SELECT id, name, project_name, username, template, license, updated FROM projects"
+            " WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),)
+        )}
+
+        # Snippets read the text back, so they are only made for the rows returned
+        any_term = " OR ".join(terms)
+        own = dict(self._own_text(
+            columns + f"({any_term})", "snippet(project_text, -1, '[', ']', '...', 12)", ids
+        )) if ids else {}
+        snippets, value_ranks = {}, {}
+        return [
+            SearchHit(*rows[project_id], own.get(project_id) or self._value_snippet(project_id, any_term, shared, snippets, value_ranks))
+            for project_id in ids
+        ]
+
+    def _word(self, query, term, shared, projects, values):
+        """A SearchWord for term, query being term with the column filter of the search"""
+        matches = self.connection.execute("SELECT COUNT(*) FROM project_text WHERE project_text MATCH ?", (query,)).fetchone()[0]
+        ranks, found = {}, matches
+        if shared:
+            for digest, rank, refs in self.connection.execute(
+                "SELECT hash, rank, refs FROM value_text JOIN blobs ON blobs.id = value_text.rowid WHERE value_text MATCH ?", (term,)
+            ):
+                ranks[digest] = rank
+                # Counts the projects using the value in any field: only used to pick the rarest word
+                found += refs
+        # bm25 gives a word in half of the rows or more a weight of nearly nothing; here it is none
+        scored = 0 < matches and 2 * matches < projects
+        if 2 * len(ranks) >= values:
+            ranks = dict.fromkeys(ranks, 0.0)
+        return SearchWord(query, scored, ranks, found, scored or any(ranks.values()))
+
+    def _best(self, words, shared, clauses, params, limit):
+        """Ids of the projects containing every word and passing the filters, best first"""
+        # Only the projects containing the rarest word can match, so the others are looked for among them
+        rarest = min(words, key=lambda word: word.found)
+        scores = self._scores(rarest, shared)
+        if clauses:
+            scores = {project_id: scores[project_id] for project_id, in self.connection.execute(
+                "SELECT id FROM projects WHERE id IN (SELECT value FROM json_each(?)) AND " + " AND ".join(clauses),
+                [json.dumps(list(scores))] + params
+            )}
+        others = [word for word in words if word is not rarest]
+        hashes = self._shared_hashes(list(scores), shared) if others else {}
+        for word in others:
+            if scores:
+                found = self._scores(word, shared, list(scores), hashes)
+                scores = {project_id: scores[project_id] + score for project_id, score in found.items()}
+        ids = sorted(scores, key=lambda project_id: (scores[project_id], -project_id))
+        return ids[:limit] if limit else ids
+
+    def _newest(self, words, shared, clauses, params, limit):
+        """Ids of the projects containing every word and passing the filters, newest first"""
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        cursor = self.connection.execute(f"SELECT id FROM projects{where} ORDER BY id DESC", params)
+        ids, size = [], 2 * (limit or 0)
+        while True:
+            batch = [project_id for project_id, in (cursor.fetchmany(size) if limit else cursor.fetchall())]
+            if not batch:
+                break
+            hashes = self._shared_hashes(batch, shared)
+            for word in words:
+                if batch:
+                    found = self._scores(word, shared, batch, hashes)
+                    batch = [project_id for project_id in batch if project_id in found]
+            ids += batch
+            if not limit or len(ids) >= limit:
+                break
+            # Fewer of these projects contain the words than hoped: take more of them at a time
+            size *= 4
+        cursor.close()
+        return ids[:limit] if limit else ids
+
+    def _scores(self, word, shared, ids=None, hashes=None):
+        """{project id: score} of the projects among ids containing a word, of all of them without ids.
+
+        hashes maps ids to the hashes of their searched shared values. A
+        project scores the word's best rank in its own text or shared values,
+        0 where the word carries no weight.
+        """
+        scores = {}
+        if ids is None:
+            scores.update(self.connection.execute(
+                f"SELECT rowid, {'rank' if word.scored else '0.0'} FROM project_text WHERE project_text MATCH ?", (word.query,)
+            ))
+        elif ids:
+            scores.update(self._own_text(word.query, "rank" if word.scored else "0.0", ids))
+        if not shared or not word.values:
+            return scores
+        if ids is None:
+            # Each value is looked up once, however many projects use it
+            used = self.connection.execute(
+                "SELECT project_id, hash FROM project_values WHERE hash IN (SELECT value FROM json_each(?))"
+                f" AND field IN ({', '.join('?' * len(shared))})",
+                [json.dumps(list(word.values))] + shared
+            )
+        else:
+            used = ((project_id, digest) for project_id in ids for digest in hashes.get(project_id, ()))
+        for project_id, digest in used:
+            score = word.values.get(digest)
+            if score is not None and (project_id not in scores or score < scores[project_id]):
+                scores[project_id] = score
+        return scores
+
+    def _own_text(self, query, column, ids):
+        """(rowid, column) of the projects among ids whose own text matches query"""
+        # One pass over the range of ids: FTS5 would run the query again for each rowid looked up
+        return self.connection.execute(
+            f"SELECT rowid, {column} FROM project_text WHERE project_text MATCH ? AND rowid BETWEEN ? AND ?"
+            " AND +rowid IN (SELECT value FROM json_each(?))",
+            (query, min(ids), max(ids), json.dumps(ids))
+        )
+
+    def _shared_hashes(self, ids, shared):
+        """{project id: hashes of its shared values in the searched fields} for ids"""
+        hashes = {}
+        if shared:
+            for project_id, digest in self.connection.execute(
+                "SELECT project_id, hash FROM project_values WHERE project_id IN (SELECT value FROM json_each(?))"
+                f" AND field IN ({', '.join('?' * len(shared))})",
+                [json.dumps(ids)] + shared
+            ):
+                hashes.setdefault(project_id, []).append(digest)
+        return hashes
+
+    def _value_snippet(self, project_id, value_query, shared, snippets, value_ranks):
+        """The best passage of the best matching shared value a project uses.
+
+        snippets and value_ranks are filled in as they are needed and shared by the rows of one search.
+        """
+        if not shared:
+            return ""
+        if not value_ranks:
+            # Every matching value is ranked once, rather than looked up in the index per project
+            value_ranks.update(self.connection.execute(
+                "SELECT rowid, rank FROM value_text WHERE value_text MATCH ?", (value_query,)
+            ))
+        value_ids = [value_id for value_id, in self.connection.execute(
+            "SELECT blobs.id FROM project_values JOIN blobs USING (hash)"
+            f" WHERE project_id = ? AND field IN ({', '.join('?' * len(shared))})",
+            [project_id] + shared
+        ) if value_id in value_ranks]
+        if not value_ids:
+            return ""
+        value_id = min(value_ids, key=value_ranks.get)
+        if value_id not in snippets:
+            # Made once per value, however many of the projects returned use it
+            snippets[value_id] = self.connection.execute(
+                "SELECT snippet(value_text, 0, '[', ']', '...', 12) FROM value_text WHERE value_text MATCH ? AND rowid = ?",
+                (value_query, value_id)
+            ).fetchone()[0]
+        return snippets[value_id]
+
+    def _scan(self, text, clauses, params, limit):
+        """search() without a full-text index: every word must occur in the stored data or blobs"""
+        for word in text.replace("*", " ").split():
+            clauses = clauses + [
+                "(data LIKE ? ESCAPE '\\' OR id IN ("
+                "SELECT project_id FROM project_values JOIN blobs USING (hash) WHERE text LIKE ? ESCAPE '\\'))"
+            ]
+            params = params + ["%" + _escape_like(word) + "%"] * 2
+        sql = (
+            "SELECT id, name, project_name, username, template, license, updated, '' FROM projects"
+            " WHERE " + " AND ".join(clauses) + " ORDER BY updated DESC"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params = params + [limit]
+        return [SearchHit(*row) for row in self.connection.execute(sql, params)]
+
+    def collect_garbage(self):
+        """Delete the stored values no project refers to any more; returns (values deleted, bytes freed).
+
+        The file itself only shrinks after vacuum(); until then the freed pages are reused.
+        """
+        with self.transaction():
+            deleted, size = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs WHERE refs = 0"
+            ).fetchone()
+            if self.full_text:
+                self.connection.execute(
+                    "INSERT INTO value_text (value_text, rowid, text) SELECT 'delete', id, text FROM blobs WHERE refs = 0"
+                )
+            self.connection.execute("DELETE FROM blobs WHERE refs = 0")
+        return deleted, size
+
+    def vacuum(self):
+        """Rewrite the database file without its free pages"""
+        self.connection.execute("VACUUM")
+
+    def storage(self):
+        """Return StorageStats: how much the shared values take and how much they would take unshared"""
+        values, stored, logical, references, unused = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(size * refs), 0), COALESCE(SUM(refs), 0),"
+            " COALESCE(SUM(refs = 0), 0) FROM blobs"
+        ).fetchone()
+        return StorageStats(self.count(), values, references, stored, logical, unused)
+
+    def technologies(self):
+        """Every technology in the library with its number of projects, most used first"""
+        return self.connection.execute(
+            "SELECT tech, COUNT(*) AS uses FROM project_tech GROUP BY tech ORDER BY uses DESC, tech"
+        ).fetchall()
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, so concurrent writers wait instead of failing mid-way"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
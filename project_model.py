@@ -0,0 +1,251 @@
+"""
+Compact project model used by the markdown generator.
+
+Project data is validated once, when it enters the model, and stored in slotted
+objects: text fields as strings, list fields as tuples, environment variables
+as EnvVar records, and language statistics, contributors and releases as
+Language, Contributor and Release records. to_dict() returns the plain dictionary format used by saved
+project templates.
+"""
+
+# Field names in the saved template format, in their original order
+TEXT_FIELDS = (
+    "project_name", "username", "concisedesc", "overview", "logo", "DemoGif",
+    "screenshot1", "screenshot2", "license", "contact", "file_structure", "usage_code"
+)
+LIST_FIELDS = ("features", "Prerequisites", "tech")
+FIELDS = (
+    "project_name", "username", "concisedesc", "overview", "features", "logo", "DemoGif",
+    "screenshot1", "screenshot2", "Prerequisites", "envvars", "tech", "languages", "license", "contact",
+    "contributors", "releases", "file_structure", "usage_code", "template"
+)
+
+DEFAULTS = {"license": "MIT", "template": "Standard"}
+
+
+class EnvVar:
+    """One row of the environment variables table"""
+
+    __slots__ = ("name", "desc", "value")
+
+    def __init__(self, name="", desc="", value=""):
+        self.name = name
+        self.desc = desc
+        self.value = value
+
+    @classmethod
+    def from_value(cls, value):
+        """Build an EnvVar from a {"name", "desc", "value"} dictionary or an existing EnvVar"""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise ValueError(f"environment variable must be an object, got {type(value).__name__}")
+        return cls(_text(value.get("name", "")), _text(value.get("desc", "")), _text(value.get("value", "")))
+
+    def to_dict(self):
+        return {"name": self.name, "desc": self.desc, "value": self.value}
+
+    def __eq__(self, other):
+        if not isinstance(other, EnvVar):
+            return NotImplemented
+        return (self.name, self.desc, self.value) == (other.name, other.desc, other.value)
+
+    def __repr__(self):
+        return f"EnvVar({self.name!r}, {self.desc!r}, {self.value!r})"
+
+
+class Language:
+    """One row of the languages section: a language and its size in bytes"""
+
+    __slots__ = ("name", "bytes")
+
+    def __init__(self, name="", bytes=0):
+        self.name = name
+        self.bytes = bytes
+
+    @classmethod
+    def from_value(cls, value):
+        """Build a Language from a {"name", "bytes"} dictionary or an existing Language"""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise ValueError(f"language must be an object, got {type(value).__name__}")
+        return cls(_text(value.get("name", "")), _count(value.get("bytes", 0)))
+
+    def to_dict(self):
+        return {"name": self.name, "bytes": self.bytes}
+
+    def __eq__(self, other):
+        if not isinstance(other, Language):
+            return NotImplemented
+        return (self.name, self.bytes) == (other.name, other.bytes)
+
+    def __repr__(self):
+        return f"Language({self.name!r}, {self.bytes!r})"
+
+
+class Contributor:
+    """One row of the contributors section: an author and their number of commits"""
+
+    __slots__ = ("name", "commits")
+
+    def __init__(self, name="", commits=0):
+        self.name = name
+        self.commits = commits
+
+    @classmethod
+    def from_value(cls, value):
+        """Build a Contributor from a {"name", "commits"} dictionary or an existing Contributor"""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise ValueError(f"contributor must be an object, got {type(value).__name__}")
+        return cls(_text(value.get("name", "")), _count(value.get("commits", 0)))
+
+    def to_dict(self):
+        return {"name": self.name, "commits": self.commits}
+
+    def __eq__(self, other):
+        if not isinstance(other, Contributor):
+            return NotImplemented
+        return (self.name, self.commits) == (other.name, other.commits)
+
+    def __repr__(self):
+        return f"Contributor({self.name!r}, {self.commits!r})"
+
+
+class Release:
+    """One row of the releases section: a tag and its date"""
+
+    __slots__ = ("tag", "date")
+
+    def __init__(self, tag="", date=""):
+        self.tag = tag
+        self.date = date
+
+    @classmethod
+    def from_value(cls, value):
+        """Build a Release from a {"tag", "date"} dictionary or an existing Release"""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise ValueError(f"release must be an object, got {type(value).__name__}")
+        return cls(_text(value.get("tag", "")), _text(value.get("date", "")))
+
+    def to_dict(self):
+        return {"tag": self.tag, "date": self.date}
+
+    def __eq__(self, other):
+        if not isinstance(other, Release):
+            return NotImplemented
+        return (self.tag, self.date) == (other.tag, other.date)
+
+    def __repr__(self):
+        return f"Release({self.tag!r}, {self.date!r})"
+
+
+def _text(value):
+    """Numbers from hand-written JSON are kept as their string form"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        return str(value)
+    raise ValueError(f"expected text, got {type(value).__name__}")
+
+
+def _count(value):
+    """A byte or commit count; numeric strings from hand-written JSON are accepted"""
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if type(value) is not int or value < 0:
+        raise ValueError(f"expected a count, got {value!r}")
+    return value
+
+
+# List fields whose items are records rather than strings
+RECORDS = {"envvars": EnvVar, "languages": Language, "contributors": Contributor, "releases": Release}
+
+
+def _items(field, value):
+    if value is None:
+        return ()
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{field} must be a list, got {type(value).__name__}")
+    if field in RECORDS:
+        return tuple(map(RECORDS[field].from_value, value))
+    for item in value:
+        if type(item) is not str:
+            return tuple(map(_text, value))
+    return tuple(value)
+
+
+def normalize(field, value):
+    """Validate a value for a field and convert it to its stored form"""
+    if field in LIST_FIELDS or field in RECORDS:
+        return _items(field, value)
+    try:
+        return _text(value)
+    except ValueError as e:
+        raise ValueError(f"{field}: {e}") from None
+
+
+class ProjectData:
+    """Validated project fields; list fields are stored as tuples"""
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for field in TEXT_FIELDS:
+            setattr(self, field, DEFAULTS.get(field, ""))
+        for field in LIST_FIELDS:
+            setattr(self, field, ())
+        for field in RECORDS:
+            setattr(self, field, ())
+        self.template = DEFAULTS["template"]
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a project from a saved template dictionary; unknown keys are ignored"""
+        project = cls()
+        project.update(data)
+        return project
+
+    def update(self, data):
+        """Validate and set every known field in data; returns the fields whose value changed"""
+        # Validate everything first so a bad value leaves the project untouched
+        values = {field: normalize(field, value) for field, value in data.items() if field in FIELDS}
+        changed = []
+        for field, value in values.items():
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed.append(field)
+        return changed
+
+    def set(self, field, value):
+        """Validate and set a single field; returns True if its value changed"""
+        if field not in FIELDS:
+            raise KeyError(field)
+        value = normalize(field, value)
+        if getattr(self, field) == value:
+            return False
+        setattr(self, field, value)
+        return True
+
+    def get(self, field, default=""):
+        """Return a field in the saved template format (lists and dictionaries)"""
+        if field not in FIELDS:
+            return default
+        value = getattr(self, field)
+        if field in RECORDS:
+            return [item.to_dict() for item in value]
+        if isinstance(value, tuple):
+            return list(value)
+        return value
+
+    def to_dict(self):
+        """Return all fields in the saved template format"""
+        return {field: self.get(field) for field in FIELDS}
@@ -0,0 +1,187 @@
+"""
+Content-addressed on-disk cache of rendered README files.
+
+Entries are keyed by a SHA-256 of the canonical project data, the resolved
+template name and a fingerprint of the template code, so any change to the
+data or to the templates produces a new key and stale entries are simply
+never read again. The cache is bounded in size and evicts the least recently
+used entries first, measuring the directory itself rather than what one
+process wrote.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import md_templates
+import project_model
+from md_templates import get_plan
+
+# Bump to invalidate every existing cache entry
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# put() trims the cache once it may have grown this far past max_bytes
+TRIM_SLACK = 1.1
+
+_fingerprint = None
+
+
+def template_fingerprint():
+    """Hash of the template and model source, so editing a template invalidates the cache"""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(f"render-cache-v{CACHE_VERSION}".encode())
+        for module in (md_templates, project_model):
+            with open(module.__file__, "rb") as file:
+                digest.update(file.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def cache_key(project):
+    """Return the cache key for a ProjectData"""
+    data = project.to_dict()
+    # Unknown template names render as Standard, so they share its entries
+    data["template"] = get_plan(project.template).name
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256(template_fingerprint().encode())
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered markdown stored under a directory.
+
+    Any number of processes can read and add entries at the same time: an
+    entry is one file, written atomically, and its mtime is its last use.
+    Entries are evicted by trim(), which measures the directory itself, so
+    the bound holds however many workers filled the cache; the batch
+    renderer calls it once the workers are done. put() counts what it adds
+    and trims as soon as that takes the cache past max_bytes * TRIM_SLACK,
+    so a long-running process stays within the bound without calling trim().
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Contents as of the last trim(), plus the entries put() added since; None before the first
+        self.entries = None
+        self.total_bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _scan(self):
+        """Return (mtime, path, size) of every entry, least recently used first"""
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".md"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    found.append((stat.st_mtime, entry.path, stat.st_size))
+        found.sort()
+        return found
+
+    def path_for(self, key):
+        return os.path.join(self.directory, key[:2], key + ".md")
+
+    def get(self, key):
+        """Return the cached markdown for key, or None"""
+        path = self.path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                markdown_content = file.read()
+            # The mtime doubles as the last-use time for trim() and later runs
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return markdown_content
+
+    def put(self, key, markdown_content):
+        """Store markdown under key, trimming the cache if it has grown past the bound"""
+        payload = markdown_content.encode("utf-8")
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        if self.total_bytes is None:
+            # The first entry this process adds measures what is already there
+            self.trim()
+        else:
+            # An estimate: replaced entries are counted twice and other processes not at all,
+            # which the next trim() corrects
+            self.entries += 1
+            self.total_bytes += len(payload)
+            if self.total_bytes > self.max_bytes * TRIM_SLACK:
+                self.trim()
+
+    def trim(self):
+        """Evict the least recently used entries until the directory fits max_bytes; returns the number evicted"""
+        found = self._scan()
+        total = sum(size for _, _, size in found)
+        evicted = 0
+        # The most recently used entry is always kept
+        for _, path, size in found[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        self.entries = len(found) - evicted
+        self.total_bytes = total
+        self.evictions += evicted
+        return evicted
+
+    def render(self, generator):
+        """Return (markdown, hit) for a MarkdownGenerator, rendering only on a miss"""
+        key = cache_key(generator.project)
+        markdown_content = self.get(key)
+        if markdown_content is not None:
+            return markdown_content, True
+        markdown_content = generator.generate_markdown()
+        self.put(key, markdown_content)
+        return markdown_content, False
+
+    def clear(self):
+        """Remove every entry"""
+        for _, path, _ in self._scan():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self.entries = self.total_bytes = 0
+
+    def format(self):
+        """Return a one-line summary of the cache contents (as of the last trim) and statistics"""
+        if self.entries is None:
+            self.trim()
+        line = f"render cache: {self.entries} entries, {self.total_bytes / (1024 * 1024):.2f} MiB"
+        lookups = self.hits + self.misses
+        if lookups:
+            line += f", {self.hits} hits, {self.misses} misses ({self.hits / lookups:.1%} hit rate)"
+        if self.evictions:
+            line += f", {self.evictions} evicted"
+        return line
@@ -0,0 +1,188 @@
+"""
+Streaming render pipeline for JSONL project records.
+
+Records are read one line at a time, rendered by a pool of workers and written
+out incrementally. Bounded queues between the reader, the workers and the
+writer keep memory use flat no matter how many records are fed in.
+"""
+
+import io
+import json
+import os
+import queue
+import re
+import tarfile
+import threading
+import time
+from collections import deque
+
+from batch import RenderResult, render_project
+from file_output import write_if_changed
+
+# Marks the end of a queue
+_DONE = object()
+
+
+def slugify(text):
+    """Turn a project name into a safe file name"""
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", text.strip()).strip("-.")
+    return slug[:100]
+
+
+def unique_name(result, used_names):
+    """The record's name, made unique by its line number (and a counter) if it is already in used_names.
+
+    Names are compared case-insensitively, as on Windows and macOS file systems.
+    """
+    name = candidate = result.output
+    count = 1
+    while candidate.lower() in used_names:
+        candidate = f"{name}-{result.source}" if count == 1 else f"{name}-{result.source}-{count}"
+        count += 1
+    used_names.add(candidate.lower())
+    return candidate
+
+
+def render_record(job):
+    """Parse and render a single JSONL record; returns (RenderResult, markdown)"""
+    label, line, template = job
+    start = time.perf_counter()
+    name = label
+    try:
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError("record must be a JSON object")
+        name = slugify(str(data.get("project_name", ""))) or label
+
+        markdown_content = render_project(data, template)
+        return RenderResult(label, name, time.perf_counter() - start, len(markdown_content), None), markdown_content
+    except Exception as e:
+        return RenderResult(label, name, time.perf_counter() - start, 0, f"{type(e).__name__}: {e}"), None
+
+
+class DirectorySink:
+    """Writes each README to <directory>/<name>.md"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.used_names = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, result, markdown_content):
+        path = os.path.join(self.directory, unique_name(result, self.used_names) + ".md")
+        write_if_changed(path, markdown_content)
+
+    def close(self):
+        pass
+
+
+class TarSink:
+    """Writes each README as a member of an uncompressed tar stream"""
+
+    def __init__(self, fileobj):
+        self.used_names = set()
+        self.tar = tarfile.open(fileobj=fileobj, mode="w|")
+        self.mtime = int(time.time())
+
+    def write(self, result, markdown_content):
+        payload = markdown_content.encode("utf-8")
+        info = tarfile.TarInfo(unique_name(result, self.used_names) + ".md")
+        info.size = len(payload)
+        info.mtime = self.mtime
+        self.tar.addfile(info, io.BytesIO(payload))
+
+    def close(self):
+        self.tar.close()
+
+
+class JsonlSink:
+    """Writes one {"line", "name", "markdown"} object per rendered record"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def write(self, result, markdown_content):
+        record = {"line": result.source, "name": result.output, "markdown": markdown_content}
+        self.fileobj.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.fileobj.flush()
+
+
+def _read_lines(stream, inbox, template, failure):
+    """Reader stage: push non-empty lines into the bounded inbox"""
+    try:
+        for lineno, line in enumerate(stream, 1):
+            if line.strip():
+                inbox.put((str(lineno), line, template))
+    except Exception as e:
+        failure.append(e)
+    finally:
+        inbox.put(_DONE)
+
+
+def _write_results(outbox, sink, on_result, failure):
+    """Writer stage: drain the bounded outbox into the sink"""
+    while True:
+        item = outbox.get()
+        if item is _DONE:
+            break
+        # Keep draining after a failure so the producers never block
+        if failure:
+            continue
+        result, markdown_content = item
+        try:
+            if markdown_content is not None:
+                sink.write(result, markdown_content)
+            if on_result:
+                on_result(result)
+        except Exception as e:
+            failure.append(e)
+
+
+def run_stream(stream, sink, template=None, workers=None, queue_size=256, on_result=None):
+    """Render every record in a JSONL stream into the sink, in input order"""
+    inbox = queue.Queue(maxsize=queue_size)
+    outbox = queue.Queue(maxsize=queue_size)
+    failure = []
+
+    reader = threading.Thread(target=_read_lines, args=(stream, inbox, template, failure), daemon=True)
+    writer = threading.Thread(target=_write_results, args=(outbox, sink, on_result, failure), daemon=True)
+    reader.start()
+    writer.start()
+
+    completed = False
+    try:
+        if workers == 1:
+            while True:
+                job = inbox.get()
+                if job is _DONE:
+                    break
+                outbox.put(render_record(job))
+        else:
+            # Only queue_size renders are ever in flight; when the window is full
+            # we wait for the oldest one, which also preserves input order
+            from concurrent.futures import ProcessPoolExecutor
+
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    job = inbox.get()
+                    if job is _DONE:
+                        break
+                    pending.append(executor.submit(render_record, job))
+                    if len(pending) >= queue_size:
+                        outbox.put(pending.popleft().result())
+                while pending:
+                    outbox.put(pending.popleft().result())
+        completed = True
+    finally:
+        outbox.put(_DONE)
+        writer.join()
+        # An aborted run may leave the reader blocked on a full inbox; it is a daemon
+        if completed:
+            reader.join()
+        sink.close()
+
+    if failure:
+        raise failure[0]
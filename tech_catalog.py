@@ -0,0 +1,35 @@
+"""
+Technology catalog shared by the technology selector and the repository detectors.
+
+Kept free of GUI imports so headless tools can use it.
+"""
+
+# Technology categories and options for the selector
+TECH_CATEGORIES = {
+    "Languages": [
+        "Python", "JavaScript", "TypeScript", "Java", "C#", "C++", 
+        "Go", "Rust", "PHP", "Ruby", "Swift", "Kotlin"
+    ],
+    "Frontend": [
+        "React", "Vue", "Angular", "HTML", "CSS", "Sass", 
+        "TailwindCSS", "Bootstrap", "Material-UI", "Chakra-UI"
+    ],
+    "Backend": [
+        "Node", "Django", "Flask", "Express", "FastAPI", "Spring Boot",
+        "ASP.NET", "Laravel"
+    ],
+    "Database": [
+        "MongoDB", "MySQL", "PostgreSQL", "Redis", "SQLite", "Oracle",
+        "SQL Server", "Firestore"
+    ],
+    "DevOps": [
+        "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "GitHub", "GitLab",
+        "Jenkins", "Travis CI", "CircleCI"
+    ],
+    "Mobile": [
+        "React Native", "Flutter", "Android", "iOS", "Xamarin", "Ionic"
+    ]
+}
+
+# Every technology in the catalog, in selector order
+TECHNOLOGIES = tuple(tech for techs in TECH_CATEGORIES.values() for tech in techs)
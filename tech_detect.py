@@ -0,0 +1,561 @@
+"""
+Detect a repository's technologies and prerequisites from its manifest files.
+
+Manifests (requirements.txt, pyproject.toml, package.json, go.mod, Cargo.toml,
+Dockerfiles, CI configuration, ...) are found with the gitignore-aware tree
+scanner, so ignored and vendored trees such as node_modules are never entered,
+and they are read and parsed on a thread pool. Technologies are reported with
+their TECH_CATEGORIES names. Parse results are cached by a hash of the file
+content, so manifests shared between repositories, or unchanged since the last
+run, are not parsed again.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from file_output import write_if_changed
+from tech_catalog import TECHNOLOGIES
+from tree_scanner import scan_tree
+
+# Bump when the parsers change, to invalidate cached results
+DETECT_VERSION = 1
+
+# Third-party code that would report its own dependencies as the project's
+DEFAULT_EXCLUDE = ("node_modules/", "bower_components/", "vendor/", ".venv/", "venv/", ".tox/", "site-packages/")
+
+Detection = namedtuple("Detection", ["tech", "prerequisites", "manifests", "cached"])
+
+# Dependency names (normalized) -> technology
+PYTHON_PACKAGES = {
+    "django": "Django", "flask": "Flask", "fastapi": "FastAPI",
+    "pymongo": "MongoDB", "motor": "MongoDB", "mongoengine": "MongoDB",
+    "psycopg": "PostgreSQL", "psycopg2": "PostgreSQL", "psycopg2-binary": "PostgreSQL", "asyncpg": "PostgreSQL",
+    "mysqlclient": "MySQL", "pymysql": "MySQL", "mysql-connector-python": "MySQL",
+    "redis": "Redis", "aioredis": "Redis",
+    "cx-oracle": "Oracle", "oracledb": "Oracle",
+    "pyodbc": "SQL Server", "pymssql": "SQL Server",
+    "boto3": "AWS", "botocore": "AWS",
+    "google-cloud-firestore": "Firestore", "firebase-admin": "Firestore",
+    "kubernetes": "Kubernetes",
+}
+PYTHON_PREFIXES = (("azure-", "Azure"), ("google-cloud-", "GCP"))
+
+NPM_PACKAGES = {
+    "react": "React", "vue": "Vue", "@angular/core": "Angular", "express": "Express",
+    "typescript": "TypeScript", "sass": "Sass", "node-sass": "Sass", "tailwindcss": "TailwindCSS",
+    "bootstrap": "Bootstrap", "@mui/material": "Material-UI", "@material-ui/core": "Material-UI",
+    "@chakra-ui/react": "Chakra-UI",
+    "mongodb": "MongoDB", "mongoose": "MongoDB", "mysql": "MySQL", "mysql2": "MySQL", "pg": "PostgreSQL",
+    "redis": "Redis", "ioredis": "Redis", "sqlite3": "SQLite", "better-sqlite3": "SQLite",
+    "oracledb": "Oracle", "mssql": "SQL Server", "tedious": "SQL Server",
+    "firebase": "Firestore", "firebase-admin": "Firestore", "@google-cloud/firestore": "Firestore",
+    "aws-sdk": "AWS", "react-native": "React Native",
+    "@ionic/core": "Ionic", "@ionic/angular": "Ionic", "@ionic/react": "Ionic", "@ionic/vue": "Ionic",
+}
+NPM_PREFIXES = (("@aws-sdk/", "AWS"), ("@azure/", "Azure"), ("@google-cloud/", "GCP"))
+# Frameworks that run in the browser; a package.json without one is a Node project
+FRONTEND = {"React", "Vue", "Angular", "React Native", "Ionic"}
+
+GO_MODULES = (
+    ("go.mongodb.org/mongo-driver", "MongoDB"), ("github.com/lib/pq", "PostgreSQL"),
+    ("github.com/jackc/pgx", "PostgreSQL"), ("github.com/go-sql-driver/mysql", "MySQL"),
+    ("github.com/redis/go-redis", "Redis"), ("github.com/go-redis/redis", "Redis"),
+    ("github.com/mattn/go-sqlite3", "SQLite"), ("github.com/aws/aws-sdk-go", "AWS"),
+    ("cloud.google.com/go/firestore", "Firestore"), ("cloud.google.com/go", "GCP"),
+    ("github.com/Azure/azure-sdk-for-go", "Azure"), ("k8s.io/client-go", "Kubernetes"),
+)
+
+CARGO_CRATES = {
+    "redis": "Redis", "mongodb": "MongoDB", "postgres": "PostgreSQL", "tokio-postgres": "PostgreSQL",
+    "mysql": "MySQL", "mysql_async": "MySQL", "rusqlite": "SQLite", "kube": "Kubernetes",
+}
+CARGO_PREFIXES = (("aws-sdk-", "AWS"), ("azure_", "Azure"))
+
+# Substrings of Maven/Gradle/.NET/Ruby dependency declarations
+JVM_ARTIFACTS = (
+    ("spring-boot", "Spring Boot"), ("postgresql", "PostgreSQL"), ("mysql-connector", "MySQL"),
+    ("mongodb-driver", "MongoDB"), ("data-mongodb", "MongoDB"), ("jedis", "Redis"), ("data-redis", "Redis"),
+    ("sqlite-jdbc", "SQLite"), ("ojdbc", "Oracle"), ("mssql-jdbc", "SQL Server"),
+    ("software.amazon.awssdk", "AWS"), ("com.amazonaws", "AWS"), ("com.azure", "Azure"),
+    ("com.google.cloud", "GCP"),
+)
+DOTNET_PACKAGES = (
+    ("Npgsql", "PostgreSQL"), ("MongoDB.Driver", "MongoDB"), ("StackExchange.Redis", "Redis"),
+    ("SqlServer", "SQL Server"), ("Microsoft.Data.SqlClient", "SQL Server"), ("Sqlite", "SQLite"),
+    ("MySql.Data", "MySQL"), ("Pomelo.EntityFrameworkCore.MySql", "MySQL"), ("AWSSDK", "AWS"),
+    ("Azure.", "Azure"), ("Xamarin.", "Xamarin"),
+)
+RUBY_GEMS = {"pg": "PostgreSQL", "mysql2": "MySQL", "redis": "Redis", "mongoid": "MongoDB", "sqlite3": "SQLite", "aws-sdk": "AWS"}
+
+# Container images (without registry and tag) -> technology
+DOCKER_IMAGES = {
+    "python": "Python", "node": "Node", "golang": "Go", "rust": "Rust", "openjdk": "Java",
+    "eclipse-temurin": "Java", "php": "PHP", "ruby": "Ruby", "postgres": "PostgreSQL",
+    "mysql": "MySQL", "mariadb": "MySQL", "mongo": "MongoDB", "redis": "Redis",
+    "mssql/server": "SQL Server", "dotnet/aspnet": "ASP.NET", "dotnet/sdk": "C#",
+}
+
+# Files whose presence alone identifies a technology
+MARKERS = {
+    "tsconfig.json": "TypeScript", "angular.json": "Angular", "Jenkinsfile": "Jenkins",
+    ".gitlab-ci.yml": "GitLab", ".travis.yml": "Travis CI", "Chart.yaml": "Kubernetes",
+    "kustomization.yaml": "Kubernetes",
+}
+
+_QUOTED = re.compile(r"\"([^\"]*)\"|'([^']*)'")
+_REQUIREMENT = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_TOML_HEADER = re.compile(r"\[\[?\s*([^\]]+?)\s*\]\]?$")
+_TOML_KEY = re.compile(r"(\"[^\"]+\"|'[^']+'|[A-Za-z0-9_.-]+)\s*=\s*(.*)$")
+
+
+def normalize_name(name):
+    """Normalize a Python distribution name (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _lookup(names, table, prefixes=()):
+    found = set()
+    for name in names:
+        if name in table:
+            found.add(table[name])
+        for prefix, tech in prefixes:
+            if name.startswith(prefix):
+                found.add(tech)
+    return found
+
+
+def _quoted(text):
+    return [double or single for double, single in _QUOTED.findall(text)]
+
+
+def _requirement_names(specs):
+    names = []
+    for spec in specs:
+        match = _REQUIREMENT.match(spec)
+        if match:
+            names.append(normalize_name(match.group(1)))
+    return names
+
+
+def _python(names, version=""):
+    return {"Python"} | _lookup(names, PYTHON_PACKAGES, PYTHON_PREFIXES), [("Python", version)]
+
+
+def _strip_comment(line):
+    quote = None
+    for i, c in enumerate(line):
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in "\"'":
+            quote = c
+        elif c == "#":
+            return line[:i]
+    return line
+
+
+def _parse_toml(text):
+    """Return (dependency names, top-level string values) from a pyproject.toml, Pipfile or Cargo.toml.
+
+    Only the parts needed for detection are read: arrays of requirement strings
+    and the keys of dependency tables. Works without tomllib (Python < 3.11).
+    """
+    names, values = [], {}
+    section = ""
+    in_array = False
+    for raw in text.splitlines():
+        line = _strip_comment(raw).strip()
+        bare = _QUOTED.sub("", line)
+        if in_array:
+            names.extend(_requirement_names(_quoted(line)))
+            in_array = "]" not in bare
+            continue
+        header = _TOML_HEADER.match(line)
+        if header:
+            section = header.group(1)
+            # [dependencies.serde] style tables name the dependency in the header
+            if ".dependencies." in "." + section:
+                names.append(normalize_name(section.rsplit(".", 1)[-1].strip("\"'")))
+            continue
+        match = _TOML_KEY.match(line)
+        if not match:
+            continue
+        key, value = match.group(1).strip("\"'"), match.group(2).strip()
+        dependency_table = "dependencies" in section or section in ("packages", "dev-packages")
+        if value.startswith("[") and (dependency_table or key in ("dependencies", "requires")):
+            names.extend(_requirement_names(_quoted(value)))
+            in_array = "]" not in _QUOTED.sub("", value)
+        elif dependency_table and key != "python":
+            names.append(normalize_name(key))
+        elif value[:1] in ("\"", "'"):
+            quoted = _quoted(value)
+            if quoted:
+                values[key] = quoted[0]
+    return names, values
+
+
+def parse_requirements(text):
+    specs = []
+    for line in text.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if line and not line.startswith(("#", "-")):
+            specs.append(line)
+    return _python(_requirement_names(specs))
+
+
+def parse_pyproject(text):
+    names, values = _parse_toml(text)
+    return _python(names, values.get("requires-python") or values.get("python", ""))
+
+
+def parse_pipfile(text):
+    names, values = _parse_toml(text)
+    return _python(names, values.get("python_version", ""))
+
+
+def parse_setup_py(text):
+    match = re.search(r"python_requires\s*=\s*[\"']([^\"']+)", text)
+    return _python(_requirement_names(_quoted(text)), match.group(1) if match else "")
+
+
+def parse_setup_cfg(text):
+    specs = []
+    python_requires = ""
+    section = ""
+    collecting = False
+    for line in text.splitlines():
+        if line[:1] in (" ", "\t"):
+            # Continuation lines of a multi-line option
+            if collecting and line.strip() and not line.strip().startswith(("#", ";")):
+                specs.append(line.strip())
+            continue
+        line = line.strip()
+        if line.startswith("["):
+            section = line.strip("[]").strip()
+            collecting = False
+            continue
+        key, separator, value = line.partition("=")
+        key, value = key.strip(), value.strip()
+        if key == "python_requires":
+            python_requires = value
+        collecting = bool(separator) and (key in ("install_requires", "setup_requires", "tests_require") or section == "options.extras_require")
+        if collecting and value:
+            specs.append(value)
+    return _python(_requirement_names(specs), python_requires)
+
+
+def parse_python_version(text):
+    version = text.strip().splitlines()[0] if text.strip() else ""
+    return {"Python"}, [("Python", version)]
+
+
+def parse_package_json(text):
+    tech = {"JavaScript"}
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return tech | {"Node"}, [("Node.js", "")]
+    if not isinstance(data, dict):
+        data = {}
+    names = []
+    for key in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+        if isinstance(data.get(key), dict):
+            names.extend(data[key])
+    tech |= _lookup(names, NPM_PACKAGES, NPM_PREFIXES)
+    engines = data.get("engines") if isinstance(data.get("engines"), dict) else {}
+    node_version = engines.get("node") if isinstance(engines.get("node"), str) else ""
+    if node_version or "Express" in tech or not tech & FRONTEND:
+        tech.add("Node")
+    return tech, [("Node.js", node_version)]
+
+
+def parse_nvmrc(text):
+    version = text.strip().splitlines()[0] if text.strip() else ""
+    return {"JavaScript", "Node"}, [("Node.js", version)]
+
+
+def parse_go_mod(text):
+    tech = {"Go"}
+    match = re.search(r"^go\s+(\S+)", text, re.MULTILINE)
+    for module in re.findall(r"^\s*(?:require\s+)?([\w.-]+\.[a-z]+/\S+)\s+v", text, re.MULTILINE):
+        for prefix, found in GO_MODULES:
+            if module.startswith(prefix):
+                tech.add(found)
+    return tech, [("Go", match.group(1) if match else "")]
+
+
+def parse_cargo(text):
+    names, values = _parse_toml(text)
+    names = [name.replace("-", "_") for name in names] + names
+    return {"Rust"} | _lookup(names, CARGO_CRATES, CARGO_PREFIXES), [("Rust", values.get("rust-version", ""))]
+
+
+def _image_tech(image):
+    # Drop the tag or digest and a registry or library prefix
+    image = image.split("@", 1)[0]
+    name = image.rsplit(":", 1)[0] if ":" in image.rsplit("/", 1)[-1] else image
+    parts = name.lower().split("/")
+    if len(parts) > 1 and ("." in parts[0] or ":" in parts[0] or parts[0] == "localhost"):
+        parts = parts[1:]
+    if parts[:1] == ["library"]:
+        parts = parts[1:]
+    for key in ("/".join(parts[-2:]), parts[-1] if parts else ""):
+        if key in DOCKER_IMAGES:
+            return DOCKER_IMAGES[key]
+    return None
+
+
+def parse_dockerfile(text):
+    tech = {"Docker"}
+    for image in re.findall(r"^\s*FROM\s+(?:--\S+\s+)*(\S+)", text, re.MULTILINE | re.IGNORECASE):
+        found = _image_tech(image)
+        if found:
+            tech.add(found)
+    return tech, [("Docker", "")]
+
+
+def parse_compose(text):
+    tech = {"Docker"}
+    for image in re.findall(r"^\s*image:\s*[\"']?([^\s\"']+)", text, re.MULTILINE):
+        found = _image_tech(image)
+        if found:
+            tech.add(found)
+    return tech, [("Docker", "")]
+
+
+def _jvm(text, tech):
+    tech |= {found for artifact, found in JVM_ARTIFACTS if artifact in text}
+    return tech
+
+
+def parse_pom(text):
+    tech = _jvm(text, {"Java"})
+    if "kotlin-stdlib" in text or "kotlin-maven-plugin" in text:
+        tech.add("Kotlin")
+    match = re.search(r"<(?:java\.version|maven\.compiler\.release|maven\.compiler\.source)>\s*([^<\s]+)", text)
+    return tech, [("Java", match.group(1) if match else "")]
+
+
+def parse_gradle(text):
+    tech = _jvm(text, {"Java"})
+    if "org.jetbrains.kotlin" in text or re.search(r"kotlin\(\s*\"", text):
+        tech.add("Kotlin")
+    if "com.android.application" in text or "com.android.library" in text:
+        tech.add("Android")
+    match = re.search(r"(?:jvmToolchain\(|JavaLanguageVersion\.of\(|JavaVersion\.VERSION_)(\d+)", text)
+    return tech, [("Java", match.group(1) if match else "")]
+
+
+def parse_composer(text):
+    tech = {"PHP"}
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = {}
+    require = data.get("require") if isinstance(data, dict) and isinstance(data.get("require"), dict) else {}
+    if "laravel/framework" in require:
+        tech.add("Laravel")
+    version = require.get("php") if isinstance(require.get("php"), str) else ""
+    return tech, [("PHP", version)]
+
+
+def parse_gemfile(text):
+    gems = re.findall(r"^\s*gem\s+[\"']([^\"']+)", text, re.MULTILINE)
+    match = re.search(r"^\s*ruby\s+[\"']([^\"']+)", text, re.MULTILINE)
+    return {"Ruby"} | _lookup(gems, RUBY_GEMS), [("Ruby", match.group(1) if match else "")]
+
+
+def parse_csproj(text):
+    tech = {"C#"} | {found for package, found in DOTNET_PACKAGES if package in text}
+    if "Microsoft.NET.Sdk.Web" in text or "Microsoft.AspNetCore" in text:
+        tech.add("ASP.NET")
+    match = re.search(r"<TargetFrameworks?>\s*net(\d+\.\d+)", text)
+    return tech, [(".NET SDK", match.group(1) if match else "")]
+
+
+def parse_pubspec(text):
+    if re.search(r"^\s*flutter:", text, re.MULTILINE):
+        return {"Flutter"}, [("Flutter", "")]
+    return set(), []
+
+
+def parse_swift_package(text):
+    match = re.search(r"swift-tools-version\s*:\s*([\d.]+)", text)
+    return {"Swift"}, [("Swift", match.group(1) if match else "")]
+
+
+def parse_cmake(text):
+    match = re.search(r"cmake_minimum_required\s*\(\s*VERSION\s+([\d.]+)", text, re.IGNORECASE)
+    return {"C++"}, [("CMake", match.group(1) if match else "")]
+
+
+# Parser name -> function; see manifest_kind() for the files each one reads
+PARSERS = {
+    "requirements": parse_requirements, "pyproject.toml": parse_pyproject, "Pipfile": parse_pipfile,
+    "setup.py": parse_setup_py, "setup.cfg": parse_setup_cfg, ".python-version": parse_python_version,
+    "package.json": parse_package_json, ".nvmrc": parse_nvmrc, "go.mod": parse_go_mod,
+    "Cargo.toml": parse_cargo, "Dockerfile": parse_dockerfile, "compose": parse_compose,
+    "pom.xml": parse_pom, "build.gradle": parse_gradle, "composer.json": parse_composer,
+    "Gemfile": parse_gemfile, "csproj": parse_csproj, "pubspec.yaml": parse_pubspec,
+    "Package.swift": parse_swift_package, "CMakeLists.txt": parse_cmake,
+}
+FILE_KINDS = {name: name for name in PARSERS if name not in ("requirements", "compose", "csproj")}
+FILE_KINDS.update({
+    "Containerfile": "Dockerfile", "build.gradle.kts": "build.gradle",
+    "docker-compose.yml": "compose", "docker-compose.yaml": "compose",
+    "compose.yml": "compose", "compose.yaml": "compose",
+})
+
+
+def manifest_kind(directory, name):
+    """Return the parser name for a file, "marker:<technology>" for marker files, or None.
+
+    directory is the file's directory relative to the repository root, ending in '/' (or "").
+    """
+    if name in FILE_KINDS:
+        return FILE_KINDS[name]
+    if name in MARKERS:
+        return "marker:" + MARKERS[name]
+    if name.endswith(".txt") and (name.startswith("requirements") or directory.endswith("requirements/")):
+        return "requirements"
+    if name.startswith("Dockerfile.") or name.endswith(".Dockerfile") or name.endswith(".dockerfile"):
+        return "Dockerfile"
+    if name.endswith(".csproj"):
+        return "csproj"
+    if name.startswith("tailwind.config."):
+        return "marker:TailwindCSS"
+    if directory.endswith(".github/workflows/") and name.endswith((".yml", ".yaml")):
+        return "marker:GitHub"
+    if directory.endswith(".circleci/") and name == "config.yml":
+        return "marker:CircleCI"
+    return None
+
+
+def find_manifests(root, exclude=DEFAULT_EXCLUDE, workers=None):
+    """Return (relative path, kind) for every manifest under root, shallowest first"""
+    found = []
+    pending = [(scan_tree(root, 0, 0, exclude, workers), "")]
+    # Breadth first, so the repository's own top-level manifests come first
+    while pending:
+        next_pending = []
+        for node, rel in pending:
+            for name in node.files:
+                kind = manifest_kind(rel, name)
+                if kind:
+                    found.append((rel + name, kind))
+            next_pending.extend((child, rel + child.name + "/") for child in node.directories)
+        pending = next_pending
+    return found
+
+
+class ManifestCache:
+    """Parse results keyed by parser and file hash, optionally persisted as JSON"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.results = {}
+        self.changed = False
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict) and data.get("version") == DETECT_VERSION:
+                    self.results = data.get("results", {})
+            except (FileNotFoundError, ValueError):
+                pass
+
+    def get(self, key):
+        return self.results.get(key)
+
+    def put(self, key, result):
+        self.results[key] = result
+        self.changed = True
+
+    def save(self):
+        """Write the cache file; returns False when nothing was added"""
+        if not self.path or not self.changed:
+            return False
+        data = {"version": DETECT_VERSION, "results": self.results}
+        self.changed = False
+        return write_if_changed(self.path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def parse_manifest(path, kind, cache=None):
+    """Parse one manifest; returns ([technologies], [[tool, version]]) and whether it was cached"""
+    with open(path, "rb") as file:
+        content = file.read()
+    key = f"{kind}:{hashlib.sha256(content).hexdigest()}"
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result, True
+
+    tech, prerequisites = PARSERS[kind](content.decode("utf-8", errors="replace"))
+    result = [sorted(tech), [list(prerequisite) for prerequisite in prerequisites]]
+    if cache is not None:
+        cache.put(key, result)
+    return result, False
+
+
+def _parse_job(job):
+    path, kind, cache = job
+    try:
+        return parse_manifest(path, kind, cache)
+    except OSError:
+        return [[], []], False
+
+
+def detect(root, workers=None, cache=None, exclude=DEFAULT_EXCLUDE):
+    """Detect the technologies and prerequisites of the repository at root.
+
+    Technologies come back in TECH_CATEGORIES order; prerequisites in the order
+    they were found, one per tool, e.g. "Python >=3.9" or "Docker".
+    """
+    root = os.path.abspath(root)
+    manifests = find_manifests(root, exclude, workers)
+
+    tech = set()
+    if os.path.exists(os.path.join(root, ".git")):
+        tech.add("Git")
+    jobs = []
+    for rel, kind in manifests:
+        if kind.startswith("marker:"):
+            tech.add(kind[len("marker:"):])
+        else:
+            jobs.append((os.path.join(root, rel), kind, cache))
+
+    with ThreadPoolExecutor(workers) as pool:
+        results = list(pool.map(_parse_job, jobs))
+
+    versions = {}
+    cached = 0
+    for (found_tech, prerequisites), hit in results:
+        cached += hit
+        tech.update(found_tech)
+        for tool, version in prerequisites:
+            # The first version found for a tool wins, usually the top-level manifest's
+            if not versions.get(tool):
+                versions[tool] = version
+    ordered = [technology for technology in TECHNOLOGIES if technology in tech]
+    prerequisites = [f"{tool} {version}" if version else tool for tool, version in versions.items()]
+    return Detection(ordered, prerequisites, [rel for rel, _ in manifests], cached)
+
+
+def merge(existing, found):
+    """Append the found items that are not in existing yet.
+
+    Case is ignored, and "Python >=3.9" is not added next to an existing "Python".
+    """
+    seen = {item.lower() for item in existing if isinstance(item, str)}
+    merged = list(existing)
+    for item in found:
+        key = item.lower()
+        if key in seen or any(key.startswith(other + " ") for other in seen):
+            continue
+        merged.append(item)
+        seen.add(key)
+    return merged
@@ -0,0 +1,112 @@
+"""
+Tests for the linear scaling and search checks of bench.py.
+
+Run with `python -m unittest test_bench` (or pytest).
+"""
+
+import unittest
+from unittest import mock
+
+import bench
+from md_generator import MarkdownGenerator
+from project_library import ProjectLibrary
+
+
+def _largest_list(data):
+    return max(len(value) for value in data.values() if isinstance(value, list))
+
+
+class ScalingCheckTest(unittest.TestCase):
+
+    def test_growth_exponent(self):
+        sizes = [1, 2, 4, 8]
+        self.assertAlmostEqual(bench.growth_exponent(sizes, [3 * size for size in sizes]), 1.0)
+        self.assertAlmostEqual(bench.growth_exponent(sizes, [size * size for size in sizes]), 2.0)
+        # A single step, such as the allocator switching to mmap, is not growth
+        self.assertAlmostEqual(bench.growth_exponent(sizes, [1, 2, 40, 80]), 1.0)
+
+    def test_only_rendered_fields_are_scaled(self):
+        self.assertEqual(bench.rendered_fields("Standard"), list(bench.LIST_FIELDS))
+        self.assertEqual(bench.rendered_fields("Minimalist"), ["features"])
+        self.assertNotIn("Prerequisites", bench.rendered_fields("Corporate"))
+
+    def test_every_scaled_item_is_rendered(self):
+        # 8N items must produce about 8 times the output of N, or the case measures nothing
+        for template in MarkdownGenerator.TEMPLATES:
+            for field in bench.rendered_fields(template):
+                sizes = bench.scaling_sizes(field, 1000)
+                lengths = []
+                for count in (0, sizes[0], sizes[-1]):
+                    data = bench.make_project("tiny")
+                    data[field] = bench.list_items(field, count)
+                    lengths.append(len(bench.new_generator(data, template).generate_markdown()))
+                empty, small, large = lengths
+                with self.subTest(template=template, field=field):
+                    self.assertGreater(large - empty, 6 * (small - empty))
+
+    def test_check_scaling_covers_rendered_fields(self):
+        rows, failures = bench.check_scaling(["Corporate"], base_size=10, repeat=1, max_exponent=10)
+        self.assertEqual([row[0] for row in rows], [f"Corporate/{field}" for field in bench.rendered_fields("Corporate")])
+        self.assertEqual(failures, [])
+
+    def test_every_template_scales_linearly(self):
+        # From 500 to 4000 items a quadratic render takes 64 times as long instead of 8
+        rows, failures = bench.check_scaling(MarkdownGenerator.TEMPLATES, base_size=500, max_exponent=1.5)
+        if failures:
+            # A busy machine can slow down one size; a render that does not scale fails again
+            templates = sorted({failure.split("/")[0] for failure in failures})
+            rows, failures = bench.check_scaling(templates, base_size=500, max_exponent=1.5)
+        self.assertEqual(failures, [])
+
+    def test_check_scaling_flags_quadratic_time(self):
+        quadratic = lambda data, template, repeat: _largest_list(data) ** 2 * 1e-9
+        linear = lambda data, template: _largest_list(data) * 100
+        with mock.patch.object(bench, "best_time", quadratic), mock.patch.object(bench, "peak_memory", linear):
+            rows, failures = bench.check_scaling(["Minimalist"], base_size=10)
+        self.assertEqual(failures, ["Minimalist/features: time grows as N^2.00"])
+
+
+class SearchCheckTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = ProjectLibrary(":memory:")
+        bench.fill_library(cls.library, 1200)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.library.close()
+
+    def test_every_query_finds_projects(self):
+        # A query without hits would time nothing but the index lookup
+        rows, failures = bench.check_search(self.library, repeat=1, budget_ms=1e6)
+        self.assertEqual(failures, [])
+        for case, hits, median in rows:
+            with self.subTest(case=case):
+                self.assertGreater(hits, 0)
+
+    def test_check_search_flags_slow_queries(self):
+        rows, failures = bench.check_search(self.library, repeat=1, budget_ms=0)
+        self.assertEqual(len(failures), len(bench.SEARCH_QUERIES))
+
+    def test_limited_search_is_the_start_of_the_full_ranking(self):
+        queries = bench.SEARCH_QUERIES + (("worker", {}), ("redis worker", {"tech": "Docker"}), ("topic7 render", {}))
+        for text, filters in queries:
+            every = self.library.search(text, limit=0, **filters)
+            hits = self.library.search(text, limit=20, **filters)
+            with self.subTest(text=text, filters=filters):
+                self.assertEqual(hits, every[:20])
+                self.assertTrue(all("[" in hit.snippet for hit in hits))
+
+    def test_results_are_ranked_by_bm25(self):
+        # "worker" is only in the projects' own text, in too few of them to be ignored
+        ranked = [project_id for project_id, in self.library.connection.execute(
+            "SELECT rowid FROM project_text WHERE project_text MATCH 'worker' ORDER BY rank, rowid DESC"
+        )]
+        self.assertEqual([hit.id for hit in self.library.search("worker", limit=0)], ranked)
+        # "render" is in nearly every project, so it carries no weight and the newest come first
+        hits = [hit.id for hit in self.library.search("render", limit=0)]
+        self.assertEqual(hits, sorted(hits, reverse=True))
+
+if __name__ == "__main__":
+    unittest.main()
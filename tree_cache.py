@@ -0,0 +1,154 @@
+"""
+Incremental cache of directory scans for tree_scanner.
+
+A directory's mtime changes whenever an entry is added, removed or renamed in
+it, so a directory whose mtime is unchanged can reuse its stored listing
+without being read again. The listing is stored after .gitignore filtering,
+together with a key for the ignore rules that applied to it; ignore files are
+keyed by their own mtime and size, because editing one in place leaves the
+directory's mtime alone. The rendered text of the top levels of the tree is
+stored as well, so subtrees in which nothing changed are neither listed nor
+rendered again.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from file_output import write_if_changed
+from tree_scanner import DEFAULT_MAX_DEPTH, DEFAULT_MAX_ENTRIES, IgnoreRules, format_tree, list_directory, scan_tree
+
+# Bump to invalidate existing cache files
+CACHE_VERSION = 1
+
+# Rendered text is kept for the subtrees at this depth; the levels above are assembled from them
+BLOCK_DEPTH = 1
+
+# Directories modified this recently are not stored: a change within the same mtime tick would go unnoticed
+RACY_NS = 2 * 1000 ** 3
+
+
+def levels_key(levels):
+    """Identify a stack of ignore rules"""
+    return hashlib.blake2b("\0".join(rules.key for rules in levels).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _split(names):
+    return names.split("/") if names else []
+
+
+class TreeCache:
+    """Directory listings and rendered subtrees of one scanned root, persisted as JSON"""
+
+    def __init__(self, path):
+        self.path = path
+        self.root = None
+        # relative directory path -> [mtime_ns, rules key, has .gitignore, files, directories];
+        # names are joined with "/", which cannot occur in a file name and loads much faster than lists
+        self.entries = {}
+        # relative directory path -> [remaining depth, rendered text]
+        self.blocks = {}
+        self.reused = 0
+        self.listed = 0
+        self.changed = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.root = data.get("root")
+            self.entries = data.get("directories", {})
+            self.blocks = data.get("blocks", {})
+
+    def save(self):
+        """Write the cache file; returns False when it did not change"""
+        if not self.changed:
+            return False
+        data = {"version": CACHE_VERSION, "root": self.root, "directories": self.entries, "blocks": self.blocks}
+        return write_if_changed(self.path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    def list_directory(self, path, rel, levels):
+        """tree_scanner.list_directory, answered from the cache while the directory is unchanged"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], [], levels
+
+        cached = self.entries.get(rel)
+        if cached is not None and cached[0] == mtime:
+            child_levels = levels
+            if cached[2]:
+                child_levels = levels + (IgnoreRules.from_file(os.path.join(path, ".gitignore"), rel),)
+            if cached[1] == levels_key(child_levels):
+                self.visited[rel] = cached
+                self.fresh.add(rel)
+                return _split(cached[3]), _split(cached[4]), child_levels
+
+        files, directories, child_levels = list_directory(path, rel, levels)
+        self.missed.append(rel)
+        if self.started - mtime > RACY_NS:
+            has_ignore_file = len(child_levels) > len(levels)
+            self.visited[rel] = [mtime, levels_key(child_levels), has_ignore_file, "/".join(files), "/".join(directories)]
+        return files, directories, child_levels
+
+    def scan(self, root, max_depth=DEFAULT_MAX_DEPTH, max_entries=DEFAULT_MAX_ENTRIES, exclude=(), workers=None):
+        """Return the file_structure text for root, like tree_scanner.scan_directory"""
+        root = os.path.abspath(root)
+        if root != self.root:
+            self.root = root
+            self.entries, self.blocks = {}, {}
+        self.visited = {}
+        self.fresh = set()
+        self.missed = []
+        self.started = time.time_ns()
+
+        tree = scan_tree(root, max_depth, max_entries, exclude, workers, lister=self.list_directory)
+        self.reused = len(self.fresh)
+        self.listed = len(self.missed)
+
+        # A truncated tree depends on the whole walk, so its subtrees are not reused
+        truncated = bool(max_entries) and tree.count() >= max_entries
+        if not truncated:
+            self._reuse_blocks(tree, "", 0, max_depth)
+        text = format_tree(tree)
+        blocks = {}
+        if not truncated:
+            self._collect_blocks(tree, "", 0, max_depth, blocks)
+
+        # Directories that were not visited this time are dropped
+        self.changed = bool(self.missed) or self.visited.keys() != self.entries.keys() or blocks.keys() != self.blocks.keys()
+        self.entries = self.visited
+        self.blocks = blocks
+        return text
+
+    def _reuse_blocks(self, node, rel, depth, max_depth):
+        """Attach stored text to subtrees in which nothing changed; returns True if node's did not"""
+        if max_depth and depth >= max_depth:
+            # Not listed, shown without contents
+            return True
+        unchanged = rel in self.fresh
+        for child in node.directories:
+            unchanged = self._reuse_blocks(child, rel + child.name + "/", depth + 1, max_depth) and unchanged
+        if unchanged and depth == BLOCK_DEPTH:
+            stored = self.blocks.get(rel)
+            if stored is not None and stored[0] == (max_depth - depth if max_depth else 0):
+                node.block = stored[1]
+        return unchanged
+
+    def _collect_blocks(self, node, rel, depth, max_depth, blocks):
+        if (max_depth and depth >= max_depth) or rel not in self.visited or node.block is None:
+            return
+        if depth == BLOCK_DEPTH:
+            blocks[rel] = [max_depth - depth if max_depth else 0, node.block]
+            return
+        for child in node.directories:
+            self._collect_blocks(child, rel + child.name + "/", depth + 1, max_depth, blocks)
+
+    def format(self):
+        """Return a one-line summary of the last scan"""
+        return f"tree cache: {self.reused} directories reused, {self.listed} listed"
@@ -0,0 +1,326 @@
+"""
+Build the file_structure tree from a real directory.
+
+Directories are listed with os.scandir one level at a time, and the
+directories of a level are listed in parallel on a thread pool (scandir
+releases the GIL while it reads). Entries matched by .gitignore rules are
+dropped while their parent is listed, so ignored trees such as node_modules
+are never entered. The depth and entry limits also stop the walk before it
+lists anything that would not be shown.
+"""
+
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+BRANCH = "├── "
+LAST = "└── "
+PIPE = "│   "
+SPACE = "    "
+
+DEFAULT_MAX_DEPTH = 4
+DEFAULT_MAX_ENTRIES = 500
+
+# Never shown, whatever the ignore files say
+ALWAYS_IGNORED = frozenset((".git",))
+
+
+def _glob_to_regex(pattern):
+    """Translate a gitignore glob to a regular expression; '*' and '?' never match '/'"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            # '**' as a whole path component matches any number of directories
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/") and (i + 2 == n or pattern[i + 2] == "/"):
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                else:
+                    out.append("(?:.*/)?")
+                    i += 3
+                continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                inner = pattern[i + 1:j].replace("\\", "\\\\").replace("[", "\\[")
+                if inner[:1] in ("!", "^"):
+                    inner = "^" + inner[1:]
+                out.append(f"(?!/)[{inner}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_rule(line):
+    """Parse one ignore file line; returns (regex source, negate, dir_only, anchored) or None"""
+    line = line.rstrip("\r\n")
+    if not line or line.startswith("#"):
+        return None
+    # Trailing spaces are ignored unless escaped with a backslash
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but at the end anchors the pattern to the ignore file's directory;
+    # otherwise it matches the entry name at any depth
+    anchored = "/" in line
+    if line.startswith("/"):
+        line = line[1:]
+    return _glob_to_regex(line), negate, dir_only, anchored
+
+
+def _combine(rules):
+    if not rules:
+        return None
+    return re.compile("|".join(f"(?:{rule[0]})" for rule in rules), re.DOTALL)
+
+
+class IgnoreRules:
+    """The rules of one ignore file, matched against paths relative to its directory.
+
+    key identifies the rules for caches: the file's mtime and size, or a hash of
+    the patterns. The regular expressions are compiled on first use.
+    """
+
+    __slots__ = ("base", "key", "rules", "_compiled")
+
+    def __init__(self, lines, base="", key=None):
+        lines = list(lines)
+        self.base = base
+        self.key = key or hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=8).hexdigest()
+        self.rules = [rule for rule in map(parse_rule, lines) if rule]
+        self._compiled = None
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    @classmethod
+    def from_file(cls, path, base=""):
+        """Read an ignore file; a missing or unreadable file has no rules"""
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as file:
+                stat = os.fstat(file.fileno())
+                return cls(file.read().splitlines(), base, f"{base}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            return cls((), base, f"{base}:-")
+
+    def _compile(self):
+        rules = [(re.compile(source, re.DOTALL), negate, dir_only, anchored) for source, negate, dir_only, anchored in self.rules]
+        # One alternation per entry kind answers "does any rule match?" in a single call;
+        # names are matched by the unanchored rules and relative paths by the anchored ones
+        combined = {}
+        for is_dir in (False, True):
+            candidates = [rule for rule in self.rules if is_dir or not rule[2]]
+            combined[is_dir] = (
+                _combine([rule for rule in candidates if not rule[3]]),
+                _combine([rule for rule in candidates if rule[3]]),
+            )
+        self._compiled = rules, combined
+        return self._compiled
+
+    def match(self, name, path, is_dir):
+        """Return True if ignored, False if re-included by a negation, None if no rule matched"""
+        rules, combined = self._compiled or self._compile()
+        by_name, by_path = combined[is_dir]
+        if (by_name is None or by_name.fullmatch(name) is None) and (by_path is None or by_path.fullmatch(path) is None):
+            return None
+        # The last matching rule wins
+        for regex, negate, dir_only, anchored in reversed(rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(path if anchored else name):
+                return not negate
+        return None
+
+
+def is_ignored(levels, name, path, is_dir):
+    """Check an entry against ignore files from the outermost to the innermost directory.
+
+    path is relative to the scanned root; rules in deeper directories take precedence.
+    """
+    if name in ALWAYS_IGNORED:
+        return True
+    for rules in reversed(levels):
+        result = rules.match(name, path[len(rules.base):], is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def list_directory(path, rel, levels):
+    """List one directory; returns (files, directories, ignore levels for its children).
+
+    rel is the directory's path relative to the scanned root, ending in '/' (or "").
+    Symbolic links are listed as files and never followed.
+    """
+    try:
+        with os.scandir(path) as iterator:
+            entries = []
+            for entry in iterator:
+                try:
+                    entries.append((entry.name, entry.is_dir(follow_symlinks=False)))
+                except OSError:
+                    entries.append((entry.name, False))
+    except OSError:
+        return [], [], levels
+
+    # Kept even without rules, so caches can tell the directory has an ignore file
+    if (".gitignore", False) in entries:
+        levels = levels + (IgnoreRules.from_file(os.path.join(path, ".gitignore"), rel),)
+
+    files, directories = [], []
+    for name, is_dir in entries:
+        if not is_ignored(levels, name, rel + name, is_dir):
+            (directories if is_dir else files).append(name)
+    return files, directories, levels
+
+
+class TreeNode:
+    """A scanned directory: sorted subdirectories and file names"""
+
+    __slots__ = ("name", "directories", "files", "omitted", "block")
+
+    def __init__(self, name):
+        self.name = name
+        self.directories = []
+        self.files = []
+        # Entries left out because of the entry limit
+        self.omitted = 0
+        # Rendered lines below this directory, see node_block()
+        self.block = None
+
+    def count(self):
+        """Number of entries below this directory"""
+        return len(self.files) + sum(1 + child.count() for child in self.directories)
+
+
+def _sorted(names):
+    # Case-insensitive, ties broken by the exact name (two C-level sorts, no Python key)
+    names.sort()
+    names.sort(key=str.lower)
+    return names
+
+
+def root_levels(root, exclude=()):
+    """Ignore rules that apply to the whole tree, lowest precedence first"""
+    levels = (
+        IgnoreRules(exclude),
+        IgnoreRules.from_file(os.path.join(root, ".git", "info", "exclude")),
+    )
+    return tuple(rules for rules in levels if rules)
+
+
+def scan_tree(root, max_depth=DEFAULT_MAX_DEPTH, max_entries=DEFAULT_MAX_ENTRIES, exclude=(), workers=None, lister=list_directory):
+    """Scan root breadth first and return its TreeNode.
+
+    max_depth limits how many levels are listed and max_entries how many entries
+    are kept in total (None or 0 for no limit); exclude holds extra gitignore
+    patterns. Shallow entries are kept first, so a truncated tree still shows
+    the top of the project.
+    """
+    root = os.path.abspath(root)
+    top = TreeNode(os.path.basename(root.rstrip(os.sep)) or root)
+    budget = max_entries or float("inf")
+    pending = [(top, root, "", root_levels(root, exclude))]
+    depth = 0
+
+    with ThreadPoolExecutor(workers) as pool:
+        while pending and budget > 0 and (not max_depth or depth < max_depth):
+            jobs = [(path, rel, levels) for _, path, rel, levels in pending]
+            if len(jobs) == 1:
+                listings = [lister(*jobs[0])]
+            else:
+                listings = pool.map(lambda job: lister(*job), jobs)
+
+            next_pending = []
+            for (node, path, rel, _), (files, directories, levels) in zip(pending, listings):
+                if budget <= 0:
+                    # Shown without contents, like directories at the depth limit
+                    continue
+                directories = _sorted(directories)
+                files = _sorted(files)
+                total = len(directories) + len(files)
+                if total > budget:
+                    budget = int(budget)
+                    directories = directories[:budget]
+                    files = files[:budget - len(directories)]
+                node.omitted = total - len(directories) - len(files)
+                node.files = files
+                budget -= len(directories) + len(files)
+                for name in directories:
+                    child = TreeNode(name)
+                    node.directories.append(child)
+                    next_pending.append((child, os.path.join(path, name), rel + name + "/", levels))
+            pending = next_pending
+            depth += 1
+    return top
+
+
+def format_tree(node, root_name=None):
+    """Render a TreeNode in the file_structure format"""
+    block = node_block(node)
+    return f"{root_name or node.name}/" + ("\n" + block if block else "")
+
+
+def node_block(node):
+    """Return the lines below a directory as one string, kept on the node for reuse"""
+    if node.block is not None:
+        return node.block
+    labels = [child.name + "/" for child in node.directories] + node.files
+    if node.omitted:
+        labels.append(f"... ({node.omitted} more)")
+
+    parts = []
+    last = len(labels) - 1
+    for i, child in enumerate(node.directories):
+        parts.append((LAST if i == last else BRANCH) + labels[i])
+        block = node_block(child)
+        if block:
+            # Indent the whole subtree at once rather than line by line
+            indent = SPACE if i == last else PIPE
+            parts.append(indent + block.replace("\n", "\n" + indent))
+    rest = labels[len(node.directories):]
+    if len(rest) > 1:
+        parts.append(BRANCH + ("\n" + BRANCH).join(rest[:-1]))
+    if rest:
+        parts.append(LAST + rest[-1])
+    node.block = "\n".join(parts)
+    return node.block
+
+
+def scan_directory(root, max_depth=DEFAULT_MAX_DEPTH, max_entries=DEFAULT_MAX_ENTRIES, exclude=(), workers=None, cache=None):
+    """Return the file_structure text for a directory; cache is an optional tree_cache.TreeCache"""
+    if cache is not None:
+        return cache.scan(root, max_depth, max_entries, exclude, workers)
+    return format_tree(scan_tree(root, max_depth, max_entries, exclude, workers))
@@ -1,45 +1,20 @@
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 import os
 
+from tech_catalog import TECH_CATEGORIES
+from tree_scanner import scan_directory
+
 # Import required libraries, install if needed
 try:
     from customtkinter import CTkFrame, CTkButton, CTkEntry, CTkLabel, CTkTextbox, CTkScrollableFrame
-    from customtkinter import CTkComboBox, CTkSwitch, CTkOptionMenu
+    from customtkinter import CTkComboBox, CTkSwitch, CTkOptionMenu, CTkToplevel
 except ImportError:
     import subprocess
     import sys
     subprocess.check_call([sys.executable, "-m", "pip", "install", "customtkinter"])
     from customtkinter import CTkFrame, CTkButton, CTkEntry, CTkLabel, CTkTextbox, CTkScrollableFrame
-    from customtkinter import CTkComboBox, CTkSwitch, CTkOptionMenu
-
-
-# Technology categories and options for the selector
-TECH_CATEGORIES = {
-    "Languages": [
-        "Python", "JavaScript", "TypeScript", "Java", "C#", "C++", 
-        "Go", "Rust", "PHP", "Ruby", "Swift", "Kotlin"
-    ],
-    "Frontend": [
-        "React", "Vue", "Angular", "HTML", "CSS", "Sass", 
-        "TailwindCSS", "Bootstrap", "Material-UI", "Chakra-UI"
-    ],
-    "Backend": [
-        "Node", "Django", "Flask", "Express", "FastAPI", "Spring Boot",
-        "ASP.NET", "Laravel"
-    ],
-    "Database": [
-        "MongoDB", "MySQL", "PostgreSQL", "Redis", "SQLite", "Oracle",
-        "SQL Server", "Firestore"
-    ],
-    "DevOps": [
-        "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "GitHub", "GitLab",
-        "Jenkins", "Travis CI", "CircleCI"
-    ],
-    "Mobile": [
-        "React Native", "Flutter", "Android", "iOS", "Xamarin", "Ionic"
-    ]
-}
+    from customtkinter import CTkComboBox, CTkSwitch, CTkOptionMenu, CTkToplevel
 
 
 class TemplateSelector(CTkFrame):
@@ -231,6 +206,14 @@ class FileStructureEditor(CTkFrame):
             height=30
         ).pack(side="left", padx=5)
         
+        CTkButton(
+            templates_frame,
+            text="Scan Directory...",
+            command=self.load_directory,
+            width=120,
+            height=30
+        ).pack(side="left", padx=5)
+        
         CTkButton(
             templates_frame,
             text="Clear",
@@ -246,6 +229,22 @@ class FileStructureEditor(CTkFrame):
         content = self.content_text.get("0.0", "end").strip()
         self.callback(content)
     
+    def load_directory(self):
+        """Generate the file structure from a directory, honouring its .gitignore files"""
+        directory = filedialog.askdirectory(title="Select Project Directory")
+        if not directory:
+            return
+        
+        try:
+            content = scan_directory(directory)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to scan directory: {str(e)}")
+            return
+        
+        self.content_text.delete("0.0", "end")
+        self.content_text.insert("0.0", content)
+        self.callback(content)
+    
     def load_template(self, template_type):
         """Load a predefined template"""
         templates = {
@@ -1138,4 +1137,149 @@ class EnvVarsManager(CTkFrame):
         self.name_var.set("")
         self.desc_var.set("")
         self.value_var.set("")
-        self.populate_list() 
\ No newline at end of file
+        self.populate_list() 
+
+
+class LibraryBrowser(CTkToplevel):
+    """A window for filtering and searching the project library and opening a project from it"""
+    
+    # Rows shown at once; the count label tells how many match in total
+    MAX_ROWS = 500
+    
+    def __init__(self, master, library, on_open, templates=()):
+        super().__init__(master)
+        self.library = library
+        self.on_open = on_open
+        self.templates = list(templates)
+        self.names = []
+        self.pending = None
+        
+        self.title("Project Library")
+        self.geometry("820x560")
+        
+        self.create_widgets()
+        self.refresh()
+        
+    def create_widgets(self):
+        # Filters
+        filter_frame = CTkFrame(self)
+        filter_frame.pack(fill="x", padx=10, pady=10)
+        
+        self.name_var = tk.StringVar()
+        self.username_var = tk.StringVar()
+        self.tech_var = tk.StringVar()
+        self.template_var = tk.StringVar(value="Any template")
+        self.text_var = tk.StringVar()
+        
+        for label, variable, width in (("Name:", self.name_var, 180), ("User:", self.username_var, 120), ("Tech:", self.tech_var, 100)):
+            CTkLabel(filter_frame, text=label).pack(side="left", padx=(5, 2))
+            entry = CTkEntry(filter_frame, textvariable=variable, width=width)
+            entry.pack(side="left", padx=(0, 5))
+            entry.bind("<KeyRelease>", lambda e: self.schedule_refresh())
+        
+        CTkOptionMenu(
+            filter_frame,
+            values=["Any template"] + self.templates,
+            variable=self.template_var,
+            command=lambda choice: self.refresh(),
+            width=130
+        ).pack(side="left", padx=5)
+        
+        # Full-text search of the overview, features, prerequisites, usage and file structure
+        search_frame = CTkFrame(self, fg_color="transparent")
+        search_frame.pack(fill="x", padx=10)
+        
+        CTkLabel(search_frame, text="Text:").pack(side="left", padx=(5, 2))
+        entry = CTkEntry(search_frame, textvariable=self.text_var, placeholder_text="words in the project text, e.g. redis deploy*")
+        entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        entry.bind("<KeyRelease>", lambda e: self.schedule_refresh())
+        
+        # Results; a plain Listbox stays fast with hundreds of rows
+        self.listbox = tk.Listbox(self, activestyle="none", font=("Consolas", 11))
+        self.listbox.pack(fill="both", expand=True, padx=10, pady=5)
+        self.listbox.bind("<Double-Button-1>", lambda e: self.open_selected())
+        self.listbox.bind("<Return>", lambda e: self.open_selected())
+        
+        # Buttons
+        button_frame = CTkFrame(self, fg_color="transparent")
+        button_frame.pack(fill="x", padx=10, pady=10)
+        
+        self.count_var = tk.StringVar()
+        CTkLabel(button_frame, textvariable=self.count_var).pack(side="left", padx=5)
+        
+        CTkButton(button_frame, text="Open", command=self.open_selected, width=100).pack(side="right", padx=5)
+        CTkButton(
+            button_frame,
+            text="Delete",
+            command=self.delete_selected,
+            width=100,
+            fg_color="#e74c3c",
+            hover_color="#c0392b"
+        ).pack(side="right", padx=5)
+        
+    def filters(self):
+        """The current filter values, as keyword arguments for ProjectLibrary.list()"""
+        template = self.template_var.get()
+        return {
+            "name": self.name_var.get().strip(),
+            "username": self.username_var.get().strip(),
+            "tech": self.tech_var.get().strip() or None,
+            "template": template if template in self.templates else None
+        }
+    
+    def schedule_refresh(self):
+        """Refresh once typing pauses rather than on every key"""
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+        self.pending = self.after(150, self.refresh)
+    
+    def refresh(self):
+        """Query the library with the current filters and search text"""
+        self.pending = None
+        filters = self.filters()
+        text = self.text_var.get().strip()
+        if text:
+            self.refresh_search(text, filters)
+            return
+        rows = self.library.list(limit=self.MAX_ROWS, **filters)
+        self.names = [row.name for row in rows]
+        
+        self.listbox.delete(0, "end")
+        for row in rows:
+            self.listbox.insert("end", f"{row.name:<28} {row.project_name:<28} {row.username:<16} {row.template}")
+        
+        total = self.library.count(**filters) if len(rows) == self.MAX_ROWS else len(rows)
+        self.count_var.set(f"{total} projects" + (f", first {self.MAX_ROWS} shown" if total > len(rows) else ""))
+    
+    def refresh_search(self, text, filters):
+        """Show the projects whose text matches, best first, with the matching passage"""
+        hits = self.library.search(text, limit=self.MAX_ROWS, **filters)
+        self.names = [hit.name for hit in hits]
+        
+        self.listbox.delete(0, "end")
+        for hit in hits:
+            self.listbox.insert("end", f"{hit.name:<28} {' '.join(hit.snippet.split())}")
+        
+        more = f", first {self.MAX_ROWS} shown" if len(hits) == self.MAX_ROWS else ""
+        self.count_var.set(f"{len(hits)} projects match{more}")
+    
+    def selected_name(self):
+        selection = self.listbox.curselection()
+        return self.names[selection[0]] if selection else None
+    
+    def open_selected(self):
+        """Open the selected project and close the window"""
+        name = self.selected_name()
+        if name is None:
+            return
+        self.on_open(name)
+        self.destroy()
+    
+    def delete_selected(self):
+        """Remove the selected project from the library after confirmation"""
+        name = self.selected_name()
+        if name is None:
+            return
+        if messagebox.askyesno("Delete Project", f"Remove {name} from the library?", parent=self):
+            self.library.delete(name)
+            self.refresh()
@@ -0,0 +1,275 @@
+"""
+Watch project JSON files and regenerate their README files as they change.
+
+The watcher keeps an index of every project file by mtime and size and only
+re-renders files whose entry changed. Each project keeps its own
+MarkdownGenerator, so an edit to one field only re-renders the sections that
+read it. Changes are found by polling, or on Linux through inotify, which
+avoids stat-ing every file on every tick.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import time
+from collections import OrderedDict
+
+from batch import RenderResult, claim_outputs, glob_root, input_roots
+from file_output import write_if_changed
+from md_generator import MarkdownGenerator
+from project_model import ProjectData
+
+# inotify event flags (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+class PollingBackend:
+    """Reports every indexed file as a candidate on each tick"""
+
+    name = "poll"
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+
+    def add_directory(self, directory):
+        pass
+
+    def wait(self):
+        """Sleep for one interval; None means 'rescan everything'"""
+        time.sleep(self.interval)
+        return None
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """Linux inotify through ctypes; reports only the paths that had events"""
+
+    name = "inotify"
+
+    def __init__(self, interval=0.5):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.interval = interval
+        self.directories = {}
+        self.watched = set()
+
+    def add_directory(self, directory):
+        if directory in self.watched:
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+        self.directories[wd] = directory
+        self.watched.add(directory)
+
+    def wait(self):
+        """Block until events arrive; returns the set of changed paths, or None to rescan"""
+        readable, _, _ = select.select([self.fd], [], [], self.interval)
+        if not readable:
+            return set()
+
+        # Let a burst of events from one save settle before reading them
+        time.sleep(0.02)
+        paths = set()
+        rescan = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    rescan = True
+                    continue
+                directory = self.directories.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_DELETE_SELF:
+                    self.watched.discard(self.directories.pop(wd))
+                    rescan = True
+                elif mask & IN_ISDIR:
+                    # A new directory may hold matching files and needs its own watch
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        rescan = True
+                elif name.endswith(b".json"):
+                    paths.add(os.path.join(directory, os.fsdecode(name)))
+        return None if rescan else paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_backend(name="auto", interval=0.5):
+    """Return an inotify backend where available (for 'auto'), otherwise polling"""
+    if name == "poll":
+        return PollingBackend(interval)
+    try:
+        return InotifyBackend(interval)
+    except (OSError, AttributeError):
+        if name == "inotify":
+            raise
+        return PollingBackend(interval)
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ProjectWatcher:
+    """Keeps project files indexed by (mtime, size) and re-renders the ones that change"""
+
+    def __init__(self, sources, output_dir=None, template=None, recursive=False, keep=256):
+        self.sources = sources
+        self.output_dir = output_dir
+        self.template = template
+        self.recursive = recursive
+        self.index = {}
+        # Project file -> its README, and the error of those whose README another file claimed first
+        self.outputs = {}
+        self.conflicts = {}
+        # Generators of recently changed projects, kept so unchanged sections are reused
+        self.generators = OrderedDict()
+        self.keep = keep
+        # Fields missing from a project file fall back to the defaults, as in a fresh render
+        self.defaults = ProjectData().to_dict()
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def directories(self):
+        """Directories that can contain watched files"""
+        found = {os.path.dirname(os.path.abspath(path)) for path in self.index}
+        for source in self.sources:
+            if os.path.isdir(source):
+                root, walk = source, self.recursive
+            else:
+                # A file or glob pattern whose files may appear where there are none yet,
+                # in any directory below the root when the pattern has wildcards in its directories
+                directory = os.path.dirname(source) or "."
+                root = glob_root(directory)
+                walk = root != directory
+                while not os.path.isdir(root):
+                    # Creating the directory below it triggers a rescan, which watches the directory
+                    root, walk = os.path.dirname(os.path.abspath(root)), False
+            found.add(os.path.abspath(root))
+            if walk:
+                for parent, dirs, _ in os.walk(root):
+                    found.update(os.path.abspath(os.path.join(parent, name)) for name in dirs)
+        return found
+
+    def rescan(self):
+        """Re-collect the inputs; returns the paths that are new or changed"""
+        roots = input_roots(self.sources, recursive=self.recursive)
+        roots = {os.path.abspath(path): os.path.abspath(root) for path, root in roots.items()}
+        paths = sorted(roots)
+        # As in render, two files are never written to the same README: the first keeps it
+        self.outputs, self.conflicts = claim_outputs(paths, self.output_dir, roots)
+        current = set(paths)
+        for path in list(self.index):
+            if path not in current:
+                del self.index[path]
+                self.generators.pop(path, None)
+        return self.check(paths)
+
+    def check(self, paths):
+        """Compare the given paths with the index; returns those that are new or changed"""
+        changed = []
+        for path in paths:
+            signature = _signature(path)
+            if signature is None:
+                if self.index.pop(path, None) is not None:
+                    self.generators.pop(path, None)
+                continue
+            if self.index.get(path) != signature:
+                self.index[path] = signature
+                changed.append(path)
+        return changed
+
+    def render(self, path):
+        """Re-render one project file; errors are reported in the result"""
+        output = self.outputs[path]
+        start = time.perf_counter()
+        if path in self.conflicts:
+            return RenderResult(path, output, 0.0, 0, self.conflicts[path])
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if not isinstance(data, dict):
+                raise ValueError("project file must contain a JSON object")
+
+            fields = dict(self.defaults, **data)
+            if self.template:
+                fields["template"] = self.template
+
+            # Only the fields that differ from the last render bump their section versions
+            generator = self.generators.pop(path, None) or MarkdownGenerator()
+            generator.set_data(fields)
+            self.generators[path] = generator
+            if len(self.generators) > self.keep:
+                self.generators.popitem(last=False)
+
+            markdown_content = generator.generate_markdown()
+            if self.output_dir:
+                # Subdirectories mirror those of the inputs
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+            written = write_if_changed(output, markdown_content)
+            return RenderResult(path, output, time.perf_counter() - start, len(markdown_content), None, written=written)
+        except Exception as e:
+            return RenderResult(path, output, time.perf_counter() - start, 0, f"{type(e).__name__}: {e}")
+
+    def run(self, backend, on_result=None, initial=True, stop=None):
+        """Watch until stop() returns True (or forever); on_result receives every RenderResult"""
+        changed = self.rescan()
+        if not initial:
+            changed = []
+        for directory in self.directories():
+            backend.add_directory(directory)
+
+        while True:
+            for path in changed:
+                result = self.render(path)
+                if on_result:
+                    on_result(result)
+            if stop and stop():
+                return
+
+            candidates = backend.wait()
+            if candidates is None:
+                changed = self.rescan()
+                for directory in self.directories():
+                    backend.add_directory(directory)
+            else:
+                # Only files that are already indexed or match the inputs are rendered
+                known = [path for path in candidates if path in self.index]
+                unknown = [path for path in candidates if path not in self.index]
+                changed = self.check(known)
+                if unknown:
+                    changed += [path for path in self.rescan() if path not in changed]